@@ -0,0 +1,138 @@
+"""Generates ``async_api_segments/*_api.py`` from ``api_segments/*_api.py``.
+
+The sync segments are the single source of the request-building code; their
+async counterparts differ only in ``async``/``await`` and in the async twins of
+the helpers they call, so they are derived mechanically instead of being edited
+by hand. Run after changing a sync segment:
+
+    python scripts/generate_async_segments.py
+
+``tests/test_api_segments.py`` fails while the async segments are out of date.
+"""
+
+import re
+import sys
+from pathlib import Path
+
+PACKAGE = Path(__file__).resolve().parent.parent / "src" / "universal_mcp_twitter"
+
+HEADER = "# Generated from api_segments/{name} by scripts/generate_async_segments.py.\n"
+
+# Sync helpers imported by the segments and the async twins replacing them.
+_ASYNC_IMPORTS = {
+    "batched_lookup": "abatched_lookup",
+    "sharded_pages": "asharded_pages",
+    "plan_shards": "aplan_shards",
+    "reconcile_rules": "areconcile_rules",
+    "packed_pages": "apacked_pages",
+}
+
+# ``yield from helper(...)`` lines that become ``async for`` loops.
+_YIELD_FROM = re.compile(
+    r"^(\s*)yield from "
+    r"(self\._stream|sharded_pages|packed_pages|batched_lookup)\((.*)\)$"
+)
+_ASYNC_ITERATORS = {
+    "self._stream": ("message", "self._stream"),
+    "sharded_pages": ("page", "asharded_pages"),
+    "packed_pages": ("page", "apacked_pages"),
+    "batched_lookup": ("page", "abatched_lookup"),
+}
+
+_SUBSTITUTIONS = [
+    (re.compile(r"^    def (?!__init__|list_tools)"), "    async def "),
+    (re.compile(r"^(\s+)def fetch\("), r"\1async def fetch("),
+    (re.compile(r"= self\._(get|post|put|patch|delete)\("), r"= await self._\1("),
+    (re.compile(r"= self\._(resolve_user_ids?|lookup_stored)\("), r"= await self._\1("),
+    (re.compile(r"= plan_shards\("), "= await aplan_shards("),
+    (re.compile(r"return reconcile_rules\("), "return await areconcile_rules("),
+    (re.compile(r"^(\s+)return self\.(find_\w+)\("), r"\1return await self.\2("),
+]
+
+
+def _collect(line: str) -> str | None:
+    # Rewrites ``return [ExpandedResponse(]merge_responses(<iterator>)[)]`` and
+    # ``return index_lookup_responses(batched_lookup(...), key=...)`` to collect
+    # the pages of the async iterator into a list first.
+    wrapped = re.match(
+        r"^(\s*)return ExpandedResponse\((merge_responses\(.*\))\)$", line
+    )
+    merged = f"{wrapped.group(1)}return {wrapped.group(2)}" if wrapped else line
+    m = re.match(r"^(\s*)return merge_responses\(batched_lookup\((.*)\)\)$", merged)
+    if m:
+        pages = f"[page async for page in abatched_lookup({m.group(2)})]"
+    elif m := re.match(
+        r"^(\s*)return merge_responses\((self\.iter_\w+\(.*\))\)$", merged
+    ):
+        pages = f"[page async for page in {m.group(2)}]"
+    elif m := re.match(
+        r"^(\s*)return index_lookup_responses\(batched_lookup\((.*)\), (key=.*)\)$",
+        line,
+    ):
+        lookup = f"[page async for page in abatched_lookup({m.group(2)})]"
+        return f"{m.group(1)}return index_lookup_responses({lookup}, {m.group(3)})"
+    else:
+        return None
+    merged = f"merge_responses({pages})"
+    return f"{m.group(1)}return " + (
+        f"ExpandedResponse({merged})" if wrapped else merged
+    )
+
+
+def _method(block: str) -> str:
+    out = []
+    for line in block.split("\n"):
+        if m := _YIELD_FROM.match(line):
+            indent, helper, arguments = m.groups()
+            name, iterator = _ASYNC_ITERATORS[helper]
+            out.append(f"{indent}async for {name} in {iterator}({arguments}):")
+            out.append(f"{indent}    yield {name}")
+            continue
+        if (collected := _collect(line)) is not None:
+            out.append(collected)
+            continue
+        converted = line.replace("-> Iterator[", "-> AsyncIterator[")
+        for pattern, replacement in _SUBSTITUTIONS:
+            converted = pattern.sub(replacement, converted)
+        out.append(converted)
+    text = "\n".join(out)
+    if "yield from" in text or re.search(r"(?<!a)batched_lookup\(", text):
+        raise ValueError(f"Cannot convert to async:\n{text[:200]}")
+    return text
+
+
+def _sort_names(m: re.Match) -> str:
+    names = sorted(m.group(2).split(", "), key=lambda name: (not name.isupper(), name))
+    return m.group(1) + ", ".join(names)
+
+
+def render(name: str, source: str) -> str:
+    """Returns the async segment module generated from the sync module ``source``."""
+    head, separator, body = source.partition("\nclass ")
+    class_line, _, rest = body.partition("\n")
+    class_line = f"Async{class_line.split('(')[0]}(AsyncAPISegmentBase):"
+    head = head.replace(
+        "from .api_segment_base import APISegmentBase",
+        "from .async_api_segment_base import AsyncAPISegmentBase",
+    )
+    head = head.replace(
+        "from collections.abc import Iterator",
+        "from collections.abc import AsyncIterator",
+    )
+    for sync, async_ in _ASYNC_IMPORTS.items():
+        head = re.sub(rf"(?m) {sync}(,|$)", rf" {async_}\1", head)
+    head = re.sub(r"(?m)^(from \.\.\w+ import )(.+)$", _sort_names, head)
+    methods = re.split(r"(?=\n    def )", rest)
+    body = methods[0] + "".join(_method(method) for method in methods[1:])
+    return HEADER.format(name=name) + head + separator + class_line + "\n" + body
+
+
+def main() -> None:
+    for path in sorted((PACKAGE / "api_segments").glob("*_api.py")):
+        target = PACKAGE / "async_api_segments" / path.name
+        target.write_text(render(path.name, path.read_text()))
+        sys.stdout.write(f"{target.relative_to(PACKAGE.parent.parent)}\n")
+
+
+if __name__ == "__main__":
+    main()
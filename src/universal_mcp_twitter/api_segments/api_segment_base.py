@@ -1,21 +1,228 @@
-
+import json
+import time
+from collections.abc import Callable, Iterator
+from contextlib import closing
+from http import HTTPStatus
 from typing import Any
 
+import httpx
+
+from ..batching import iter_ids, normalize_username
+from ..endpoints import endpoint_template
+from ..user_index import UserIndex, is_user_id
+
+
 class APISegmentBase:
     def __init__(self, main_app_client: Any):
         self.main_app_client = main_app_client
 
     def _get(self, url: str, params: dict = None, **kwargs):
-        return self.main_app_client._get(url, params=params, **kwargs)
+        cache = self.main_app_client.response_cache
+        if cache is not None and (cached := cache.get(url, params)) is not None:
+            return cached
+        response = self._request(
+            "GET", url, lambda: self.main_app_client._get(url, params=params, **kwargs)
+        )
+        if cache is not None:
+            cache.put(url, params, response)
+        self._observe(url, params, response)
+        return response
 
-    def _post(self, url: str, data: Any = None, files: Any = None, params: dict = None, content_type: str = None, **kwargs):
-        return self.main_app_client._post(url, data=data, files=files, params=params, content_type=content_type, **kwargs)
+    def _post(
+        self,
+        url: str,
+        data: Any = None,
+        files: Any = None,
+        params: dict = None,
+        content_type: str = None,
+        **kwargs,
+    ):
+        return self._write(
+            "POST",
+            url,
+            lambda: self.main_app_client._post(
+                url,
+                data=data,
+                files=files,
+                params=params,
+                content_type=content_type,
+                **kwargs,
+            ),
+        )
 
-    def _put(self, url: str, data: Any = None, files: Any = None, params: dict = None, content_type: str = None, **kwargs):
-        return self.main_app_client._put(url, data=data, files=files, params=params, content_type=content_type, **kwargs)
+    def _put(
+        self,
+        url: str,
+        data: Any = None,
+        files: Any = None,
+        params: dict = None,
+        content_type: str = None,
+        **kwargs,
+    ):
+        return self._write(
+            "PUT",
+            url,
+            lambda: self.main_app_client._put(
+                url,
+                data=data,
+                files=files,
+                params=params,
+                content_type=content_type,
+                **kwargs,
+            ),
+        )
 
     def _patch(self, url: str, data: Any = None, params: dict = None, **kwargs):
-        return self.main_app_client._patch(url, data=data, params=params, **kwargs)
+        return self._write(
+            "PATCH",
+            url,
+            lambda: self.main_app_client._patch(
+                url, data=data, params=params, **kwargs
+            ),
+        )
 
     def _delete(self, url: str, params: dict = None, **kwargs):
-        return self.main_app_client._delete(url, params=params, **kwargs)
+        return self._write(
+            "DELETE",
+            url,
+            lambda: self.main_app_client._delete(url, params=params, **kwargs),
+        )
+
+    def _write(self, method: str, url: str, send: Callable[[], Any]):
+        """Sends a write request and evicts cached responses for what it touched."""
+        response = self._request(method, url, send)
+        cache = self.main_app_client.response_cache
+        if cache is not None:
+            cache.invalidate(url)
+        return response
+
+    def _observe(self, url: str, params: dict, response: Any) -> None:
+        """Feeds a GET response to the app's user index and hydration store, if any.
+
+        The body is only decoded if one of them wants it, and then only once for both.
+        """
+        index = self.main_app_client.user_index
+        if index is not None and not index.observes(response):
+            index = None
+        store = self.main_app_client.hydration_store
+        if store is not None and not store.observes(url, params):
+            store = None
+        if index is None and store is None:
+            return
+        try:
+            payload = response.json()
+        except ValueError:
+            return
+        if index is not None:
+            index.observe(payload)
+        if store is not None:
+            store.observe(url, params, payload)
+
+    def _lookup_stored(
+        self, kind: str, ids: list[str], fields: Any
+    ) -> dict[str, dict[str, Any]]:
+        """Returns the objects among ``ids`` stored with ``fields`` by the app."""
+        store = self.main_app_client.hydration_store
+        return store.lookup(kind, ids, fields) if store is not None else {}
+
+    def _resolve_user_id(self, value: Any) -> Any:
+        """Returns the user id for ``value``, which may also be a username or handle.
+
+        Usernames are looked up in the app's user index first and fetched with
+        ``find_user_by_username`` only on a miss.
+        """
+        if value is None or is_user_id(value):
+            return value
+        username = normalize_username(value)
+        index = self.main_app_client.user_index
+        if index is not None and (user_id := index.id_for(username)) is not None:
+            return user_id
+        data = self.main_app_client.users.find_user_by_username(username).get("data")
+        if not data:
+            raise ValueError(f"Unknown username: '{value}'")
+        if index is not None:
+            index.add(data["id"], data["username"])
+        return data["id"]
+
+    def _resolve_user_ids(self, values: Any) -> list[str] | None:
+        """Returns the user ids for ``values``, any of which may be a username.
+
+        Usernames are resolved together with :meth:`UserIndex.resolve_ids`, so
+        the unknown ones cost a single batched lookup. The app's user index is
+        used and filled if it has one.
+        """
+        if values is None:
+            return None
+        values = list(iter_ids(values))
+        if all(is_user_id(value) for value in values):
+            return values
+        users = self.main_app_client.users
+        index = self.main_app_client.user_index
+        if index is not None:
+            return index.resolve_ids(users, values)
+        with closing(UserIndex()) as index:
+            return index.resolve_ids(users, values)
+
+    def _request(self, method: str, url: str, send: Callable[[], Any]):
+        """Sends a request through the app's rate limiter and retry policy.
+
+        The request waits for a token of its endpoint's rate limit window and the
+        response's rate limit headers are recorded. A 429 is re-sent after the
+        window resets, up to the limiter's ``max_retries``; transient failures are
+        retried as allowed by the retry policy. Either may be ``None`` to disable it.
+        """
+        limiter = self.main_app_client.rate_limiter
+        retry_policy = self.main_app_client.retry_policy
+        key = f"{method} {endpoint_template(url)}"
+        if retry_policy is not None:
+            retry_policy.record_request()
+        attempt = rate_limited = 0
+        while True:
+            if limiter is not None:
+                limiter.acquire(key)
+            response = error = None
+            try:
+                response = send()
+            except httpx.HTTPStatusError as e:
+                response, error = e.response, e
+            except httpx.TransportError as e:
+                error = e
+            if limiter is not None:
+                if response is not None:
+                    limiter.update(key, response)
+                else:
+                    limiter.refund(key)
+            if (
+                response is not None
+                and response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+            ):
+                if limiter is not None and rate_limited < limiter.max_retries:
+                    rate_limited += 1
+                    continue
+            elif retry_policy is not None and retry_policy.should_retry(
+                method, attempt, response, error
+            ):
+                time.sleep(retry_policy.schedule_retry(key, attempt, response, error))
+                attempt += 1
+                continue
+            if error is not None:
+                raise error
+            return response
+
+    def _stream(
+        self, url: str, params: dict = None, timeout: float = None, **kwargs
+    ) -> Iterator[Any]:
+        """Yields one decoded JSON message per line of a long-lived streaming response.
+
+        The body is consumed incrementally, so memory use is bounded by the size of
+        a single message. Blank lines are keep-alive heartbeats and are skipped.
+        """
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+        with self.main_app_client.client.stream(
+            "GET", url, params=params, **kwargs
+        ) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if line.strip():
+                    yield json.loads(line)
@@ -1,4 +1,5 @@
 from typing import Any, Dict, Optional
+from ..expansions import ExpandedResponse
 from .api_segment_base import APISegmentBase
 
 class DmConversationsApi(APISegmentBase):
@@ -14,7 +15,7 @@ class DmConversationsApi(APISegmentBase):
         Args:
             conversation_type (string): The conversation type that is being created.
             message (string): message
-            participant_ids (array): Participants for the DM Conversation.
+            participant_ids (array): Participants for the DM Conversation. Also accepts usernames, with or without a leading '@'; unknown ones are looked up in a single batched request.
 
         Returns:
             dict[str, Any]: The request has succeeded.
@@ -22,10 +23,12 @@ class DmConversationsApi(APISegmentBase):
         Raises:
             HTTPError: Raised when the API request fails (e.g., non-2XX status code).
             JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+            ValueError: Raised if a username does not exist.
 
         Tags:
             Direct Messages
         """
+        participant_ids = self._resolve_user_ids(participant_ids)
         request_body_data = None
         request_body_data = {'conversation_type': conversation_type, 'message': message, 'participant_ids': participant_ids}
         request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
@@ -41,7 +44,7 @@ class DmConversationsApi(APISegmentBase):
         Retrieves a list of direct message events for a conversation with a specific participant, allowing for optional filtering by event types and pagination.
 
         Args:
-            participant_id (string): participant_id
+            participant_id (string): User ID. Also accepts a username, with or without a leading '@'.
             max_results (integer): The maximum number of direct message events to return in the response, with a default of 100.
             pagination_token (string): The opaque token used to retrieve the next page of direct message events in the conversation with the specified participant.
             event_types (array): An optional array parameter specifying the types of DM events to include, such as "MessageCreate", "ParticipantsLeave", and "ParticipantsJoin", with default values of "MessageCreate", "ParticipantsLeave", and "ParticipantsJoin". Example: "['MessageCreate', 'ParticipantsLeave']".
@@ -63,11 +66,12 @@ class DmConversationsApi(APISegmentBase):
         """
         if participant_id is None:
             raise ValueError("Missing required parameter 'participant_id'.")
+        participant_id = self._resolve_user_id(participant_id)
         url = f'{self.main_app_client.base_url}/2/dm_conversations/with/{participant_id}/dm_events'
         query_params = {k: v for k, v in [('max_results', max_results), ('pagination_token', pagination_token), ('event_types', event_types), ('dm_event.fields', dm_event_fields), ('expansions', expansions), ('media.fields', media_fields), ('user.fields', user_fields), ('tweet.fields', tweet_fields)] if v is not None}
         response = self._get(url, params=query_params)
         response.raise_for_status()
-        return response.json()
+        return ExpandedResponse(response.json())
 
     def dm_conversation_with_user_event_id_create(self, participant_id, attachments=None, text=None) -> dict[str, Any]:
         """
@@ -75,7 +79,7 @@ class DmConversationsApi(APISegmentBase):
         Creates a new one-to-one Direct Message conversation with the specified participant or adds a message to an existing conversation using the X API.
 
         Args:
-            participant_id (string): participant_id
+            participant_id (string): User ID. Also accepts a username, with or without a leading '@'.
             attachments (array): Attachments to a DM Event.
             text (string): Text of the message.
 
@@ -91,6 +95,7 @@ class DmConversationsApi(APISegmentBase):
         """
         if participant_id is None:
             raise ValueError("Missing required parameter 'participant_id'.")
+        participant_id = self._resolve_user_id(participant_id)
         request_body_data = None
         request_body_data = {'attachments': attachments, 'text': text}
         request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
@@ -163,7 +168,7 @@ class DmConversationsApi(APISegmentBase):
         query_params = {k: v for k, v in [('max_results', max_results), ('pagination_token', pagination_token), ('event_types', event_types), ('dm_event.fields', dm_event_fields), ('expansions', expansions), ('media.fields', media_fields), ('user.fields', user_fields), ('tweet.fields', tweet_fields)] if v is not None}
         response = self._get(url, params=query_params)
         response.raise_for_status()
-        return response.json()
+        return ExpandedResponse(response.json())
 
     def list_tools(self):
         return [self.dm_conversation_id_create, self.get_dm_conversations_with_participant_id_dm_events, self.dm_conversation_with_user_event_id_create, self.dm_conversation_by_id_event_id_create, self.get_dm_conversations_id_dm_events]
\ No newline at end of file
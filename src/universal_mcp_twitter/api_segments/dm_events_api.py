@@ -1,4 +1,5 @@
 from typing import Any, Dict, Optional
+from ..expansions import ExpandedResponse
 from .api_segment_base import APISegmentBase
 
 class DmEventsApi(APISegmentBase):
@@ -35,7 +36,7 @@ class DmEventsApi(APISegmentBase):
         query_params = {k: v for k, v in [('max_results', max_results), ('pagination_token', pagination_token), ('event_types', event_types), ('dm_event.fields', dm_event_fields), ('expansions', expansions), ('media.fields', media_fields), ('user.fields', user_fields), ('tweet.fields', tweet_fields)] if v is not None}
         response = self._get(url, params=query_params)
         response.raise_for_status()
-        return response.json()
+        return ExpandedResponse(response.json())
 
     def dm_event_delete(self, event_id) -> dict[str, Any]:
         """
@@ -92,7 +93,7 @@ class DmEventsApi(APISegmentBase):
         query_params = {k: v for k, v in [('dm_event.fields', dm_event_fields), ('expansions', expansions), ('media.fields', media_fields), ('user.fields', user_fields), ('tweet.fields', tweet_fields)] if v is not None}
         response = self._get(url, params=query_params)
         response.raise_for_status()
-        return response.json()
+        return ExpandedResponse(response.json())
 
     def list_tools(self):
         return [self.get_dm_events, self.dm_event_delete, self.get_dm_events_by_id]
\ No newline at end of file
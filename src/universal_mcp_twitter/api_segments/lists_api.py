@@ -1,4 +1,5 @@
 from typing import Any, Dict, Optional
+from ..expansions import ExpandedResponse
 from .api_segment_base import APISegmentBase
 
 class ListsApi(APISegmentBase):
@@ -88,7 +89,7 @@ class ListsApi(APISegmentBase):
         query_params = {k: v for k, v in [('list.fields', list_fields), ('expansions', expansions), ('user.fields', user_fields)] if v is not None}
         response = self._get(url, params=query_params)
         response.raise_for_status()
-        return response.json()
+        return ExpandedResponse(response.json())
 
     def list_id_update(self, id, description=None, name=None, private=None) -> dict[str, Any]:
         """
@@ -151,7 +152,7 @@ class ListsApi(APISegmentBase):
         query_params = {k: v for k, v in [('max_results', max_results), ('pagination_token', pagination_token), ('user.fields', user_fields), ('expansions', expansions), ('tweet.fields', tweet_fields)] if v is not None}
         response = self._get(url, params=query_params)
         response.raise_for_status()
-        return response.json()
+        return ExpandedResponse(response.json())
 
     def list_get_members(self, id, max_results=None, pagination_token=None, user_fields=None, expansions=None, tweet_fields=None) -> dict[str, Any]:
         """
@@ -182,7 +183,7 @@ class ListsApi(APISegmentBase):
         query_params = {k: v for k, v in [('max_results', max_results), ('pagination_token', pagination_token), ('user.fields', user_fields), ('expansions', expansions), ('tweet.fields', tweet_fields)] if v is not None}
         response = self._get(url, params=query_params)
         response.raise_for_status()
-        return response.json()
+        return ExpandedResponse(response.json())
 
     def list_add_member(self, id, user_id=None) -> dict[str, Any]:
         """
@@ -191,7 +192,7 @@ class ListsApi(APISegmentBase):
 
         Args:
             id (string): id
-            user_id (string): Unique identifier of this User. This is returned as a string in order to avoid complications with languages and tools that cannot handle large integers. Example: '2244994945'.
+            user_id (string): Unique identifier of this User. This is returned as a string in order to avoid complications with languages and tools that cannot handle large integers. Example: '2244994945'. Also accepts a username, with or without a leading '@'.
 
         Returns:
             dict[str, Any]: The request has succeeded.
@@ -205,6 +206,7 @@ class ListsApi(APISegmentBase):
         """
         if id is None:
             raise ValueError("Missing required parameter 'id'.")
+        user_id = self._resolve_user_id(user_id)
         request_body_data = None
         request_body_data = {'user_id': user_id}
         request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
@@ -221,7 +223,7 @@ class ListsApi(APISegmentBase):
 
         Args:
             id (string): id
-            user_id (string): user_id
+            user_id (string): User ID. Also accepts a username, with or without a leading '@'.
 
         Returns:
             dict[str, Any]: The request has succeeded.
@@ -237,6 +239,7 @@ class ListsApi(APISegmentBase):
             raise ValueError("Missing required parameter 'id'.")
         if user_id is None:
             raise ValueError("Missing required parameter 'user_id'.")
+        user_id = self._resolve_user_id(user_id)
         url = f'{self.main_app_client.base_url}/2/lists/{id}/members/{user_id}'
         query_params = {}
         response = self._delete(url, params=query_params)
@@ -275,7 +278,7 @@ class ListsApi(APISegmentBase):
         query_params = {k: v for k, v in [('max_results', max_results), ('pagination_token', pagination_token), ('tweet.fields', tweet_fields), ('expansions', expansions), ('media.fields', media_fields), ('poll.fields', poll_fields), ('user.fields', user_fields), ('place.fields', place_fields)] if v is not None}
         response = self._get(url, params=query_params)
         response.raise_for_status()
-        return response.json()
+        return ExpandedResponse(response.json())
 
     def list_tools(self):
         return [self.list_id_create, self.list_id_delete, self.list_id_get, self.list_id_update, self.list_get_followers, self.list_get_members, self.list_add_member, self.list_remove_member, self.lists_id_tweets]
\ No newline at end of file
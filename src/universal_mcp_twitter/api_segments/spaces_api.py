@@ -1,4 +1,5 @@
 from typing import Any, Dict, Optional
+from ..expansions import ExpandedResponse
 from .api_segment_base import APISegmentBase
 
 class SpacesApi(APISegmentBase):
@@ -32,7 +33,7 @@ class SpacesApi(APISegmentBase):
         query_params = {k: v for k, v in [('ids', ids), ('space.fields', space_fields), ('expansions', expansions), ('user.fields', user_fields), ('topic.fields', topic_fields)] if v is not None}
         response = self._get(url, params=query_params)
         response.raise_for_status()
-        return response.json()
+        return ExpandedResponse(response.json())
 
     def find_spaces_by_creator_ids(self, user_ids, space_fields=None, expansions=None, user_fields=None, topic_fields=None) -> dict[str, Any]:
         """
@@ -40,7 +41,7 @@ class SpacesApi(APISegmentBase):
         Retrieves a list of spaces by their creator IDs using the specified user IDs, with optional filtering by space fields, space expansions, user fields, and topic fields.
 
         Args:
-            user_ids (array): **user_ids**: Required array of user IDs for filtering spaces by their creators.
+            user_ids (array): **user_ids**: Required array of user IDs for filtering spaces by their creators. Also accepts usernames, with or without a leading '@'; unknown ones are looked up in a single batched request.
             space_fields (array): A comma separated list of Space fields to display. Example: "['created_at', 'creator_id', 'ended_at', 'host_ids', 'id', 'invited_user_ids', 'is_ticketed', 'lang', 'participant_count', 'scheduled_start', 'speaker_ids', 'started_at', 'state', 'subscriber_count', 'title', 'topic_ids', 'updated_at']".
             expansions (array): A comma separated list of fields to expand. Example: "['creator_id', 'host_ids', 'invited_user_ids', 'speaker_ids', 'topic_ids']".
             user_fields (array): A comma separated list of User fields to display. Example: "['affiliation', 'connection_status', 'created_at', 'description', 'entities', 'id', 'location', 'most_recent_tweet_id', 'name', 'pinned_tweet_id', 'profile_banner_url', 'profile_image_url', 'protected', 'public_metrics', 'receives_your_dm', 'subscription_type', 'url', 'username', 'verified', 'verified_type', 'withheld']".
@@ -52,15 +53,17 @@ class SpacesApi(APISegmentBase):
         Raises:
             HTTPError: Raised when the API request fails (e.g., non-2XX status code).
             JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+            ValueError: Raised if a username does not exist.
 
         Tags:
             Spaces
         """
+        user_ids = self._resolve_user_ids(user_ids)
         url = f'{self.main_app_client.base_url}/2/spaces/by/creator_ids'
-        query_params = {k: v for k, v in [('user_ids', user_ids), ('space.fields', space_fields), ('expansions', expansions), ('user.fields', user_fields), ('topic.fields', topic_fields)] if v is not None}
+        query_params = {k: v for k, v in [('user_ids', ','.join(user_ids) if user_ids is not None else None), ('space.fields', space_fields), ('expansions', expansions), ('user.fields', user_fields), ('topic.fields', topic_fields)] if v is not None}
         response = self._get(url, params=query_params)
         response.raise_for_status()
-        return response.json()
+        return ExpandedResponse(response.json())
 
     def search_spaces(self, query, state=None, max_results=None, space_fields=None, expansions=None, user_fields=None, topic_fields=None) -> dict[str, Any]:
         """
@@ -90,7 +93,7 @@ class SpacesApi(APISegmentBase):
         query_params = {k: v for k, v in [('query', query), ('state', state), ('max_results', max_results), ('space.fields', space_fields), ('expansions', expansions), ('user.fields', user_fields), ('topic.fields', topic_fields)] if v is not None}
         response = self._get(url, params=query_params)
         response.raise_for_status()
-        return response.json()
+        return ExpandedResponse(response.json())
 
     def find_space_by_id(self, id, space_fields=None, expansions=None, user_fields=None, topic_fields=None) -> dict[str, Any]:
         """
@@ -120,7 +123,7 @@ class SpacesApi(APISegmentBase):
         query_params = {k: v for k, v in [('space.fields', space_fields), ('expansions', expansions), ('user.fields', user_fields), ('topic.fields', topic_fields)] if v is not None}
         response = self._get(url, params=query_params)
         response.raise_for_status()
-        return response.json()
+        return ExpandedResponse(response.json())
 
     def space_buyers(self, id, pagination_token=None, max_results=None, user_fields=None, expansions=None, tweet_fields=None) -> dict[str, Any]:
         """
@@ -151,7 +154,7 @@ class SpacesApi(APISegmentBase):
         query_params = {k: v for k, v in [('pagination_token', pagination_token), ('max_results', max_results), ('user.fields', user_fields), ('expansions', expansions), ('tweet.fields', tweet_fields)] if v is not None}
         response = self._get(url, params=query_params)
         response.raise_for_status()
-        return response.json()
+        return ExpandedResponse(response.json())
 
     def space_tweets(self, id, max_results=None, tweet_fields=None, expansions=None, media_fields=None, poll_fields=None, user_fields=None, place_fields=None) -> dict[str, Any]:
         """
@@ -184,7 +187,7 @@ class SpacesApi(APISegmentBase):
         query_params = {k: v for k, v in [('max_results', max_results), ('tweet.fields', tweet_fields), ('expansions', expansions), ('media.fields', media_fields), ('poll.fields', poll_fields), ('user.fields', user_fields), ('place.fields', place_fields)] if v is not None}
         response = self._get(url, params=query_params)
         response.raise_for_status()
-        return response.json()
+        return ExpandedResponse(response.json())
 
     def list_tools(self):
         return [self.find_spaces_by_ids, self.find_spaces_by_creator_ids, self.search_spaces, self.find_space_by_id, self.space_buyers, self.space_tweets]
\ No newline at end of file
@@ -1,4 +1,11 @@
+from collections.abc import Iterator
 from typing import Any, Dict, Optional
+from ..batching import DEFAULT_MAX_CONCURRENCY, MAX_IDS_PER_REQUEST, batched_lookup, iter_ids, merge_responses
+from ..expansions import ExpandedResponse
+from ..hydration import with_stored
+from ..queries import MAX_ARCHIVE_QUERY_LENGTH, MAX_QUERY_LENGTH, pack_queries, packed_pages
+from ..rules import MAX_RULES_PER_REQUEST, RuleSyncReport, reconcile_rules
+from ..sharding import plan_shards, search_bounds, sharded_pages, time_shards
 from .api_segment_base import APISegmentBase
 
 class TweetsApi(APISegmentBase):
@@ -12,7 +19,7 @@ class TweetsApi(APISegmentBase):
         Retrieves one or more Tweets by their IDs and returns associated details, supporting optional parameters for specifying additional fields and expansions.
 
         Args:
-            ids (array): An array of IDs for the tweets to retrieve, required for the operation.
+            ids (array): An array of IDs for the tweets to retrieve, required for the operation. More than 100 IDs are split into batches that are fetched concurrently and merged into a single response.
             tweet_fields (array): A comma separated list of Tweet fields to display. Example: "['article', 'attachments', 'author_id', 'card_uri', 'context_annotations', 'conversation_id', 'created_at', 'edit_controls', 'edit_history_tweet_ids', 'entities', 'geo', 'id', 'in_reply_to_user_id', 'lang', 'non_public_metrics', 'note_tweet', 'organic_metrics', 'possibly_sensitive', 'promoted_metrics', 'public_metrics', 'referenced_tweets', 'reply_settings', 'scopes', 'source', 'text', 'username', 'withheld']".
             expansions (array): A comma separated list of fields to expand. Example: "['article.cover_media', 'article.media_entities', 'attachments.media_keys', 'attachments.media_source_tweet', 'attachments.poll_ids', 'author_id', 'edit_history_tweet_ids', 'entities.mentions.username', 'geo.place_id', 'in_reply_to_user_id', 'entities.note.mentions.username', 'referenced_tweets.id', 'referenced_tweets.id.author_id', 'author_screen_name']".
             media_fields (array): A comma separated list of Media fields to display. Example: "['alt_text', 'duration_ms', 'height', 'media_key', 'non_public_metrics', 'organic_metrics', 'preview_image_url', 'promoted_metrics', 'public_metrics', 'type', 'url', 'variants', 'width']".
@@ -26,15 +33,83 @@ class TweetsApi(APISegmentBase):
         Raises:
             HTTPError: Raised when the API request fails (e.g., non-2XX status code).
             JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+            ValueError: Raised if `ids` is missing or empty.
 
         Tags:
             Tweets
         """
+        ids = list(iter_ids(ids)) if ids is not None else []
+        if not ids:
+            raise ValueError("Missing required parameter 'ids'.")
+        if len(ids) > MAX_IDS_PER_REQUEST:
+            return self.find_tweets_by_id_bulk(ids, tweet_fields=tweet_fields, expansions=expansions, media_fields=media_fields, poll_fields=poll_fields, user_fields=user_fields, place_fields=place_fields)
+        stored = self._lookup_stored('tweets', ids, tweet_fields) if expansions is None else {}
+        missing = [i for i in ids if i not in stored]
+        if not missing:
+            return ExpandedResponse(with_stored(ids, stored))
         url = f'{self.main_app_client.base_url}/2/tweets'
-        query_params = {k: v for k, v in [('ids', ids), ('tweet.fields', tweet_fields), ('expansions', expansions), ('media.fields', media_fields), ('poll.fields', poll_fields), ('user.fields', user_fields), ('place.fields', place_fields)] if v is not None}
+        query_params = {k: v for k, v in [('ids', ','.join(missing)), ('tweet.fields', tweet_fields), ('expansions', expansions), ('media.fields', media_fields), ('poll.fields', poll_fields), ('user.fields', user_fields), ('place.fields', place_fields)] if v is not None}
         response = self._get(url, params=query_params)
         response.raise_for_status()
-        return response.json()
+        return ExpandedResponse(with_stored(ids, stored, response.json()))
+
+    def iter_tweets_by_id(self, ids, tweet_fields=None, expansions=None, media_fields=None, poll_fields=None, user_fields=None, place_fields=None, batch_size=MAX_IDS_PER_REQUEST, max_concurrency=DEFAULT_MAX_CONCURRENCY) -> Iterator[dict[str, Any]]:
+        """
+
+        Hydrates an arbitrarily large collection of Tweet IDs, splitting it into batches of at most 100 IDs that are fetched concurrently and yielding each batch's response in input order.
+
+        Args:
+            ids (array): Any iterable of Tweet IDs, or a comma separated string. It is consumed lazily, so millions of IDs can be hydrated in bounded memory.
+            tweet_fields (array): A comma separated list of Tweet fields to display.
+            expansions (array): A comma separated list of fields to expand.
+            media_fields (array): A comma separated list of Media fields to display.
+            poll_fields (array): A comma separated list of Poll fields to display.
+            user_fields (array): A comma separated list of User fields to display.
+            place_fields (array): A comma separated list of Place fields to display.
+            batch_size (integer): Number of IDs per request, at most 100.
+            max_concurrency (integer): Maximum number of batch requests in flight at once.
+
+        Yields:
+            dict[str, Any]: The lookup response of one batch, with its own `data`, `includes` and `errors`.
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            ValueError: Raised if `batch_size` is outside 1-100.
+
+        Tags:
+            Tweets
+        """
+        def fetch(batch):
+            return self.find_tweets_by_id(batch, tweet_fields=tweet_fields, expansions=expansions, media_fields=media_fields, poll_fields=poll_fields, user_fields=user_fields, place_fields=place_fields)
+        yield from batched_lookup(fetch, iter_ids(ids), batch_size, max_concurrency)
+
+    def find_tweets_by_id_bulk(self, ids, tweet_fields=None, expansions=None, media_fields=None, poll_fields=None, user_fields=None, place_fields=None, batch_size=MAX_IDS_PER_REQUEST, max_concurrency=DEFAULT_MAX_CONCURRENCY) -> dict[str, Any]:
+        """
+
+        Hydrates an arbitrarily large collection of Tweet IDs with concurrent batched lookups and merges the batches into one response.
+
+        Args:
+            ids (array): Any iterable of Tweet IDs, or a comma separated string.
+            tweet_fields (array): A comma separated list of Tweet fields to display.
+            expansions (array): A comma separated list of fields to expand.
+            media_fields (array): A comma separated list of Media fields to display.
+            poll_fields (array): A comma separated list of Poll fields to display.
+            user_fields (array): A comma separated list of User fields to display.
+            place_fields (array): A comma separated list of Place fields to display.
+            batch_size (integer): Number of IDs per request, at most 100.
+            max_concurrency (integer): Maximum number of batch requests in flight at once.
+
+        Returns:
+            dict[str, Any]: The merged response; `data` and `errors` are concatenated in input order and `includes` objects are de-duplicated across batches.
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            ValueError: Raised if `batch_size` is outside 1-100.
+
+        Tags:
+            Tweets
+        """
+        return ExpandedResponse(merge_responses(self.iter_tweets_by_id(ids, tweet_fields=tweet_fields, expansions=expansions, media_fields=media_fields, poll_fields=poll_fields, user_fields=user_fields, place_fields=place_fields, batch_size=batch_size, max_concurrency=max_concurrency)))
 
     def create_tweet(self, card_uri=None, direct_message_deep_link=None, for_super_followers_only=None, geo=None, media=None, nullcast=None, poll=None, quote_tweet_id=None, reply=None, reply_settings=None, text=None) -> dict[str, Any]:
         """
@@ -100,6 +175,32 @@ class TweetsApi(APISegmentBase):
         response.raise_for_status()
         return response.json()
 
+    def iter_tweets_compliance_stream(self, partition, backfill_minutes=None, start_time=None, end_time=None, timeout=None) -> Iterator[dict[str, Any]]:
+        """
+
+        Incrementally reads the `/2/tweets/compliance/stream` stream, yielding one decoded message at a time as lines arrive on the chunked response so memory stays bounded for as long as the connection is open.
+
+        Args:
+            partition (integer): Specifies the partition number from which to retrieve compliance stream events, with a required integer value between 1 and 4.
+            backfill_minutes (integer): Optional integer parameter to specify the number of minutes of data to recover from a stream disconnection, allowing retrieval of missed tweets.
+            start_time (string): Optional string parameter specifying the earliest UTC timestamp from which compliance events will be provided, formatted as YYYY-MM-DDTHH:mm:ssZ. Example: '2021-02-01T18:40:40.000Z'.
+            end_time (string): The `end_time` parameter specifies the latest UTC timestamp (in ISO 8601 format) until which compliance events will be streamed. Example: '2021-02-14T18:40:40.000Z'.
+            timeout (number): Optional read timeout in seconds; a connection that delivers neither data nor keep-alive heartbeats for this long raises a timeout error instead of blocking forever.
+
+        Yields:
+            dict[str, Any]: One decoded message per non-empty line of the stream.
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if a line of the stream cannot be parsed as JSON.
+
+        Tags:
+            Compliance
+        """
+        url = f'{self.main_app_client.base_url}/2/tweets/compliance/stream'
+        query_params = {k: v for k, v in [('backfill_minutes', backfill_minutes), ('partition', partition), ('start_time', start_time), ('end_time', end_time)] if v is not None}
+        yield from self._stream(url, params=query_params, timeout=timeout)
+
     def tweet_counts_full_archive_search(self, query, start_time=None, end_time=None, since_id=None, until_id=None, next_token=None, pagination_token=None, granularity=None, search_count_fields=None) -> dict[str, Any]:
         """
 
@@ -195,7 +296,39 @@ class TweetsApi(APISegmentBase):
         query_params = {k: v for k, v in [('backfill_minutes', backfill_minutes), ('partition', partition), ('start_time', start_time), ('end_time', end_time), ('tweet.fields', tweet_fields), ('expansions', expansions), ('media.fields', media_fields), ('poll.fields', poll_fields), ('user.fields', user_fields), ('place.fields', place_fields)] if v is not None}
         response = self._get(url, params=query_params)
         response.raise_for_status()
-        return response.json()
+        return ExpandedResponse(response.json())
+
+    def iter_tweets_firehose_stream(self, partition, backfill_minutes=None, start_time=None, end_time=None, tweet_fields=None, expansions=None, media_fields=None, poll_fields=None, user_fields=None, place_fields=None, timeout=None) -> Iterator[dict[str, Any]]:
+        """
+
+        Incrementally reads the `/2/tweets/firehose/stream` stream, yielding one decoded message at a time as lines arrive on the chunked response so memory stays bounded for as long as the connection is open.
+
+        Args:
+            partition (integer): A required integer parameter that specifies the partition from which to retrieve the firehose stream data.
+            backfill_minutes (integer): The backfill_minutes parameter allows requesting up to five minutes of missed streaming data to be delivered upon reconnection, helping recover Tweets lost during short disconnections; it accepts an integer value from 1 to 5 and is available only with Academic Research access.
+            start_time (string): Optional ISO 8601-formatted timestamp indicating the earliest time from which to retrieve tweets, allowing filtering by time period. Example: '2021-02-14T18:40:40.000Z'.
+            end_time (string): The end_time parameter specifies the exclusive upper bound timestamp to filter tweets created before this time in the stream. Example: '2021-02-14T18:40:40.000Z'.
+            tweet_fields (array): A comma separated list of Tweet fields to display. Example: "['article', 'attachments', 'author_id', 'card_uri', 'context_annotations', 'conversation_id', 'created_at', 'edit_controls', 'edit_history_tweet_ids', 'entities', 'geo', 'id', 'in_reply_to_user_id', 'lang', 'non_public_metrics', 'note_tweet', 'organic_metrics', 'possibly_sensitive', 'promoted_metrics', 'public_metrics', 'referenced_tweets', 'reply_settings', 'scopes', 'source', 'text', 'username', 'withheld']".
+            expansions (array): A comma separated list of fields to expand. Example: "['article.cover_media', 'article.media_entities', 'attachments.media_keys', 'attachments.media_source_tweet', 'attachments.poll_ids', 'author_id', 'edit_history_tweet_ids', 'entities.mentions.username', 'geo.place_id', 'in_reply_to_user_id', 'entities.note.mentions.username', 'referenced_tweets.id', 'referenced_tweets.id.author_id', 'author_screen_name']".
+            media_fields (array): A comma separated list of Media fields to display. Example: "['alt_text', 'duration_ms', 'height', 'media_key', 'non_public_metrics', 'organic_metrics', 'preview_image_url', 'promoted_metrics', 'public_metrics', 'type', 'url', 'variants', 'width']".
+            poll_fields (array): A comma separated list of Poll fields to display. Example: "['duration_minutes', 'end_datetime', 'id', 'options', 'voting_status']".
+            user_fields (array): A comma separated list of User fields to display. Example: "['affiliation', 'connection_status', 'created_at', 'description', 'entities', 'id', 'location', 'most_recent_tweet_id', 'name', 'pinned_tweet_id', 'profile_banner_url', 'profile_image_url', 'protected', 'public_metrics', 'receives_your_dm', 'subscription_type', 'url', 'username', 'verified', 'verified_type', 'withheld']".
+            place_fields (array): A comma separated list of Place fields to display. Example: "['contained_within', 'country', 'country_code', 'full_name', 'geo', 'id', 'name', 'place_type']".
+            timeout (number): Optional read timeout in seconds; a connection that delivers neither data nor keep-alive heartbeats for this long raises a timeout error instead of blocking forever.
+
+        Yields:
+            dict[str, Any]: One decoded message per non-empty line of the stream.
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if a line of the stream cannot be parsed as JSON.
+
+        Tags:
+            Tweets
+        """
+        url = f'{self.main_app_client.base_url}/2/tweets/firehose/stream'
+        query_params = {k: v for k, v in [('backfill_minutes', backfill_minutes), ('partition', partition), ('start_time', start_time), ('end_time', end_time), ('tweet.fields', tweet_fields), ('expansions', expansions), ('media.fields', media_fields), ('poll.fields', poll_fields), ('user.fields', user_fields), ('place.fields', place_fields)] if v is not None}
+        yield from self._stream(url, params=query_params, timeout=timeout)
 
     def get_tweets_firehose_stream_lang_en(self, partition, backfill_minutes=None, start_time=None, end_time=None, tweet_fields=None, expansions=None, media_fields=None, poll_fields=None, user_fields=None, place_fields=None) -> dict[str, Any]:
         """
@@ -228,7 +361,39 @@ class TweetsApi(APISegmentBase):
         query_params = {k: v for k, v in [('backfill_minutes', backfill_minutes), ('partition', partition), ('start_time', start_time), ('end_time', end_time), ('tweet.fields', tweet_fields), ('expansions', expansions), ('media.fields', media_fields), ('poll.fields', poll_fields), ('user.fields', user_fields), ('place.fields', place_fields)] if v is not None}
         response = self._get(url, params=query_params)
         response.raise_for_status()
-        return response.json()
+        return ExpandedResponse(response.json())
+
+    def iter_tweets_firehose_stream_lang_en(self, partition, backfill_minutes=None, start_time=None, end_time=None, tweet_fields=None, expansions=None, media_fields=None, poll_fields=None, user_fields=None, place_fields=None, timeout=None) -> Iterator[dict[str, Any]]:
+        """
+
+        Incrementally reads the `/2/tweets/firehose/stream/lang/en` stream, yielding one decoded message at a time as lines arrive on the chunked response so memory stays bounded for as long as the connection is open.
+
+        Args:
+            partition (integer): The `partition` parameter is an integer value required in the query for the GET operation at path "/2/tweets/firehose/stream/lang/en", specifying the partition number for the stream.
+            backfill_minutes (integer): Requests up to five minutes of missed streaming data to be delivered upon reconnection, useful for recovering data lost during brief disconnections.
+            start_time (string): Optional string parameter specifying the start time in ISO 8601 format (YYYY-MM-DDTHH:mm:ssZ) to filter the oldest Tweets included in the response. Example: '2021-02-14T18:40:40.000Z'.
+            end_time (string): Optional parameter to specify the end time for filtering tweets in the firehose stream, allowing retrieval of tweets created before this time. Example: '2021-02-14T18:40:40.000Z'.
+            tweet_fields (array): A comma separated list of Tweet fields to display. Example: "['article', 'attachments', 'author_id', 'card_uri', 'context_annotations', 'conversation_id', 'created_at', 'edit_controls', 'edit_history_tweet_ids', 'entities', 'geo', 'id', 'in_reply_to_user_id', 'lang', 'non_public_metrics', 'note_tweet', 'organic_metrics', 'possibly_sensitive', 'promoted_metrics', 'public_metrics', 'referenced_tweets', 'reply_settings', 'scopes', 'source', 'text', 'username', 'withheld']".
+            expansions (array): A comma separated list of fields to expand. Example: "['article.cover_media', 'article.media_entities', 'attachments.media_keys', 'attachments.media_source_tweet', 'attachments.poll_ids', 'author_id', 'edit_history_tweet_ids', 'entities.mentions.username', 'geo.place_id', 'in_reply_to_user_id', 'entities.note.mentions.username', 'referenced_tweets.id', 'referenced_tweets.id.author_id', 'author_screen_name']".
+            media_fields (array): A comma separated list of Media fields to display. Example: "['alt_text', 'duration_ms', 'height', 'media_key', 'non_public_metrics', 'organic_metrics', 'preview_image_url', 'promoted_metrics', 'public_metrics', 'type', 'url', 'variants', 'width']".
+            poll_fields (array): A comma separated list of Poll fields to display. Example: "['duration_minutes', 'end_datetime', 'id', 'options', 'voting_status']".
+            user_fields (array): A comma separated list of User fields to display. Example: "['affiliation', 'connection_status', 'created_at', 'description', 'entities', 'id', 'location', 'most_recent_tweet_id', 'name', 'pinned_tweet_id', 'profile_banner_url', 'profile_image_url', 'protected', 'public_metrics', 'receives_your_dm', 'subscription_type', 'url', 'username', 'verified', 'verified_type', 'withheld']".
+            place_fields (array): A comma separated list of Place fields to display. Example: "['contained_within', 'country', 'country_code', 'full_name', 'geo', 'id', 'name', 'place_type']".
+            timeout (number): Optional read timeout in seconds; a connection that delivers neither data nor keep-alive heartbeats for this long raises a timeout error instead of blocking forever.
+
+        Yields:
+            dict[str, Any]: One decoded message per non-empty line of the stream.
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if a line of the stream cannot be parsed as JSON.
+
+        Tags:
+            Tweets
+        """
+        url = f'{self.main_app_client.base_url}/2/tweets/firehose/stream/lang/en'
+        query_params = {k: v for k, v in [('backfill_minutes', backfill_minutes), ('partition', partition), ('start_time', start_time), ('end_time', end_time), ('tweet.fields', tweet_fields), ('expansions', expansions), ('media.fields', media_fields), ('poll.fields', poll_fields), ('user.fields', user_fields), ('place.fields', place_fields)] if v is not None}
+        yield from self._stream(url, params=query_params, timeout=timeout)
 
     def get_tweets_firehose_stream_lang_ja(self, partition, backfill_minutes=None, start_time=None, end_time=None, tweet_fields=None, expansions=None, media_fields=None, poll_fields=None, user_fields=None, place_fields=None) -> dict[str, Any]:
         """
@@ -261,7 +426,39 @@ class TweetsApi(APISegmentBase):
         query_params = {k: v for k, v in [('backfill_minutes', backfill_minutes), ('partition', partition), ('start_time', start_time), ('end_time', end_time), ('tweet.fields', tweet_fields), ('expansions', expansions), ('media.fields', media_fields), ('poll.fields', poll_fields), ('user.fields', user_fields), ('place.fields', place_fields)] if v is not None}
         response = self._get(url, params=query_params)
         response.raise_for_status()
-        return response.json()
+        return ExpandedResponse(response.json())
+
+    def iter_tweets_firehose_stream_lang_ja(self, partition, backfill_minutes=None, start_time=None, end_time=None, tweet_fields=None, expansions=None, media_fields=None, poll_fields=None, user_fields=None, place_fields=None, timeout=None) -> Iterator[dict[str, Any]]:
+        """
+
+        Incrementally reads the `/2/tweets/firehose/stream/lang/ja` stream, yielding one decoded message at a time as lines arrive on the chunked response so memory stays bounded for as long as the connection is open.
+
+        Args:
+            partition (integer): The partition number used to identify and organize the data stream, which is required for this operation.
+            backfill_minutes (integer): The number of minutes (1 to 5) of missed streaming data to backfill and recover upon reconnection, available only with Academic Research access.
+            start_time (string): The start_time parameter specifies the oldest UTC timestamp in ISO 8601 format from which Tweets will be provided, inclusive and in second granularity. Example: '2021-02-14T18:40:40.000Z'.
+            end_time (string): Optional query parameter to specify the end time for retrieving Tweets in the format compatible with the API's date and time requirements, limiting the results to those created before this time. Example: '2021-02-14T18:40:40.000Z'.
+            tweet_fields (array): A comma separated list of Tweet fields to display. Example: "['article', 'attachments', 'author_id', 'card_uri', 'context_annotations', 'conversation_id', 'created_at', 'edit_controls', 'edit_history_tweet_ids', 'entities', 'geo', 'id', 'in_reply_to_user_id', 'lang', 'non_public_metrics', 'note_tweet', 'organic_metrics', 'possibly_sensitive', 'promoted_metrics', 'public_metrics', 'referenced_tweets', 'reply_settings', 'scopes', 'source', 'text', 'username', 'withheld']".
+            expansions (array): A comma separated list of fields to expand. Example: "['article.cover_media', 'article.media_entities', 'attachments.media_keys', 'attachments.media_source_tweet', 'attachments.poll_ids', 'author_id', 'edit_history_tweet_ids', 'entities.mentions.username', 'geo.place_id', 'in_reply_to_user_id', 'entities.note.mentions.username', 'referenced_tweets.id', 'referenced_tweets.id.author_id', 'author_screen_name']".
+            media_fields (array): A comma separated list of Media fields to display. Example: "['alt_text', 'duration_ms', 'height', 'media_key', 'non_public_metrics', 'organic_metrics', 'preview_image_url', 'promoted_metrics', 'public_metrics', 'type', 'url', 'variants', 'width']".
+            poll_fields (array): A comma separated list of Poll fields to display. Example: "['duration_minutes', 'end_datetime', 'id', 'options', 'voting_status']".
+            user_fields (array): A comma separated list of User fields to display. Example: "['affiliation', 'connection_status', 'created_at', 'description', 'entities', 'id', 'location', 'most_recent_tweet_id', 'name', 'pinned_tweet_id', 'profile_banner_url', 'profile_image_url', 'protected', 'public_metrics', 'receives_your_dm', 'subscription_type', 'url', 'username', 'verified', 'verified_type', 'withheld']".
+            place_fields (array): A comma separated list of Place fields to display. Example: "['contained_within', 'country', 'country_code', 'full_name', 'geo', 'id', 'name', 'place_type']".
+            timeout (number): Optional read timeout in seconds; a connection that delivers neither data nor keep-alive heartbeats for this long raises a timeout error instead of blocking forever.
+
+        Yields:
+            dict[str, Any]: One decoded message per non-empty line of the stream.
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if a line of the stream cannot be parsed as JSON.
+
+        Tags:
+            Tweets
+        """
+        url = f'{self.main_app_client.base_url}/2/tweets/firehose/stream/lang/ja'
+        query_params = {k: v for k, v in [('backfill_minutes', backfill_minutes), ('partition', partition), ('start_time', start_time), ('end_time', end_time), ('tweet.fields', tweet_fields), ('expansions', expansions), ('media.fields', media_fields), ('poll.fields', poll_fields), ('user.fields', user_fields), ('place.fields', place_fields)] if v is not None}
+        yield from self._stream(url, params=query_params, timeout=timeout)
 
     def get_tweets_firehose_stream_lang_ko(self, partition, backfill_minutes=None, start_time=None, end_time=None, tweet_fields=None, expansions=None, media_fields=None, poll_fields=None, user_fields=None, place_fields=None) -> dict[str, Any]:
         """
@@ -294,7 +491,39 @@ class TweetsApi(APISegmentBase):
         query_params = {k: v for k, v in [('backfill_minutes', backfill_minutes), ('partition', partition), ('start_time', start_time), ('end_time', end_time), ('tweet.fields', tweet_fields), ('expansions', expansions), ('media.fields', media_fields), ('poll.fields', poll_fields), ('user.fields', user_fields), ('place.fields', place_fields)] if v is not None}
         response = self._get(url, params=query_params)
         response.raise_for_status()
-        return response.json()
+        return ExpandedResponse(response.json())
+
+    def iter_tweets_firehose_stream_lang_ko(self, partition, backfill_minutes=None, start_time=None, end_time=None, tweet_fields=None, expansions=None, media_fields=None, poll_fields=None, user_fields=None, place_fields=None, timeout=None) -> Iterator[dict[str, Any]]:
+        """
+
+        Incrementally reads the `/2/tweets/firehose/stream/lang/ko` stream, yielding one decoded message at a time as lines arrive on the chunked response so memory stays bounded for as long as the connection is open.
+
+        Args:
+            partition (integer): The partition parameter specifies the integer partition number to use for streaming tweets.
+            backfill_minutes (integer): The number of minutes (1 to 5) of previously missed Tweets to backfill and deliver upon reconnection, allowing recovery of up to five minutes of data missed during a disconnection; duplicates may occur and this feature requires Academic Research access.
+            start_time (string): The "start_time" parameter specifies the earliest UTC timestamp from which Tweets should be retrieved, formatted as YYYY-MM-DDTHH:mm:ssZ (ISO 8601/RFC 3339). Example: '2021-02-14T18:40:40.000Z'.
+            end_time (string): end_time: Optional query parameter to specify the exclusive upper bound timestamp for filtering Tweets in the stream, returning only those created before this time. Example: '2021-02-14T18:40:40.000Z'.
+            tweet_fields (array): A comma separated list of Tweet fields to display. Example: "['article', 'attachments', 'author_id', 'card_uri', 'context_annotations', 'conversation_id', 'created_at', 'edit_controls', 'edit_history_tweet_ids', 'entities', 'geo', 'id', 'in_reply_to_user_id', 'lang', 'non_public_metrics', 'note_tweet', 'organic_metrics', 'possibly_sensitive', 'promoted_metrics', 'public_metrics', 'referenced_tweets', 'reply_settings', 'scopes', 'source', 'text', 'username', 'withheld']".
+            expansions (array): A comma separated list of fields to expand. Example: "['article.cover_media', 'article.media_entities', 'attachments.media_keys', 'attachments.media_source_tweet', 'attachments.poll_ids', 'author_id', 'edit_history_tweet_ids', 'entities.mentions.username', 'geo.place_id', 'in_reply_to_user_id', 'entities.note.mentions.username', 'referenced_tweets.id', 'referenced_tweets.id.author_id', 'author_screen_name']".
+            media_fields (array): A comma separated list of Media fields to display. Example: "['alt_text', 'duration_ms', 'height', 'media_key', 'non_public_metrics', 'organic_metrics', 'preview_image_url', 'promoted_metrics', 'public_metrics', 'type', 'url', 'variants', 'width']".
+            poll_fields (array): A comma separated list of Poll fields to display. Example: "['duration_minutes', 'end_datetime', 'id', 'options', 'voting_status']".
+            user_fields (array): A comma separated list of User fields to display. Example: "['affiliation', 'connection_status', 'created_at', 'description', 'entities', 'id', 'location', 'most_recent_tweet_id', 'name', 'pinned_tweet_id', 'profile_banner_url', 'profile_image_url', 'protected', 'public_metrics', 'receives_your_dm', 'subscription_type', 'url', 'username', 'verified', 'verified_type', 'withheld']".
+            place_fields (array): A comma separated list of Place fields to display. Example: "['contained_within', 'country', 'country_code', 'full_name', 'geo', 'id', 'name', 'place_type']".
+            timeout (number): Optional read timeout in seconds; a connection that delivers neither data nor keep-alive heartbeats for this long raises a timeout error instead of blocking forever.
+
+        Yields:
+            dict[str, Any]: One decoded message per non-empty line of the stream.
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if a line of the stream cannot be parsed as JSON.
+
+        Tags:
+            Tweets
+        """
+        url = f'{self.main_app_client.base_url}/2/tweets/firehose/stream/lang/ko'
+        query_params = {k: v for k, v in [('backfill_minutes', backfill_minutes), ('partition', partition), ('start_time', start_time), ('end_time', end_time), ('tweet.fields', tweet_fields), ('expansions', expansions), ('media.fields', media_fields), ('poll.fields', poll_fields), ('user.fields', user_fields), ('place.fields', place_fields)] if v is not None}
+        yield from self._stream(url, params=query_params, timeout=timeout)
 
     def get_tweets_firehose_stream_lang_pt(self, partition, backfill_minutes=None, start_time=None, end_time=None, tweet_fields=None, expansions=None, media_fields=None, poll_fields=None, user_fields=None, place_fields=None) -> dict[str, Any]:
         """
@@ -327,7 +556,39 @@ class TweetsApi(APISegmentBase):
         query_params = {k: v for k, v in [('backfill_minutes', backfill_minutes), ('partition', partition), ('start_time', start_time), ('end_time', end_time), ('tweet.fields', tweet_fields), ('expansions', expansions), ('media.fields', media_fields), ('poll.fields', poll_fields), ('user.fields', user_fields), ('place.fields', place_fields)] if v is not None}
         response = self._get(url, params=query_params)
         response.raise_for_status()
-        return response.json()
+        return ExpandedResponse(response.json())
+
+    def iter_tweets_firehose_stream_lang_pt(self, partition, backfill_minutes=None, start_time=None, end_time=None, tweet_fields=None, expansions=None, media_fields=None, poll_fields=None, user_fields=None, place_fields=None, timeout=None) -> Iterator[dict[str, Any]]:
+        """
+
+        Incrementally reads the `/2/tweets/firehose/stream/lang/pt` stream, yielding one decoded message at a time as lines arrive on the chunked response so memory stays bounded for as long as the connection is open.
+
+        Args:
+            partition (integer): The **partition** parameter is a required integer that specifies the partition number for the GET operation at the "/2/tweets/firehose/stream/lang/pt" path, used to distribute the stream of tweets across multiple partitions for efficient processing.
+            backfill_minutes (integer): The number of minutes (1-5) of missed streaming data to recover and deliver upon reconnection, available only for Academic Research access.
+            start_time (string): The "start_time" parameter specifies the starting point for retrieving Tweets, expressed in ISO 8601 format (YYYY-MM-DDTHH:mm:ssZ), indicating the earliest UTC timestamp for which to include Tweets. Example: '2021-02-14T18:40:40.000Z'.
+            end_time (string): The `end_time` parameter specifies the timestamp, in ISO 8601 format, after which tweets are not included in the response, allowing filtering of the firehose stream by a specific end time. Example: '2021-02-14T18:40:40.000Z'.
+            tweet_fields (array): A comma separated list of Tweet fields to display. Example: "['article', 'attachments', 'author_id', 'card_uri', 'context_annotations', 'conversation_id', 'created_at', 'edit_controls', 'edit_history_tweet_ids', 'entities', 'geo', 'id', 'in_reply_to_user_id', 'lang', 'non_public_metrics', 'note_tweet', 'organic_metrics', 'possibly_sensitive', 'promoted_metrics', 'public_metrics', 'referenced_tweets', 'reply_settings', 'scopes', 'source', 'text', 'username', 'withheld']".
+            expansions (array): A comma separated list of fields to expand. Example: "['article.cover_media', 'article.media_entities', 'attachments.media_keys', 'attachments.media_source_tweet', 'attachments.poll_ids', 'author_id', 'edit_history_tweet_ids', 'entities.mentions.username', 'geo.place_id', 'in_reply_to_user_id', 'entities.note.mentions.username', 'referenced_tweets.id', 'referenced_tweets.id.author_id', 'author_screen_name']".
+            media_fields (array): A comma separated list of Media fields to display. Example: "['alt_text', 'duration_ms', 'height', 'media_key', 'non_public_metrics', 'organic_metrics', 'preview_image_url', 'promoted_metrics', 'public_metrics', 'type', 'url', 'variants', 'width']".
+            poll_fields (array): A comma separated list of Poll fields to display. Example: "['duration_minutes', 'end_datetime', 'id', 'options', 'voting_status']".
+            user_fields (array): A comma separated list of User fields to display. Example: "['affiliation', 'connection_status', 'created_at', 'description', 'entities', 'id', 'location', 'most_recent_tweet_id', 'name', 'pinned_tweet_id', 'profile_banner_url', 'profile_image_url', 'protected', 'public_metrics', 'receives_your_dm', 'subscription_type', 'url', 'username', 'verified', 'verified_type', 'withheld']".
+            place_fields (array): A comma separated list of Place fields to display. Example: "['contained_within', 'country', 'country_code', 'full_name', 'geo', 'id', 'name', 'place_type']".
+            timeout (number): Optional read timeout in seconds; a connection that delivers neither data nor keep-alive heartbeats for this long raises a timeout error instead of blocking forever.
+
+        Yields:
+            dict[str, Any]: One decoded message per non-empty line of the stream.
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if a line of the stream cannot be parsed as JSON.
+
+        Tags:
+            Tweets
+        """
+        url = f'{self.main_app_client.base_url}/2/tweets/firehose/stream/lang/pt'
+        query_params = {k: v for k, v in [('backfill_minutes', backfill_minutes), ('partition', partition), ('start_time', start_time), ('end_time', end_time), ('tweet.fields', tweet_fields), ('expansions', expansions), ('media.fields', media_fields), ('poll.fields', poll_fields), ('user.fields', user_fields), ('place.fields', place_fields)] if v is not None}
+        yield from self._stream(url, params=query_params, timeout=timeout)
 
     def get_tweets_label_stream(self, backfill_minutes=None, start_time=None, end_time=None) -> Any:
         """
@@ -355,6 +616,31 @@ class TweetsApi(APISegmentBase):
         response.raise_for_status()
         return response.json()
 
+    def iter_tweets_label_stream(self, backfill_minutes=None, start_time=None, end_time=None, timeout=None) -> Iterator[dict[str, Any]]:
+        """
+
+        Incrementally reads the `/2/tweets/label/stream` stream, yielding one decoded message at a time as lines arrive on the chunked response so memory stays bounded for as long as the connection is open.
+
+        Args:
+            backfill_minutes (integer): The number of minutes (up to five) of missed tweet data to recover and backfill after a disconnection, available for Academic Research access.
+            start_time (string): Optional parameter specifying the earliest UTC timestamp (in ISO 8601/RFC 3339 format) from which to retrieve tweets, allowing filtering by creation time. Example: '2021-02-01T18:40:40.000Z'.
+            end_time (string): Optional parameter specifying the end time in ISO 8601 format for retrieving tweets from a label stream, used to filter tweets created before this time. Example: '2021-02-01T18:40:40.000Z'.
+            timeout (number): Optional read timeout in seconds; a connection that delivers neither data nor keep-alive heartbeats for this long raises a timeout error instead of blocking forever.
+
+        Yields:
+            dict[str, Any]: One decoded message per non-empty line of the stream.
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if a line of the stream cannot be parsed as JSON.
+
+        Tags:
+            Compliance
+        """
+        url = f'{self.main_app_client.base_url}/2/tweets/label/stream'
+        query_params = {k: v for k, v in [('backfill_minutes', backfill_minutes), ('start_time', start_time), ('end_time', end_time)] if v is not None}
+        yield from self._stream(url, params=query_params, timeout=timeout)
+
     def sample_stream(self, backfill_minutes=None, tweet_fields=None, expansions=None, media_fields=None, poll_fields=None, user_fields=None, place_fields=None) -> dict[str, Any]:
         """
 
@@ -383,7 +669,36 @@ class TweetsApi(APISegmentBase):
         query_params = {k: v for k, v in [('backfill_minutes', backfill_minutes), ('tweet.fields', tweet_fields), ('expansions', expansions), ('media.fields', media_fields), ('poll.fields', poll_fields), ('user.fields', user_fields), ('place.fields', place_fields)] if v is not None}
         response = self._get(url, params=query_params)
         response.raise_for_status()
-        return response.json()
+        return ExpandedResponse(response.json())
+
+    def iter_sample_stream(self, backfill_minutes=None, tweet_fields=None, expansions=None, media_fields=None, poll_fields=None, user_fields=None, place_fields=None, timeout=None) -> Iterator[dict[str, Any]]:
+        """
+
+        Incrementally reads the `/2/tweets/sample/stream` stream, yielding one decoded message at a time as lines arrive on the chunked response so memory stays bounded for as long as the connection is open.
+
+        Args:
+            backfill_minutes (integer): The number of minutes (1 to 5) of missed streaming Tweets to backfill and receive upon reconnection, available for Academic Research access.
+            tweet_fields (array): A comma separated list of Tweet fields to display. Example: "['article', 'attachments', 'author_id', 'card_uri', 'context_annotations', 'conversation_id', 'created_at', 'edit_controls', 'edit_history_tweet_ids', 'entities', 'geo', 'id', 'in_reply_to_user_id', 'lang', 'non_public_metrics', 'note_tweet', 'organic_metrics', 'possibly_sensitive', 'promoted_metrics', 'public_metrics', 'referenced_tweets', 'reply_settings', 'scopes', 'source', 'text', 'username', 'withheld']".
+            expansions (array): A comma separated list of fields to expand. Example: "['article.cover_media', 'article.media_entities', 'attachments.media_keys', 'attachments.media_source_tweet', 'attachments.poll_ids', 'author_id', 'edit_history_tweet_ids', 'entities.mentions.username', 'geo.place_id', 'in_reply_to_user_id', 'entities.note.mentions.username', 'referenced_tweets.id', 'referenced_tweets.id.author_id', 'author_screen_name']".
+            media_fields (array): A comma separated list of Media fields to display. Example: "['alt_text', 'duration_ms', 'height', 'media_key', 'non_public_metrics', 'organic_metrics', 'preview_image_url', 'promoted_metrics', 'public_metrics', 'type', 'url', 'variants', 'width']".
+            poll_fields (array): A comma separated list of Poll fields to display. Example: "['duration_minutes', 'end_datetime', 'id', 'options', 'voting_status']".
+            user_fields (array): A comma separated list of User fields to display. Example: "['affiliation', 'connection_status', 'created_at', 'description', 'entities', 'id', 'location', 'most_recent_tweet_id', 'name', 'pinned_tweet_id', 'profile_banner_url', 'profile_image_url', 'protected', 'public_metrics', 'receives_your_dm', 'subscription_type', 'url', 'username', 'verified', 'verified_type', 'withheld']".
+            place_fields (array): A comma separated list of Place fields to display. Example: "['contained_within', 'country', 'country_code', 'full_name', 'geo', 'id', 'name', 'place_type']".
+            timeout (number): Optional read timeout in seconds; a connection that delivers neither data nor keep-alive heartbeats for this long raises a timeout error instead of blocking forever.
+
+        Yields:
+            dict[str, Any]: One decoded message per non-empty line of the stream.
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if a line of the stream cannot be parsed as JSON.
+
+        Tags:
+            Tweets
+        """
+        url = f'{self.main_app_client.base_url}/2/tweets/sample/stream'
+        query_params = {k: v for k, v in [('backfill_minutes', backfill_minutes), ('tweet.fields', tweet_fields), ('expansions', expansions), ('media.fields', media_fields), ('poll.fields', poll_fields), ('user.fields', user_fields), ('place.fields', place_fields)] if v is not None}
+        yield from self._stream(url, params=query_params, timeout=timeout)
 
     def get_tweets_sample_stream(self, partition, backfill_minutes=None, start_time=None, end_time=None, tweet_fields=None, expansions=None, media_fields=None, poll_fields=None, user_fields=None, place_fields=None) -> dict[str, Any]:
         """
@@ -416,7 +731,39 @@ class TweetsApi(APISegmentBase):
         query_params = {k: v for k, v in [('backfill_minutes', backfill_minutes), ('partition', partition), ('start_time', start_time), ('end_time', end_time), ('tweet.fields', tweet_fields), ('expansions', expansions), ('media.fields', media_fields), ('poll.fields', poll_fields), ('user.fields', user_fields), ('place.fields', place_fields)] if v is not None}
         response = self._get(url, params=query_params)
         response.raise_for_status()
-        return response.json()
+        return ExpandedResponse(response.json())
+
+    def iter_tweets_sample_stream(self, partition, backfill_minutes=None, start_time=None, end_time=None, tweet_fields=None, expansions=None, media_fields=None, poll_fields=None, user_fields=None, place_fields=None, timeout=None) -> Iterator[dict[str, Any]]:
+        """
+
+        Incrementally reads the `/2/tweets/sample10/stream` stream, yielding one decoded message at a time as lines arrive on the chunked response so memory stays bounded for as long as the connection is open.
+
+        Args:
+            partition (integer): The "partition" parameter specifies the partition number for the stream, which is required for the GET operation at path "/2/tweets/sample10/stream".
+            backfill_minutes (integer): The `backfill_minutes` parameter allows you to request up to five minutes of missed streaming data to be delivered upon reconnection, helping recover data lost during disconnections; it is only available for Academic Research access.
+            start_time (string): The `start_time` parameter specifies the earliest UTC timestamp from which tweets are returned, formatted as YYYY-MM-DDTHH:mm:ssZ (ISO 8601/RFC 3339), and is inclusive. Example: '2021-02-14T18:40:40.000Z'.
+            end_time (string): An optional string parameter specifying the end time in seconds since the Unix epoch for which to stop streaming Tweets. Example: '2021-02-14T18:40:40.000Z'.
+            tweet_fields (array): A comma separated list of Tweet fields to display. Example: "['article', 'attachments', 'author_id', 'card_uri', 'context_annotations', 'conversation_id', 'created_at', 'edit_controls', 'edit_history_tweet_ids', 'entities', 'geo', 'id', 'in_reply_to_user_id', 'lang', 'non_public_metrics', 'note_tweet', 'organic_metrics', 'possibly_sensitive', 'promoted_metrics', 'public_metrics', 'referenced_tweets', 'reply_settings', 'scopes', 'source', 'text', 'username', 'withheld']".
+            expansions (array): A comma separated list of fields to expand. Example: "['article.cover_media', 'article.media_entities', 'attachments.media_keys', 'attachments.media_source_tweet', 'attachments.poll_ids', 'author_id', 'edit_history_tweet_ids', 'entities.mentions.username', 'geo.place_id', 'in_reply_to_user_id', 'entities.note.mentions.username', 'referenced_tweets.id', 'referenced_tweets.id.author_id', 'author_screen_name']".
+            media_fields (array): A comma separated list of Media fields to display. Example: "['alt_text', 'duration_ms', 'height', 'media_key', 'non_public_metrics', 'organic_metrics', 'preview_image_url', 'promoted_metrics', 'public_metrics', 'type', 'url', 'variants', 'width']".
+            poll_fields (array): A comma separated list of Poll fields to display. Example: "['duration_minutes', 'end_datetime', 'id', 'options', 'voting_status']".
+            user_fields (array): A comma separated list of User fields to display. Example: "['affiliation', 'connection_status', 'created_at', 'description', 'entities', 'id', 'location', 'most_recent_tweet_id', 'name', 'pinned_tweet_id', 'profile_banner_url', 'profile_image_url', 'protected', 'public_metrics', 'receives_your_dm', 'subscription_type', 'url', 'username', 'verified', 'verified_type', 'withheld']".
+            place_fields (array): A comma separated list of Place fields to display. Example: "['contained_within', 'country', 'country_code', 'full_name', 'geo', 'id', 'name', 'place_type']".
+            timeout (number): Optional read timeout in seconds; a connection that delivers neither data nor keep-alive heartbeats for this long raises a timeout error instead of blocking forever.
+
+        Yields:
+            dict[str, Any]: One decoded message per non-empty line of the stream.
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if a line of the stream cannot be parsed as JSON.
+
+        Tags:
+            Tweets
+        """
+        url = f'{self.main_app_client.base_url}/2/tweets/sample10/stream'
+        query_params = {k: v for k, v in [('backfill_minutes', backfill_minutes), ('partition', partition), ('start_time', start_time), ('end_time', end_time), ('tweet.fields', tweet_fields), ('expansions', expansions), ('media.fields', media_fields), ('poll.fields', poll_fields), ('user.fields', user_fields), ('place.fields', place_fields)] if v is not None}
+        yield from self._stream(url, params=query_params, timeout=timeout)
 
     def tweets_fullarchive_search(self, query, start_time=None, end_time=None, since_id=None, until_id=None, max_results=None, next_token=None, pagination_token=None, sort_order=None, tweet_fields=None, expansions=None, media_fields=None, poll_fields=None, user_fields=None, place_fields=None) -> dict[str, Any]:
         """
@@ -454,7 +801,48 @@ class TweetsApi(APISegmentBase):
         query_params = {k: v for k, v in [('query', query), ('start_time', start_time), ('end_time', end_time), ('since_id', since_id), ('until_id', until_id), ('max_results', max_results), ('next_token', next_token), ('pagination_token', pagination_token), ('sort_order', sort_order), ('tweet.fields', tweet_fields), ('expansions', expansions), ('media.fields', media_fields), ('poll.fields', poll_fields), ('user.fields', user_fields), ('place.fields', place_fields)] if v is not None}
         response = self._get(url, params=query_params)
         response.raise_for_status()
-        return response.json()
+        return ExpandedResponse(response.json())
+
+    def iter_fullarchive_search(self, query, start_time=None, end_time=None, since_id=None, until_id=None, max_results=None, sort_order=None, tweet_fields=None, expansions=None, media_fields=None, poll_fields=None, user_fields=None, place_fields=None, shards=8, balanced=True, max_concurrency=DEFAULT_MAX_CONCURRENCY) -> Iterator[dict[str, Any]]:
+        """
+
+        Runs a full-archive search over `[start_time, end_time)` split into time shards whose pages are fetched concurrently, yielding the response pages newest shard first with Tweets already yielded removed.
+
+        Args:
+            query (string): Search query. Example: '(from:TwitterDev OR from:TwitterAPI) has:media -is:retweet'.
+            start_time (string): Earliest time to search from (ISO 8601). Defaults to the creation time of `since_id`, or the start of the archive.
+            end_time (string): Time to search up to, exclusive (ISO 8601). Defaults to the creation time of `until_id`, or just before now.
+            since_id (string): Only return Tweets with a greater ID.
+            until_id (string): Only return Tweets with a smaller ID.
+            max_results (integer): Tweets per page, at most 500.
+            sort_order (string): "recency" (default) yields Tweets newest first overall; with "relevancy" each shard is ordered by relevancy on its own.
+            tweet_fields (array): A comma separated list of Tweet fields to display.
+            expansions (array): A comma separated list of fields to expand.
+            media_fields (array): A comma separated list of Media fields to display.
+            poll_fields (array): A comma separated list of Poll fields to display.
+            user_fields (array): A comma separated list of User fields to display.
+            place_fields (array): A comma separated list of Place fields to display.
+            shards (integer): Number of time shards, or a list of `(start, end)` datetime ranges ordered newest first.
+            balanced (boolean): Size the shards from `tweet_counts_full_archive_search` so each holds about as many Tweets, instead of making them equally long.
+            max_concurrency (integer): Maximum number of shards paginated at once. Requests still wait for the endpoint's rate limit.
+
+        Yields:
+            dict[str, Any]: One search response page at a time.
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            ValueError: Raised if the time range is empty.
+
+        Tags:
+            Tweets
+        """
+        if isinstance(shards, int):
+            start, end = search_bounds(start_time, end_time, since_id, until_id)
+            if balanced:
+                shards = plan_shards(self.tweet_counts_full_archive_search, query, start, end, shards, since_id=since_id, until_id=until_id)
+            else:
+                shards = time_shards(start, end, shards)
+        yield from sharded_pages(self.tweets_fullarchive_search, query, shards, max_concurrency, since_id=since_id, until_id=until_id, max_results=max_results, sort_order=sort_order, tweet_fields=tweet_fields, expansions=expansions, media_fields=media_fields, poll_fields=poll_fields, user_fields=user_fields, place_fields=place_fields)
 
     def tweets_recent_search(self, query, start_time=None, end_time=None, since_id=None, until_id=None, max_results=None, next_token=None, pagination_token=None, sort_order=None, tweet_fields=None, expansions=None, media_fields=None, poll_fields=None, user_fields=None, place_fields=None) -> dict[str, Any]:
         """
@@ -492,7 +880,47 @@ class TweetsApi(APISegmentBase):
         query_params = {k: v for k, v in [('query', query), ('start_time', start_time), ('end_time', end_time), ('since_id', since_id), ('until_id', until_id), ('max_results', max_results), ('next_token', next_token), ('pagination_token', pagination_token), ('sort_order', sort_order), ('tweet.fields', tweet_fields), ('expansions', expansions), ('media.fields', media_fields), ('poll.fields', poll_fields), ('user.fields', user_fields), ('place.fields', place_fields)] if v is not None}
         response = self._get(url, params=query_params)
         response.raise_for_status()
-        return response.json()
+        return ExpandedResponse(response.json())
+
+    def iter_search_terms(self, terms, shared_filter=None, full_archive=False, start_time=None, end_time=None, since_id=None, until_id=None, max_results=None, sort_order=None, tweet_fields=None, expansions=None, media_fields=None, poll_fields=None, user_fields=None, place_fields=None, max_concurrency=DEFAULT_MAX_CONCURRENCY, max_length=None) -> Iterator[dict[str, Any]]:
+        """
+
+        Searches for Tweets matching any of an arbitrarily large set of terms by packing them into the fewest queries that fit the query length limit, running those concurrently and yielding their response pages query by query with Tweets matched by several queries returned once.
+
+        Args:
+            terms (array): Keywords, phrases or operators to OR together; bare multi-word terms are quoted as phrases.
+            shared_filter (string): Clauses every query carries, e.g. '-is:retweet lang:en'; parenthesized if it has a top-level OR.
+            full_archive (boolean): Search the full archive (1024 character queries) instead of the last seven days (512 characters).
+            start_time (string): Earliest time to search from (ISO 8601).
+            end_time (string): Time to search up to, exclusive (ISO 8601).
+            since_id (string): Only return Tweets with a greater ID.
+            until_id (string): Only return Tweets with a smaller ID.
+            max_results (integer): Tweets per page.
+            sort_order (string): "recency" or "relevancy", applied within each query.
+            tweet_fields (array): A comma separated list of Tweet fields to display.
+            expansions (array): A comma separated list of fields to expand.
+            media_fields (array): A comma separated list of Media fields to display.
+            poll_fields (array): A comma separated list of Poll fields to display.
+            user_fields (array): A comma separated list of User fields to display.
+            place_fields (array): A comma separated list of Place fields to display.
+            max_concurrency (integer): Maximum number of queries paginated at once.
+            max_length (integer): Length limit of one query, for access levels with other limits; defaults to 1024 with `full_archive` and 512 otherwise.
+
+        Yields:
+            dict[str, Any]: One search response page at a time.
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            ValueError: Raised if a single term does not fit into a query together with `shared_filter`.
+
+        Tags:
+            Tweets
+        """
+        search = self.tweets_fullarchive_search if full_archive else self.tweets_recent_search
+        if max_length is None:
+            max_length = MAX_ARCHIVE_QUERY_LENGTH if full_archive else MAX_QUERY_LENGTH
+        queries = pack_queries(terms, shared_filter, max_length)
+        yield from packed_pages(search, queries, max_concurrency, start_time=start_time, end_time=end_time, since_id=since_id, until_id=until_id, max_results=max_results, sort_order=sort_order, tweet_fields=tweet_fields, expansions=expansions, media_fields=media_fields, poll_fields=poll_fields, user_fields=user_fields, place_fields=place_fields)
 
     def search_stream(self, backfill_minutes=None, start_time=None, end_time=None, tweet_fields=None, expansions=None, media_fields=None, poll_fields=None, user_fields=None, place_fields=None) -> dict[str, Any]:
         """
@@ -524,7 +952,38 @@ class TweetsApi(APISegmentBase):
         query_params = {k: v for k, v in [('backfill_minutes', backfill_minutes), ('start_time', start_time), ('end_time', end_time), ('tweet.fields', tweet_fields), ('expansions', expansions), ('media.fields', media_fields), ('poll.fields', poll_fields), ('user.fields', user_fields), ('place.fields', place_fields)] if v is not None}
         response = self._get(url, params=query_params)
         response.raise_for_status()
-        return response.json()
+        return ExpandedResponse(response.json())
+
+    def iter_search_stream(self, backfill_minutes=None, start_time=None, end_time=None, tweet_fields=None, expansions=None, media_fields=None, poll_fields=None, user_fields=None, place_fields=None, timeout=None) -> Iterator[dict[str, Any]]:
+        """
+
+        Incrementally reads the `/2/tweets/search/stream` stream, yielding one decoded message at a time as lines arrive on the chunked response so memory stays bounded for as long as the connection is open.
+
+        Args:
+            backfill_minutes (integer): The "backfill_minutes" parameter allows clients to request up to five minutes of missed data upon reconnection, helping to recover Tweets that were missed due to a disconnection.
+            start_time (string): The "start_time" parameter specifies the earliest UTC timestamp (in ISO 8601 format) from which to include Tweets in the search results. Example: '2021-02-01T18:40:40.000Z'.
+            end_time (string): The timestamp (in ISO 8601/RFC 3339 format) specifying the exclusive upper bound of the time range for which Tweets will be returned. Example: '2021-02-14T18:40:40.000Z'.
+            tweet_fields (array): A comma separated list of Tweet fields to display. Example: "['article', 'attachments', 'author_id', 'card_uri', 'context_annotations', 'conversation_id', 'created_at', 'edit_controls', 'edit_history_tweet_ids', 'entities', 'geo', 'id', 'in_reply_to_user_id', 'lang', 'non_public_metrics', 'note_tweet', 'organic_metrics', 'possibly_sensitive', 'promoted_metrics', 'public_metrics', 'referenced_tweets', 'reply_settings', 'scopes', 'source', 'text', 'username', 'withheld']".
+            expansions (array): A comma separated list of fields to expand. Example: "['article.cover_media', 'article.media_entities', 'attachments.media_keys', 'attachments.media_source_tweet', 'attachments.poll_ids', 'author_id', 'edit_history_tweet_ids', 'entities.mentions.username', 'geo.place_id', 'in_reply_to_user_id', 'entities.note.mentions.username', 'referenced_tweets.id', 'referenced_tweets.id.author_id', 'author_screen_name']".
+            media_fields (array): A comma separated list of Media fields to display. Example: "['alt_text', 'duration_ms', 'height', 'media_key', 'non_public_metrics', 'organic_metrics', 'preview_image_url', 'promoted_metrics', 'public_metrics', 'type', 'url', 'variants', 'width']".
+            poll_fields (array): A comma separated list of Poll fields to display. Example: "['duration_minutes', 'end_datetime', 'id', 'options', 'voting_status']".
+            user_fields (array): A comma separated list of User fields to display. Example: "['affiliation', 'connection_status', 'created_at', 'description', 'entities', 'id', 'location', 'most_recent_tweet_id', 'name', 'pinned_tweet_id', 'profile_banner_url', 'profile_image_url', 'protected', 'public_metrics', 'receives_your_dm', 'subscription_type', 'url', 'username', 'verified', 'verified_type', 'withheld']".
+            place_fields (array): A comma separated list of Place fields to display. Example: "['contained_within', 'country', 'country_code', 'full_name', 'geo', 'id', 'name', 'place_type']".
+            timeout (number): Optional read timeout in seconds; a connection that delivers neither data nor keep-alive heartbeats for this long raises a timeout error instead of blocking forever.
+
+        Yields:
+            dict[str, Any]: One decoded message per non-empty line of the stream.
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if a line of the stream cannot be parsed as JSON.
+
+        Tags:
+            Tweets
+        """
+        url = f'{self.main_app_client.base_url}/2/tweets/search/stream'
+        query_params = {k: v for k, v in [('backfill_minutes', backfill_minutes), ('start_time', start_time), ('end_time', end_time), ('tweet.fields', tweet_fields), ('expansions', expansions), ('media.fields', media_fields), ('poll.fields', poll_fields), ('user.fields', user_fields), ('place.fields', place_fields)] if v is not None}
+        yield from self._stream(url, params=query_params, timeout=timeout)
 
     def get_rules(self, ids=None, max_results=None, pagination_token=None) -> dict[str, Any]:
         """
@@ -582,6 +1041,28 @@ class TweetsApi(APISegmentBase):
         response.raise_for_status()
         return response.json()
 
+    def sync_rules(self, desired, dry_run=False, batch_size=MAX_RULES_PER_REQUEST) -> RuleSyncReport:
+        """
+
+        Replaces the active filtered stream rules with a desired rule set using the fewest changes, keeping rules that are already active, validating new rules with a dry run and adding them before old rules are deleted so the stream keeps matching during the rollout.
+
+        Args:
+            desired (array): The complete desired rule set as objects with a `value` and an optional `tag`, e.g. from `pack_rules`.
+            dry_run (boolean): Only validate the changes and report what would be done.
+            batch_size (integer): Maximum number of rules added or deleted per request.
+
+        Returns:
+            RuleSyncReport: The rules added and deleted, the number of unchanged rules and requests made, and the remaining rule headroom.
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            ValueError: Raised if the API rejects any of the new rules.
+
+        Tags:
+            Tweets
+        """
+        return reconcile_rules(self, desired, dry_run, batch_size)
+
     def get_rule_count(self, rules_count_fields=None) -> dict[str, Any]:
         """
 
@@ -662,7 +1143,7 @@ class TweetsApi(APISegmentBase):
         query_params = {k: v for k, v in [('tweet.fields', tweet_fields), ('expansions', expansions), ('media.fields', media_fields), ('poll.fields', poll_fields), ('user.fields', user_fields), ('place.fields', place_fields)] if v is not None}
         response = self._get(url, params=query_params)
         response.raise_for_status()
-        return response.json()
+        return ExpandedResponse(response.json())
 
     def tweets_id_liking_users(self, id, max_results=None, pagination_token=None, user_fields=None, expansions=None, tweet_fields=None) -> dict[str, Any]:
         """
@@ -693,7 +1174,7 @@ class TweetsApi(APISegmentBase):
         query_params = {k: v for k, v in [('max_results', max_results), ('pagination_token', pagination_token), ('user.fields', user_fields), ('expansions', expansions), ('tweet.fields', tweet_fields)] if v is not None}
         response = self._get(url, params=query_params)
         response.raise_for_status()
-        return response.json()
+        return ExpandedResponse(response.json())
 
     def find_tweets_that_quote_atweet(self, id, max_results=None, pagination_token=None, exclude=None, tweet_fields=None, expansions=None, media_fields=None, poll_fields=None, user_fields=None, place_fields=None) -> dict[str, Any]:
         """
@@ -728,7 +1209,7 @@ class TweetsApi(APISegmentBase):
         query_params = {k: v for k, v in [('max_results', max_results), ('pagination_token', pagination_token), ('exclude', exclude), ('tweet.fields', tweet_fields), ('expansions', expansions), ('media.fields', media_fields), ('poll.fields', poll_fields), ('user.fields', user_fields), ('place.fields', place_fields)] if v is not None}
         response = self._get(url, params=query_params)
         response.raise_for_status()
-        return response.json()
+        return ExpandedResponse(response.json())
 
     def tweets_id_retweeting_users(self, id, max_results=None, pagination_token=None, user_fields=None, expansions=None, tweet_fields=None) -> dict[str, Any]:
         """
@@ -759,7 +1240,7 @@ class TweetsApi(APISegmentBase):
         query_params = {k: v for k, v in [('max_results', max_results), ('pagination_token', pagination_token), ('user.fields', user_fields), ('expansions', expansions), ('tweet.fields', tweet_fields)] if v is not None}
         response = self._get(url, params=query_params)
         response.raise_for_status()
-        return response.json()
+        return ExpandedResponse(response.json())
 
     def find_tweets_that_retweet_atweet(self, id, max_results=None, pagination_token=None, tweet_fields=None, expansions=None, media_fields=None, poll_fields=None, user_fields=None, place_fields=None) -> dict[str, Any]:
         """
@@ -793,7 +1274,7 @@ class TweetsApi(APISegmentBase):
         query_params = {k: v for k, v in [('max_results', max_results), ('pagination_token', pagination_token), ('tweet.fields', tweet_fields), ('expansions', expansions), ('media.fields', media_fields), ('poll.fields', poll_fields), ('user.fields', user_fields), ('place.fields', place_fields)] if v is not None}
         response = self._get(url, params=query_params)
         response.raise_for_status()
-        return response.json()
+        return ExpandedResponse(response.json())
 
     def hide_reply_by_id(self, tweet_id, hidden=None) -> dict[str, Any]:
         """
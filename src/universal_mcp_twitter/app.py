@@ -1,6 +1,7 @@
-from typing import Any
+import httpx
 from universal_mcp.applications import APIApplication
 from universal_mcp.integrations import Integration
+
 from .api_segments.compliance_api import ComplianceApi
 from .api_segments.dm_conversations_api import DmConversationsApi
 from .api_segments.dm_events_api import DmEventsApi
@@ -12,12 +13,36 @@ from .api_segments.trends_api import TrendsApi
 from .api_segments.tweets_api import TweetsApi
 from .api_segments.usage_api import UsageApi
 from .api_segments.users_api import UsersApi
+from .cache import ResponseCache
+from .hydration import HydrationStore
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy
+from .transport import ConnectionPoolConfig, build_client
+from .user_index import UserIndex
 
-class TwitterApp(APIApplication):
 
-    def __init__(self, integration: Integration=None, **kwargs) -> None:
-        super().__init__(name='twitter', integration=integration, **kwargs)
-        self.base_url = 'https://api.twitter.com'
+class TwitterApp(APIApplication):
+    def __init__(
+        self,
+        integration: Integration = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        pool_config: ConnectionPoolConfig | None = None,
+        response_cache: ResponseCache | None = None,
+        user_index: UserIndex | None = None,
+        hydration_store: HydrationStore | None = None,
+        **kwargs,
+    ) -> None:
+        super().__init__(name="twitter", integration=integration, **kwargs)
+        self.base_url = "https://api.twitter.com"
+        self.rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter()
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.pool_config = (
+            pool_config if pool_config is not None else ConnectionPoolConfig()
+        )
+        self.response_cache = response_cache
+        self.user_index = user_index
+        self.hydration_store = hydration_store
         self.compliance = ComplianceApi(self)
         self.dm_conversations = DmConversationsApi(self)
         self.dm_events = DmEventsApi(self)
@@ -30,6 +55,19 @@ class TwitterApp(APIApplication):
         self.usage = UsageApi(self)
         self.users = UsersApi(self)
 
+    @property
+    def client(self) -> httpx.Client:
+        if getattr(self, "_client", None) is None:
+            self._client = build_client(
+                self.pool_config, base_url=self.base_url, headers=self._get_headers()
+            )
+        return self._client
+
+    def close(self) -> None:
+        if getattr(self, "_client", None) is not None:
+            self._client.close()
+            self._client = None
+
     def list_tools(self):
         all_tools = []
         all_tools.extend(self.compliance.list_tools())
@@ -43,4 +81,4 @@ class TwitterApp(APIApplication):
         all_tools.extend(self.tweets.list_tools())
         all_tools.extend(self.usage.list_tools())
         all_tools.extend(self.users.list_tools())
-        return all_tools
\ No newline at end of file
+        return all_tools
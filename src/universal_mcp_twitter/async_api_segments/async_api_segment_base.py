@@ -0,0 +1,233 @@
+import asyncio
+import json
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import closing
+from http import HTTPStatus
+from typing import Any
+
+import httpx
+
+from ..batching import iter_ids, normalize_username
+from ..endpoints import endpoint_template
+from ..user_index import UserIndex, is_user_id
+
+
+class AsyncAPISegmentBase:
+    def __init__(self, main_app_client: Any):
+        self.main_app_client = main_app_client
+
+    async def _get(self, url: str, params: dict = None, **kwargs):
+        cache = self.main_app_client.response_cache
+        if cache is not None and (cached := cache.get(url, params)) is not None:
+            return cached
+        response = await self._request(
+            "GET", url, lambda: self.main_app_client._get(url, params=params, **kwargs)
+        )
+        if cache is not None:
+            cache.put(url, params, response)
+        await self._observe(url, params, response)
+        return response
+
+    async def _post(
+        self,
+        url: str,
+        data: Any = None,
+        files: Any = None,
+        params: dict = None,
+        content_type: str = None,
+        **kwargs,
+    ):
+        return await self._write(
+            "POST",
+            url,
+            lambda: self.main_app_client._post(
+                url,
+                data=data,
+                files=files,
+                params=params,
+                content_type=content_type,
+                **kwargs,
+            ),
+        )
+
+    async def _put(
+        self,
+        url: str,
+        data: Any = None,
+        files: Any = None,
+        params: dict = None,
+        content_type: str = None,
+        **kwargs,
+    ):
+        return await self._write(
+            "PUT",
+            url,
+            lambda: self.main_app_client._put(
+                url,
+                data=data,
+                files=files,
+                params=params,
+                content_type=content_type,
+                **kwargs,
+            ),
+        )
+
+    async def _patch(self, url: str, data: Any = None, params: dict = None, **kwargs):
+        return await self._write(
+            "PATCH",
+            url,
+            lambda: self.main_app_client._patch(
+                url, data=data, params=params, **kwargs
+            ),
+        )
+
+    async def _delete(self, url: str, params: dict = None, **kwargs):
+        return await self._write(
+            "DELETE",
+            url,
+            lambda: self.main_app_client._delete(url, params=params, **kwargs),
+        )
+
+    async def _write(self, method: str, url: str, send: Callable[[], Awaitable[Any]]):
+        """Sends a write request and evicts cached responses for what it touched."""
+        response = await self._request(method, url, send)
+        cache = self.main_app_client.response_cache
+        if cache is not None:
+            cache.invalidate(url)
+        return response
+
+    async def _observe(self, url: str, params: dict, response: Any) -> None:
+        """Async counterpart of ``APISegmentBase._observe``.
+
+        The user index and hydration store may write to SQLite, so they are fed
+        in a worker thread instead of blocking the event loop.
+        """
+        index = self.main_app_client.user_index
+        if index is not None and not index.observes(response):
+            index = None
+        store = self.main_app_client.hydration_store
+        if store is not None and not store.observes(url, params):
+            store = None
+        if index is None and store is None:
+            return
+        try:
+            payload = response.json()
+        except ValueError:
+            return
+        if index is not None:
+            await asyncio.to_thread(index.observe, payload)
+        if store is not None:
+            await asyncio.to_thread(store.observe, url, params, payload)
+
+    async def _lookup_stored(
+        self, kind: str, ids: list[str], fields: Any
+    ) -> dict[str, dict[str, Any]]:
+        """Async counterpart of ``APISegmentBase._lookup_stored``.
+
+        The store is read in a worker thread, off the event loop.
+        """
+        store = self.main_app_client.hydration_store
+        return (
+            await asyncio.to_thread(store.lookup, kind, ids, fields)
+            if store is not None
+            else {}
+        )
+
+    async def _resolve_user_id(self, value: Any) -> Any:
+        """Returns the user id for ``value``, which may also be a username or handle.
+
+        Usernames are looked up in the app's user index first and fetched with
+        ``find_user_by_username`` only on a miss.
+        """
+        if value is None or is_user_id(value):
+            return value
+        username = normalize_username(value)
+        index = self.main_app_client.user_index
+        if index is not None and (user_id := index.id_for(username)) is not None:
+            return user_id
+        data = (await self.main_app_client.users.find_user_by_username(username)).get(
+            "data"
+        )
+        if not data:
+            raise ValueError(f"Unknown username: '{value}'")
+        if index is not None:
+            await asyncio.to_thread(index.add, data["id"], data["username"])
+        return data["id"]
+
+    async def _resolve_user_ids(self, values: Any) -> list[str] | None:
+        """Async counterpart of ``APISegmentBase._resolve_user_ids``."""
+        if values is None:
+            return None
+        values = list(iter_ids(values))
+        if all(is_user_id(value) for value in values):
+            return values
+        users = self.main_app_client.users
+        index = self.main_app_client.user_index
+        if index is not None:
+            return await index.aresolve_ids(users, values)
+        with closing(UserIndex()) as index:
+            return await index.aresolve_ids(users, values)
+
+    async def _request(self, method: str, url: str, send: Callable[[], Awaitable[Any]]):
+        """Async counterpart of ``APISegmentBase._request``.
+
+        Shares the app's rate limiter and retry policy, but waits with
+        ``asyncio.sleep`` so other requests keep running on the event loop.
+        """
+        limiter = self.main_app_client.rate_limiter
+        retry_policy = self.main_app_client.retry_policy
+        key = f"{method} {endpoint_template(url)}"
+        if retry_policy is not None:
+            retry_policy.record_request()
+        attempt = rate_limited = 0
+        while True:
+            if limiter is not None:
+                await limiter.acquire_async(key)
+            response = error = None
+            try:
+                response = await send()
+            except httpx.HTTPStatusError as e:
+                response, error = e.response, e
+            except httpx.TransportError as e:
+                error = e
+            if limiter is not None:
+                if response is not None:
+                    limiter.update(key, response)
+                else:
+                    limiter.refund(key)
+            if (
+                response is not None
+                and response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+            ):
+                if limiter is not None and rate_limited < limiter.max_retries:
+                    rate_limited += 1
+                    continue
+            elif retry_policy is not None and retry_policy.should_retry(
+                method, attempt, response, error
+            ):
+                await asyncio.sleep(
+                    retry_policy.schedule_retry(key, attempt, response, error)
+                )
+                attempt += 1
+                continue
+            if error is not None:
+                raise error
+            return response
+
+    async def _stream(
+        self, url: str, params: dict = None, timeout: float = None, **kwargs
+    ) -> AsyncIterator[Any]:
+        """Yields one decoded JSON message per line of a long-lived streaming response.
+
+        The body is consumed incrementally, so memory use is bounded by the size of
+        a single message. Blank lines are keep-alive heartbeats and are skipped.
+        """
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+        async with self.main_app_client.async_client.stream(
+            "GET", url, params=params, **kwargs
+        ) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if line.strip():
+                    yield json.loads(line)
@@ -0,0 +1,162 @@
+from typing import Any
+
+import httpx
+from universal_mcp.applications import APIApplication
+from universal_mcp.integrations import Integration
+
+from .async_api_segments.compliance_api import AsyncComplianceApi
+from .async_api_segments.dm_conversations_api import AsyncDmConversationsApi
+from .async_api_segments.dm_events_api import AsyncDmEventsApi
+from .async_api_segments.likes_api import AsyncLikesApi
+from .async_api_segments.lists_api import AsyncListsApi
+from .async_api_segments.openapi_json_api import AsyncOpenapiJsonApi
+from .async_api_segments.spaces_api import AsyncSpacesApi
+from .async_api_segments.trends_api import AsyncTrendsApi
+from .async_api_segments.tweets_api import AsyncTweetsApi
+from .async_api_segments.usage_api import AsyncUsageApi
+from .async_api_segments.users_api import AsyncUsersApi
+from .cache import ResponseCache
+from .hydration import HydrationStore
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy
+from .transport import ConnectionPoolConfig, build_async_client
+from .user_index import UserIndex
+
+
+class AsyncTwitterApp(APIApplication):
+    """Asyncio variant of :class:`~universal_mcp_twitter.app.TwitterApp`.
+
+    Every segment method is a coroutine and all of them share one pooled
+    ``httpx.AsyncClient`` configured by ``pool_config``, so many requests can be
+    in flight on a single event loop. Close the app with :meth:`aclose` (or use
+    it as an async context manager) to release the pooled connections.
+    """
+
+    def __init__(
+        self,
+        integration: Integration = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        pool_config: ConnectionPoolConfig | None = None,
+        response_cache: ResponseCache | None = None,
+        user_index: UserIndex | None = None,
+        hydration_store: HydrationStore | None = None,
+        **kwargs,
+    ) -> None:
+        super().__init__(name="twitter", integration=integration, **kwargs)
+        self.base_url = "https://api.twitter.com"
+        self.rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter()
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.pool_config = (
+            pool_config if pool_config is not None else ConnectionPoolConfig()
+        )
+        self.response_cache = response_cache
+        self.user_index = user_index
+        self.hydration_store = hydration_store
+        self._async_client: httpx.AsyncClient | None = None
+        self.compliance = AsyncComplianceApi(self)
+        self.dm_conversations = AsyncDmConversationsApi(self)
+        self.dm_events = AsyncDmEventsApi(self)
+        self.likes = AsyncLikesApi(self)
+        self.lists = AsyncListsApi(self)
+        self.openapi_json = AsyncOpenapiJsonApi(self)
+        self.spaces = AsyncSpacesApi(self)
+        self.trends = AsyncTrendsApi(self)
+        self.tweets = AsyncTweetsApi(self)
+        self.usage = AsyncUsageApi(self)
+        self.users = AsyncUsersApi(self)
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """The pooled async HTTP client shared by every segment, made on first use."""
+        if self._async_client is None:
+            self._async_client = build_async_client(
+                self.pool_config, base_url=self.base_url, headers=self._get_headers()
+            )
+        return self._async_client
+
+    async def aclose(self) -> None:
+        """Closes the pooled async HTTP client."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
+    async def __aenter__(self) -> "AsyncTwitterApp":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def _get(
+        self, url: str, params: dict[str, Any] | None = None
+    ) -> httpx.Response:
+        response = await self.async_client.get(url, params=params)
+        response.raise_for_status()
+        return response
+
+    async def _post(
+        self,
+        url: str,
+        data: Any = None,
+        params: dict[str, Any] | None = None,
+        content_type: str = "application/json",
+        files: Any = None,
+    ) -> httpx.Response:
+        response = await self.async_client.post(
+            url, params=params, **_body_kwargs(data, files, content_type)
+        )
+        response.raise_for_status()
+        return response
+
+    async def _put(
+        self,
+        url: str,
+        data: Any = None,
+        params: dict[str, Any] | None = None,
+        content_type: str = "application/json",
+        files: Any = None,
+    ) -> httpx.Response:
+        response = await self.async_client.put(
+            url, params=params, **_body_kwargs(data, files, content_type)
+        )
+        response.raise_for_status()
+        return response
+
+    async def _patch(
+        self, url: str, data: Any = None, params: dict[str, Any] | None = None
+    ) -> httpx.Response:
+        response = await self.async_client.patch(url, params=params, json=data)
+        response.raise_for_status()
+        return response
+
+    async def _delete(
+        self, url: str, params: dict[str, Any] | None = None
+    ) -> httpx.Response:
+        response = await self.async_client.delete(url, params=params)
+        response.raise_for_status()
+        return response
+
+    def list_tools(self):
+        all_tools = []
+        all_tools.extend(self.compliance.list_tools())
+        all_tools.extend(self.dm_conversations.list_tools())
+        all_tools.extend(self.dm_events.list_tools())
+        all_tools.extend(self.likes.list_tools())
+        all_tools.extend(self.lists.list_tools())
+        all_tools.extend(self.openapi_json.list_tools())
+        all_tools.extend(self.spaces.list_tools())
+        all_tools.extend(self.trends.list_tools())
+        all_tools.extend(self.tweets.list_tools())
+        all_tools.extend(self.usage.list_tools())
+        all_tools.extend(self.users.list_tools())
+        return all_tools
+
+
+def _body_kwargs(data: Any, files: Any, content_type: str | None) -> dict[str, Any]:
+    if content_type in (None, "application/json"):
+        return {"json": data}
+    if content_type == "multipart/form-data":
+        return {"data": data, "files": files}
+    if content_type == "application/x-www-form-urlencoded":
+        return {"data": data}
+    return {"content": data, "headers": {"Content-Type": content_type}}
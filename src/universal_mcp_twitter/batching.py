@@ -0,0 +1,190 @@
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Lookup endpoints such as GET /2/tweets and GET /2/users accept at most this
+# many ids (or usernames) per request.
+MAX_IDS_PER_REQUEST = 100
+
+DEFAULT_MAX_CONCURRENCY = 8
+
+# Field that identifies an object in each ``includes`` collection.
+INCLUDES_KEYS = {
+    "media": "media_key",
+    "places": "id",
+    "polls": "id",
+    "tweets": "id",
+    "users": "id",
+    "topics": "id",
+}
+
+
+def iter_ids(ids: str | int | Iterable[str | int]) -> Iterator[str]:
+    """Yields ids as strings from a comma separated string or any iterable."""
+    if isinstance(ids, str):
+        ids = ids.split(",")
+    elif isinstance(ids, int):
+        ids = (ids,)
+    for value in ids:
+        if text := str(value).strip():
+            yield text
+
+
+def chunked(iterable: Iterable[T], size: int) -> Iterator[list[T]]:
+    """Lazily splits ``iterable`` into lists of at most ``size`` items."""
+    if size < 1:
+        raise ValueError("size must be at least 1")
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def fan_out(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> Iterator[R]:
+    """Applies ``fn`` to ``items`` on a thread pool and yields results in input order.
+
+    At most ``max_concurrency`` calls are in flight at once and ``items`` is
+    consumed lazily, so arbitrarily long inputs run in bounded memory. The first
+    exception raised by ``fn`` propagates to the caller.
+    """
+    if max_concurrency <= 1:
+        yield from map(fn, items)
+        return
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        pending = deque()
+        try:
+            for item in items:
+                pending.append(executor.submit(fn, item))
+                if len(pending) >= max_concurrency:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def batched_lookup(
+    fetch: Callable[[str], dict[str, Any]],
+    values: Iterable[str],
+    batch_size: int = MAX_IDS_PER_REQUEST,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> Iterator[dict[str, Any]]:
+    """Calls a lookup endpoint once per comma joined batch of ``values``.
+
+    Yields each batch's response in input order while up to ``max_concurrency``
+    batches are fetched concurrently.
+    """
+    if not 1 <= batch_size <= MAX_IDS_PER_REQUEST:
+        raise ValueError(f"batch_size must be between 1 and {MAX_IDS_PER_REQUEST}.")
+    batches = (",".join(batch) for batch in chunked(values, batch_size))
+    yield from fan_out(fetch, batches, max_concurrency)
+
+
+async def afan_out(
+    fn: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> AsyncIterator[R]:
+    """Async counterpart of :func:`fan_out` for coroutine functions."""
+    pending: deque = deque()
+    try:
+        for item in items:
+            pending.append(asyncio.ensure_future(fn(item)))
+            if len(pending) >= max_concurrency:
+                yield await pending.popleft()
+        while pending:
+            yield await pending.popleft()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def abatched_lookup(
+    fetch: Callable[[str], Awaitable[dict[str, Any]]],
+    values: Iterable[str],
+    batch_size: int = MAX_IDS_PER_REQUEST,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> AsyncIterator[dict[str, Any]]:
+    """Async counterpart of :func:`batched_lookup` for coroutine lookup methods."""
+    if not 1 <= batch_size <= MAX_IDS_PER_REQUEST:
+        raise ValueError(f"batch_size must be between 1 and {MAX_IDS_PER_REQUEST}.")
+    batches = (",".join(batch) for batch in chunked(values, batch_size))
+    async for response in afan_out(fetch, batches, max_concurrency):
+        yield response
+
+
+def merge_responses(responses: Iterable[dict[str, Any]]) -> dict[str, Any]:
+    """Merges lookup responses into one, concatenating ``data`` and ``errors``.
+
+    ``includes`` collections are concatenated with objects already seen in an
+    earlier response dropped, so an author shared by many batches appears once.
+    """
+    data: list = []
+    errors: list = []
+    includes: dict[str, list] = {}
+    included_keys: dict[str, set] = {}
+    for response in responses:
+        batch_data = response.get("data")
+        if isinstance(batch_data, list):
+            data.extend(batch_data)
+        elif batch_data is not None:
+            data.append(batch_data)
+        errors.extend(response.get("errors", ()))
+        for name, objects in response.get("includes", {}).items():
+            merged = includes.setdefault(name, [])
+            seen = included_keys.setdefault(name, set())
+            key_field = INCLUDES_KEYS.get(name, "id")
+            for obj in objects:
+                key = obj.get(key_field)
+                if key is None:
+                    merged.append(obj)
+                elif key not in seen:
+                    seen.add(key)
+                    merged.append(obj)
+    merged_response: dict[str, Any] = {}
+    if data:
+        merged_response["data"] = data
+    if includes:
+        merged_response["includes"] = includes
+    if errors:
+        merged_response["errors"] = errors
+    return merged_response
+
+
+def index_lookup_responses(
+    responses: Iterable[dict[str, Any]],
+    key: str = "id",
+    normalize: Callable[[str], str] = str,
+) -> dict[str, Any]:
+    """Merges lookup responses into objects and errors keyed by the looked-up value.
+
+    ``data`` objects are keyed by ``normalize(obj[key])`` and per-item errors by
+    ``normalize(error["value"])``, so callers can tell exactly which requested
+    ids or usernames failed. ``includes`` are merged as in :func:`merge_responses`.
+    Errors that do not refer to a single requested value are kept under ``None``.
+    """
+    merged = merge_responses(responses)
+    data = {normalize(obj[key]): obj for obj in merged.get("data", ()) if key in obj}
+    errors: dict[str | None, Any] = {}
+    for error in merged.get("errors", ()):
+        value = error.get("value")
+        if isinstance(value, str):
+            errors[normalize(value)] = error
+        else:
+            errors.setdefault(None, []).append(error)
+    return {"data": data, "includes": merged.get("includes", {}), "errors": errors}
+
+
+def normalize_username(username: str) -> str:
+    """Returns ``username`` without a leading ``@`` and in lower case."""
+    return username.strip().lstrip("@").lower()
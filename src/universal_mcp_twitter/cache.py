@@ -0,0 +1,165 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from http import HTTPStatus
+from typing import Any
+from urllib.parse import urlencode, urlsplit
+
+from .endpoints import endpoint_template
+
+# Default time-to-live in seconds of the idempotent lookup endpoints that are
+# cached. Endpoints not listed here are never cached.
+DEFAULT_TTLS = {
+    "/2/users/{id}": 300.0,
+    "/2/users/by/username/{username}": 300.0,
+    "/2/users/me": 300.0,
+    "/2/lists/{id}": 300.0,
+    "/2/spaces/{id}": 30.0,
+    "/2/trends/by/woeid/{id}": 300.0,
+    "/2/tweets/{id}": 60.0,
+}
+
+
+# Segments of a ``/2/<collection>/<id>`` path split on "/", the empty one first.
+_RESOURCE_SEGMENTS = 4
+
+
+def resource_path(url: str) -> str | None:
+    """Returns the ``/2/<collection>/<id>`` prefix a URL belongs to, if any."""
+    segments = urlsplit(url).path.rstrip("/").split("/")
+    if len(segments) < _RESOURCE_SEGMENTS:
+        return None
+    return "/".join(segments[:_RESOURCE_SEGMENTS])
+
+
+class ResponseCache:
+    """Size-bounded LRU cache of GET responses with per-endpoint TTLs.
+
+    Entries are keyed on the request path and its normalized query parameters,
+    so calls with identical arguments share an entry regardless of parameter
+    order. Only endpoints with a TTL in ``ttls`` are cached. Every entry is also
+    indexed under the resource it describes (``/2/users/2244994945`` for both a
+    lookup by id and one by username), and a successful write to a URL under that
+    resource, such as ``list_id_update`` or ``users_id_follow``, evicts it.
+
+    Hits, misses, evictions and invalidations are counted in ``stats``.
+    """
+
+    def __init__(
+        self,
+        ttls: dict[str, float] | None = None,
+        max_entries: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            ttls: Seconds to cache each endpoint template for. Defaults to
+                :data:`DEFAULT_TTLS`.
+            max_entries: Number of responses kept before the least recently used
+                one is evicted.
+            clock: Returns the current monotonic time in seconds.
+        """
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.max_entries = max_entries
+        self.clock = clock
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+        self._entries: OrderedDict[str, tuple[float, Any, tuple[str, ...]]] = (
+            OrderedDict()
+        )
+        self._by_resource: dict[str, set[str]] = {}
+        self._lock = threading.Lock()
+
+    def ttl_for(self, url: str) -> float | None:
+        return self.ttls.get(endpoint_template(url))
+
+    def get(self, url: str, params: dict[str, Any] | None = None) -> Any:
+        """Returns the cached response for the request, or ``None``."""
+        if self.ttl_for(url) is None:
+            return None
+        key = _cache_key(url, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+            expires_at, response, _ = entry
+            if expires_at <= self.clock():
+                self._remove(key)
+                self.stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return response
+
+    def put(self, url: str, params: dict[str, Any] | None, response: Any) -> None:
+        """Caches a successful response if its endpoint has a TTL."""
+        ttl = self.ttl_for(url)
+        if ttl is None or response.status_code != HTTPStatus.OK:
+            return
+        key = _cache_key(url, params)
+        resources = {resource_path(url)}
+        data = _response_data(response)
+        collection = urlsplit(url).path.split("/")[2]
+        if isinstance(data, dict) and "id" in data:
+            resources.add(f"/2/{collection}/{data['id']}")
+        resources.discard(None)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (self.clock() + ttl, response, tuple(resources))
+            for resource in resources:
+                self._by_resource.setdefault(resource, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self.stats["evictions"] += 1
+
+    def invalidate(self, url: str) -> None:
+        """Evicts every entry describing the resource a write to ``url`` touched."""
+        resource = resource_path(url)
+        if resource is None:
+            return
+        with self._lock:
+            for key in list(self._by_resource.get(resource, ())):
+                self._remove(key)
+                self.stats["invalidations"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_resource.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: str) -> None:
+        _, _, resources = self._entries.pop(key)
+        for resource in resources:
+            keys = self._by_resource.get(resource)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_resource[resource]
+
+
+def _cache_key(url: str, params: dict[str, Any] | None) -> str:
+    path = urlsplit(url).path
+    if not params:
+        return path
+    normalized = sorted(
+        (
+            name,
+            ",".join(map(str, value))
+            if isinstance(value, list | tuple)
+            else str(value),
+        )
+        for name, value in params.items()
+    )
+    return f"{path}?{urlencode(normalized)}"
+
+
+def _response_data(response: Any) -> Any:
+    try:
+        return response.json().get("data")
+    except (ValueError, AttributeError):
+        return None
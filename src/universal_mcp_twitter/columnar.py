@@ -0,0 +1,226 @@
+from array import array
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+# Typecode of the buffer backing each kind of column. Strings have no fixed
+# width and are kept in a list.
+_TYPECODES = {"int64": "q", "timestamp": "q", "bool": "b"}
+
+
+@dataclass(frozen=True)
+class Column:
+    """One output column: a name, the path of the value in each object and its type.
+
+    ``kind`` is ``"int64"`` (ids and counts), ``"timestamp"`` (ISO 8601 strings,
+    stored as epoch milliseconds), ``"bool"`` or ``"str"``.
+    """
+
+    name: str
+    path: tuple[str, ...]
+    kind: str
+
+
+def _metrics(prefix: str, names: Iterable[str]) -> tuple[Column, ...]:
+    return tuple(Column(name, (prefix, name), "int64") for name in names)
+
+
+TWEET_COLUMNS = (
+    Column("id", ("id",), "int64"),
+    Column("author_id", ("author_id",), "int64"),
+    Column("conversation_id", ("conversation_id",), "int64"),
+    Column("created_at", ("created_at",), "timestamp"),
+    Column("lang", ("lang",), "str"),
+    Column("text", ("text",), "str"),
+    *_metrics(
+        "public_metrics",
+        (
+            "retweet_count",
+            "reply_count",
+            "like_count",
+            "quote_count",
+            "bookmark_count",
+            "impression_count",
+        ),
+    ),
+)
+
+USER_COLUMNS = (
+    Column("id", ("id",), "int64"),
+    Column("username", ("username",), "str"),
+    Column("name", ("name",), "str"),
+    Column("created_at", ("created_at",), "timestamp"),
+    Column("protected", ("protected",), "bool"),
+    Column("verified", ("verified",), "bool"),
+    *_metrics(
+        "public_metrics",
+        (
+            "followers_count",
+            "following_count",
+            "tweet_count",
+            "listed_count",
+            "like_count",
+        ),
+    ),
+)
+
+
+def _parse(kind: str, value: Any) -> Any:
+    if kind == "int64":
+        return int(value)
+    if kind == "timestamp":
+        return int(datetime.fromisoformat(value).timestamp() * 1000)
+    if kind == "bool":
+        return bool(value)
+    return value
+
+
+class ColumnarAccumulator:
+    """Streams response pages into typed column buffers.
+
+    Each page's ``data`` is copied straight into one buffer per column, backed
+    by ``array('q')`` for ids, counts and timestamps, so a corpus costs 8 bytes
+    per numeric value and no list of dicts is ever kept. Missing values are
+    tracked in a validity mask per column that is only allocated once a value is
+    actually missing. The result is exported as a NumPy structured array or an
+    Arrow table, which require the optional ``numpy`` and ``pyarrow`` packages
+    (``pip install universal-mcp-twitter[columnar]``).
+
+    Example:
+        columns = ColumnarAccumulator(TWEET_COLUMNS)
+        search = app.tweets.tweets_recent_search
+        columns.extend(iter_pages(search, "python", max_results=100))
+        table = columns.to_arrow()
+    """
+
+    def __init__(self, columns: Iterable[Column] = TWEET_COLUMNS) -> None:
+        self.columns = tuple(columns)
+        self.buffers: dict[str, Any] = {
+            column.name: array(_TYPECODES[column.kind])
+            if column.kind in _TYPECODES
+            else []
+            for column in self.columns
+        }
+        self._missing: dict[str, bytearray] = {}
+        self._rows = 0
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def add(self, obj: dict[str, Any]) -> None:
+        """Appends one object as a row.
+
+        Raises:
+            ValueError: Raised if a value cannot be parsed; no column is changed.
+        """
+        row = self._rows
+        values = []
+        for column in self.columns:
+            value = obj
+            for key in column.path:
+                value = value.get(key) if isinstance(value, dict) else None
+            values.append(None if value is None else _parse(column.kind, value))
+        for column, value in zip(self.columns, values):
+            buffer = self.buffers[column.name]
+            if value is None:
+                missing = self._missing.get(column.name)
+                if missing is None:
+                    missing = self._missing[column.name] = bytearray(row)
+                missing.append(1)
+                buffer.append(None if isinstance(buffer, list) else 0)
+                continue
+            buffer.append(value)
+            if column.name in self._missing:
+                self._missing[column.name].append(0)
+        self._rows += 1
+
+    def add_page(self, page: dict[str, Any]) -> None:
+        """Appends every object of a response's ``data``."""
+        data = page.get("data")
+        if data is None:
+            return
+        for obj in data if isinstance(data, list) else (data,):
+            self.add(obj)
+
+    def extend(self, pages: Iterable[dict[str, Any]]) -> "ColumnarAccumulator":
+        """Appends every page of an iterable such as :func:`.pagination.iter_pages`."""
+        for page in pages:
+            self.add_page(page)
+        return self
+
+    def missing(self, name: str) -> bytearray | None:
+        """Returns the validity mask of column ``name`` (1 = missing).
+
+        ``None`` is returned if no value is missing.
+        """
+        return self._missing.get(name)
+
+    def to_numpy(self) -> Any:
+        """Returns the rows as a NumPy structured array.
+
+        Ids and counts are ``int64`` (missing values are 0), timestamps are
+        ``datetime64[ms]`` (missing values are ``NaT``), booleans are ``bool`` and
+        strings are Python objects (missing values are ``None``).
+        """
+        np = _require("numpy")
+        dtypes = {"int64": "i8", "timestamp": "M8[ms]", "bool": "?", "str": "O"}
+        result = np.empty(
+            self._rows,
+            dtype=[(column.name, dtypes[column.kind]) for column in self.columns],
+        )
+        for column in self.columns:
+            buffer = self.buffers[column.name]
+            if column.kind == "str":
+                result[column.name] = buffer
+                continue
+            values = np.frombuffer(
+                buffer, dtype="i1" if column.kind == "bool" else "i8"
+            )
+            if column.kind == "timestamp":
+                values = values.view("M8[ms]").copy()
+                if (missing := self._missing.get(column.name)) is not None:
+                    values[np.frombuffer(missing, dtype="?")] = np.datetime64("NaT")
+            result[column.name] = values
+        return result
+
+    def to_arrow(self) -> Any:
+        """Returns the rows as a ``pyarrow.Table`` with nulls for missing values."""
+        pa = _require("pyarrow")
+        import pyarrow.compute as pc  # noqa: PLC0415 - optional dependency
+
+        types = {
+            "int64": pa.int64(),
+            "timestamp": pa.timestamp("ms", tz="UTC"),
+            "bool": pa.int8(),
+        }
+        arrays = []
+        for column in self.columns:
+            buffer = self.buffers[column.name]
+            if column.kind == "str":
+                arrays.append(pa.array(buffer, type=pa.string()))
+                continue
+            values = pa.Array.from_buffers(
+                types[column.kind], self._rows, [None, pa.py_buffer(buffer.tobytes())]
+            )
+            if column.kind == "bool":
+                values = values.cast(pa.bool_())
+            if (missing := self._missing.get(column.name)) is not None:
+                mask = pa.Array.from_buffers(
+                    pa.uint8(), self._rows, [None, pa.py_buffer(bytes(missing))]
+                ).cast(pa.bool_())
+                values = pc.if_else(mask, pa.scalar(None, values.type), values)
+            arrays.append(values)
+        return pa.Table.from_arrays(
+            arrays, names=[column.name for column in self.columns]
+        )
+
+
+def _require(module: str) -> Any:
+    try:
+        return __import__(module)
+    except ImportError:
+        raise ImportError(
+            f"Columnar export requires the '{module}' package. Install it with: "
+            "pip install universal-mcp-twitter[columnar]"
+        ) from None
@@ -0,0 +1,93 @@
+import json
+import time
+from collections.abc import Callable
+from typing import Any
+
+from .storage import SQLiteStore
+
+# Parameters that carry the cursor and are therefore not part of a walk's identity.
+_CURSOR_PARAMS = frozenset({"pagination_token", "next_token"})
+
+
+class CursorStore(SQLiteStore):
+    """SQLite store of pagination cursors, so that long walks survive restarts.
+
+    A walk is identified by the segment method and a key, which defaults to the
+    call's arguments. The stored cursor points at the first page that has not
+    been processed yet; it is removed once the walk reaches its last page.
+    """
+
+    schema = (
+        "CREATE TABLE IF NOT EXISTS cursors (endpoint TEXT NOT NULL, "
+        "key TEXT NOT NULL, arguments TEXT NOT NULL, cursor TEXT NOT NULL, "
+        "updated_at REAL NOT NULL, PRIMARY KEY (endpoint, key))",
+    )
+
+    def __init__(
+        self, path: str = ":memory:", clock: Callable[[], float] = time.time
+    ) -> None:
+        """
+        Args:
+            path: SQLite file to keep cursors in, or ``":memory:"``.
+            clock: Returns the current epoch time in seconds.
+        """
+        super().__init__(path)
+        self.clock = clock
+
+    def load(self, endpoint: str, key: str, arguments: str) -> str | None:
+        """Returns the saved cursor of a walk, if it was interrupted.
+
+        Raises:
+            ValueError: Raised if the walk saved under ``key`` had other arguments.
+        """
+        row = self._fetchone(
+            "SELECT arguments, cursor FROM cursors WHERE endpoint = ? AND key = ?",
+            (endpoint, key),
+        )
+        if row is None:
+            return None
+        if row[0] != arguments:
+            raise ValueError(
+                f"Checkpoint {key!r} of {endpoint} was saved for other arguments: "
+                f"{row[0]}"
+            )
+        return row[1]
+
+    def save(self, endpoint: str, key: str, arguments: str, cursor: str | None) -> None:
+        """Saves the cursor of the next page to process, or forgets a finished walk."""
+        if cursor is None:
+            self._execute(
+                "DELETE FROM cursors WHERE endpoint = ? AND key = ?", (endpoint, key)
+            )
+        else:
+            self._execute(
+                "INSERT OR REPLACE INTO cursors "
+                "(endpoint, key, arguments, cursor, updated_at) VALUES (?, ?, ?, ?, ?)",
+                (endpoint, key, arguments, cursor, self.clock()),
+            )
+
+    def pending(self) -> list[tuple[str, str]]:
+        """Returns the ``(endpoint, key)`` of every walk that has not finished."""
+        return self._fetchall("SELECT endpoint, key FROM cursors ORDER BY updated_at")
+
+
+def walk_identity(
+    fn: Callable[..., Any],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    key: str | None = None,
+) -> tuple[str, str, str]:
+    """Returns the ``(endpoint, key, arguments)`` a walk is saved under."""
+    arguments = json.dumps(
+        {
+            "args": list(args),
+            "kwargs": {k: v for k, v in kwargs.items() if k not in _CURSOR_PARAMS},
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return (
+        getattr(fn, "__name__", repr(fn)),
+        arguments if key is None else key,
+        arguments,
+    )
@@ -0,0 +1,38 @@
+import re
+from urllib.parse import urlsplit
+
+# Path segments that are literal parts of an endpoint even though they follow a
+# collection name that is otherwise followed by an id (e.g. /2/spaces/search).
+_LITERAL_SEGMENTS = frozenset({"by", "search"})
+
+_ID_SEGMENT = re.compile(r"^\d+(-\d+)?$")
+
+# Collections whose resource ids are not purely numeric.
+_OPAQUE_ID_COLLECTIONS = frozenset({"spaces"})
+
+
+def endpoint_template(url: str) -> str:
+    """Returns the endpoint template of a request URL.
+
+    Resource ids and usernames are replaced by placeholders so that every call to
+    the same endpoint shares one key, e.g.
+    ``https://api.twitter.com/2/users/2244994945/followers`` becomes
+    ``/2/users/{id}/followers`` and ``/2/users/by/username/jack`` becomes
+    ``/2/users/by/username/{username}``.
+    """
+    segments = urlsplit(url).path.rstrip("/").split("/")
+    template = []
+    for i, segment in enumerate(segments):
+        previous = segments[i - 1] if i else ""
+        if i <= 1:
+            # Leading empty segment and the API version.
+            template.append(segment)
+        elif previous == "username":
+            template.append("{username}")
+        elif _ID_SEGMENT.match(segment):
+            template.append("{id}")
+        elif previous in _OPAQUE_ID_COLLECTIONS and segment not in _LITERAL_SEGMENTS:
+            template.append("{id}")
+        else:
+            template.append(segment)
+    return "/".join(template)
@@ -0,0 +1,176 @@
+from collections.abc import Callable
+from typing import Any
+
+from .batching import INCLUDES_KEYS
+
+
+def _field(name: str) -> Callable[[dict[str, Any]], Any]:
+    return lambda obj: obj.get(name)
+
+
+def _nested(outer: str, inner: str) -> Callable[[dict[str, Any]], Any]:
+    return lambda obj: (obj.get(outer) or {}).get(inner)
+
+
+def _referenced(kind: str | None) -> Callable[[dict[str, Any]], Any]:
+    return lambda obj: [
+        ref["id"]
+        for ref in obj.get("referenced_tweets") or ()
+        if kind is None or ref.get("type") == kind
+    ]
+
+
+def _mentions(obj: dict[str, Any]) -> list[str]:
+    return [
+        mention["username"].lower()
+        for mention in (obj.get("entities") or {}).get("mentions") or ()
+    ]
+
+
+# Relations that can be resolved against ``includes``: attribute name to the
+# includes collection, a function extracting the referenced key(s) from the
+# object, and whether the relation is to many objects.
+RELATIONS: dict[str, tuple[str, Callable[[dict[str, Any]], Any], bool]] = {
+    "author": ("users", _field("author_id"), False),
+    "in_reply_to_user": ("users", _field("in_reply_to_user_id"), False),
+    "mentions": ("users_by_username", _mentions, True),
+    "referenced_tweets": ("tweets", _referenced(None), True),
+    "replied_to": (
+        "tweets",
+        lambda obj: next(iter(_referenced("replied_to")(obj)), None),
+        False,
+    ),
+    "quoted": (
+        "tweets",
+        lambda obj: next(iter(_referenced("quoted")(obj)), None),
+        False,
+    ),
+    "retweeted": (
+        "tweets",
+        lambda obj: next(iter(_referenced("retweeted")(obj)), None),
+        False,
+    ),
+    "media": ("media", _nested("attachments", "media_keys"), True),
+    "polls": ("polls", _nested("attachments", "poll_ids"), True),
+    "place": ("places", _nested("geo", "place_id"), False),
+    "pinned_tweet": ("tweets", _field("pinned_tweet_id"), False),
+    "most_recent_tweet": ("tweets", _field("most_recent_tweet_id"), False),
+    "owner": ("users", _field("owner_id"), False),
+    "creator": ("users", _field("creator_id"), False),
+    "hosts": ("users", _field("host_ids"), True),
+    "speakers": ("users", _field("speaker_ids"), True),
+    "invited_users": ("users", _field("invited_user_ids"), True),
+    "topics": ("topics", _field("topic_ids"), True),
+    "sender": ("users", _field("sender_id"), False),
+    "participants": ("users", _field("participant_ids"), True),
+}
+
+
+class ExpandedResponse(dict):
+    """API response whose ``includes`` can be joined to ``data`` in constant time.
+
+    The response is still the plain JSON dict returned by the API, so it can be
+    serialized and indexed as before. Hash indexes over each ``includes``
+    collection are built on first use only, so responses whose expansions are
+    never resolved pay nothing. :meth:`objects` wraps ``data`` in
+    :class:`ExpandedObject` views that resolve relations such as ``author``,
+    ``referenced_tweets`` or ``media`` as attributes.
+    """
+
+    __slots__ = ("_indexes",)
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._indexes: dict[str, dict[str, dict[str, Any]]] = {}
+
+    def index(self, collection: str) -> dict[str, dict[str, Any]]:
+        """Returns the included objects of ``collection`` by id (or ``media_key``)."""
+        index = self._indexes.get(collection)
+        if index is None:
+            includes = self.get("includes") or {}
+            if collection == "users_by_username":
+                index = {
+                    user["username"].lower(): user
+                    for user in includes.get("users", ())
+                    if "username" in user
+                }
+            else:
+                key = INCLUDES_KEYS.get(collection, "id")
+                index = {
+                    obj[key]: obj for obj in includes.get(collection, ()) if key in obj
+                }
+            self._indexes[collection] = index
+        return index
+
+    def resolve(self, obj: dict[str, Any], relation: str) -> Any:
+        """Returns the included object(s) ``relation`` of ``obj`` refers to.
+
+        Args:
+            obj: An object from ``data`` or ``includes``.
+            relation: One of :data:`RELATIONS`, e.g. ``"author"``.
+
+        Returns:
+            An :class:`ExpandedObject` (or ``None``) for relations to one object, a
+            list of them for relations to many. Referenced objects that were not
+            expanded are omitted.
+        """
+        collection, keys_of, many = RELATIONS[relation]
+        keys = keys_of(obj)
+        index = self.index(collection)
+        if not many:
+            target = index.get(keys) if keys is not None else None
+            return ExpandedObject(target, self) if target is not None else None
+        return [ExpandedObject(index[key], self) for key in keys or () if key in index]
+
+    def objects(self) -> list["ExpandedObject"]:
+        """Returns ``data`` as :class:`ExpandedObject` views.
+
+        Single lookups return a one-item list.
+        """
+        data = self.get("data")
+        if data is None:
+            return []
+        return [
+            ExpandedObject(obj, self)
+            for obj in (data if isinstance(data, list) else [data])
+        ]
+
+
+class ExpandedObject:
+    """View of one object that resolves its expansions against ``includes``.
+
+    Relation names from :data:`RELATIONS` resolve to included objects, any other
+    attribute returns the raw field (or ``None`` if it is absent). Raw values of
+    fields shadowed by a relation, such as ``referenced_tweets``, are available
+    by item access.
+    """
+
+    __slots__ = ("raw", "_response")
+
+    def __init__(self, raw: dict[str, Any], response: ExpandedResponse) -> None:
+        self.raw = raw
+        self._response = response
+
+    def __getattr__(self, name: str) -> Any:
+        if name in RELATIONS:
+            return self._response.resolve(self.raw, name)
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return self.raw.get(name)
+
+    def __getitem__(self, key: str) -> Any:
+        return self.raw[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.raw.get(key, default)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ExpandedObject):
+            return self.raw == other.raw
+        return self.raw == other
+
+    # Compares equal to its (mutable) raw dict, so it is unhashable like one.
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"ExpandedObject({self.raw!r})"
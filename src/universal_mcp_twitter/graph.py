@@ -0,0 +1,266 @@
+import json
+import os
+import threading
+from array import array
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+from .batching import DEFAULT_MAX_CONCURRENCY
+from .cursors import CursorStore
+from .idset import IdSet
+from .pagination import iter_pages
+
+# Users whose lists are walked before the crawl state is saved.
+DEFAULT_CHUNK_SIZE = 256
+
+_METHODS = {"followers": "users_id_followers", "following": "users_id_following"}
+
+# Responses for accounts whose lists cannot be read (protected, suspended or
+# deleted accounts); the crawl records them and moves on.
+_ACCOUNT_ERRORS = frozenset({401, 403, 404})
+
+
+class EdgeWriter:
+    """Appends edges to a binary edge list of native 8-byte ``(source, target)`` pairs.
+
+    An edge ``(a, b)`` means that ``a`` follows ``b``. Every batch is flushed to
+    the operating system before :meth:`write` returns. Read the file back with
+    :func:`read_edges`, or with ``numpy.fromfile(path, dtype="u8").reshape(-1, 2)``.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._file = open(path, "ab")
+        self._lock = threading.Lock()
+
+    def write(self, edges: array) -> None:
+        """Appends a flat ``array('Q')`` of alternating sources and targets."""
+        with self._lock:
+            edges.tofile(self._file)
+            self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def read_edges(path: str, batch_size: int = 65536) -> Iterator[tuple[int, int]]:
+    """Yields the ``(source, target)`` pairs of an :class:`EdgeWriter` edge list."""
+    with open(path, "rb") as file:
+        while chunk := file.read(batch_size * 16):
+            edges = array("Q")
+            edges.frombytes(chunk)
+            yield from zip(edges[::2], edges[1::2])
+
+
+@dataclass
+class CrawlState:
+    """Progress of a crawl: the hop being expanded and how far along its frontier."""
+
+    seeds: list[int]
+    depth: int
+    direction: str
+    hop: int = 0
+    position: int = 0
+
+
+def _read_ids(path: str) -> array:
+    ids = array("Q")
+    if os.path.exists(path):
+        with open(path, "rb") as file:
+            ids.frombytes(file.read())
+    return ids
+
+
+class GraphCrawler:
+    """Crawls the follow graph breadth first, N hops out from seed accounts.
+
+    Every account queued for a hop is appended to that hop's frontier file
+    (``hop-N.bin``) and recorded in an :class:`~universal_mcp_twitter.idset.IdSet`,
+    so an account is expanded at most once and the crawl state costs about 8
+    bytes per account. The follower (or following) lists of up to
+    ``max_concurrency`` accounts are walked at once with ``max_results`` of
+    1000; waits on the rate limit are left to the app's rate limiter. Edges are
+    appended to ``edges.bin`` in ``state_dir`` as they arrive.
+
+    Edges and newly found accounts are written before each list walk saves its
+    cursor, and the position in the frontier is saved after every chunk of
+    accounts, so a crawl that is interrupted resumes where it stopped when it is
+    started again with the same seeds. Edges of the chunk that was interrupted
+    may be written twice. Accounts whose lists cannot be read (protected,
+    suspended or deleted) are recorded in ``failures.jsonl`` and skipped, also
+    when the crawl is resumed.
+
+    Example:
+        crawler = GraphCrawler(app.users, "crawl/")
+        crawler.crawl(["2244994945"], depth=2)
+        for follower, followed in read_edges("crawl/edges.bin"):
+            ...
+    """
+
+    def __init__(
+        self,
+        users: Any,
+        state_dir: str,
+        direction: str = "followers",
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_pages_per_user: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        """
+        Args:
+            users: A :class:`~universal_mcp_twitter.api_segments.users_api.UsersApi`.
+            state_dir: Directory holding the crawl state and ``edges.bin``.
+            direction: ``"followers"`` to crawl who follows each account,
+                ``"following"`` to crawl whom each account follows.
+            max_concurrency: Maximum number of lists walked at once.
+            max_pages_per_user: Pages of 1000 read per account at most, which
+                bounds the cost of accounts with millions of followers. Capped
+                lists are not checkpointed: a capped walk that was interrupted
+                starts over on resume, so it never reads past the cap.
+            chunk_size: Accounts whose lists are walked between two saves of the
+                frontier position.
+        """
+        if direction not in _METHODS:
+            raise ValueError(
+                f"direction must be one of {sorted(_METHODS)}, not {direction!r}"
+            )
+        self.fn = getattr(users, _METHODS[direction])
+        self.state_dir = state_dir
+        self.direction = direction
+        self.max_concurrency = max_concurrency
+        self.max_pages_per_user = max_pages_per_user
+        self.chunk_size = chunk_size
+        self.stats = {"users": 0, "pages": 0, "edges": 0, "failures": 0}
+        os.makedirs(state_dir, exist_ok=True)
+        self.edges = EdgeWriter(os.path.join(state_dir, "edges.bin"))
+        self.cursors = CursorStore(os.path.join(state_dir, "cursors.db"))
+        self.queued = IdSet()
+        self.failed = IdSet()
+        self._lock = threading.Lock()
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.state_dir, name)
+
+    def _save(self, state: CrawlState) -> None:
+        with open(self._path("state.json.tmp"), "w") as file:
+            json.dump(state.__dict__, file)
+        os.replace(self._path("state.json.tmp"), self._path("state.json"))
+
+    def _start(self, seeds: list[int], depth: int) -> CrawlState:
+        if not os.path.exists(self._path("state.json")):
+            state = CrawlState(seeds, depth, self.direction)
+            with open(self._path("hop-0.bin"), "wb") as file:
+                array("Q", seeds).tofile(file)
+            self._save(state)
+        else:
+            with open(self._path("state.json")) as file:
+                state = CrawlState(**json.load(file))
+            if (state.seeds, state.depth, state.direction) != (
+                seeds,
+                depth,
+                self.direction,
+            ):
+                raise ValueError(f"{self.state_dir} holds a different crawl: {state}")
+        for hop in range(depth + 1):
+            self.queued.update(_read_ids(self._path(f"hop-{hop}.bin")))
+        self.failed = IdSet(failure["user_id"] for failure in self.failures())
+        return state
+
+    def failures(self) -> list[dict[str, Any]]:
+        """Returns the accounts whose lists could not be read, with status and error."""
+        if not os.path.exists(self._path("failures.jsonl")):
+            return []
+        with open(self._path("failures.jsonl")) as file:
+            return [json.loads(line) for line in file if line.strip()]
+
+    def _fail(self, user_id: int, error: httpx.HTTPStatusError) -> None:
+        record = {
+            "user_id": user_id,
+            "status": error.response.status_code,
+            "error": str(error),
+        }
+        with self._lock:
+            with open(self._path("failures.jsonl"), "a") as file:
+                file.write(json.dumps(record) + "\n")
+            self.failed.add(user_id)
+            self.stats["failures"] += 1
+
+    def _walk(self, user_id: int, upcoming: str | None) -> None:
+        # Walks one account's list, writing its edges and queueing new accounts.
+        if user_id in self.failed:
+            return
+        try:
+            self._walk_pages(user_id, upcoming)
+        except httpx.HTTPStatusError as error:
+            if error.response.status_code not in _ACCOUNT_ERRORS:
+                raise
+            self._fail(user_id, error)
+
+    def _walk_pages(self, user_id: int, upcoming: str | None) -> None:
+        for page in iter_pages(
+            self.fn,
+            str(user_id),
+            max_results=1000,
+            max_pages=self.max_pages_per_user,
+            prefetch=False,
+            # A cursor saved at the cap would let a resumed walk read past it.
+            checkpoint=self.cursors if self.max_pages_per_user is None else None,
+        ):
+            ids = array("Q", (int(user["id"]) for user in page.get("data") or ()))
+            edges = array("Q", bytes(16 * len(ids)))
+            edges[0::2], edges[1::2] = (
+                (ids, array("Q", [user_id]) * len(ids))
+                if self.direction == "followers"
+                else (array("Q", [user_id]) * len(ids), ids)
+            )
+            self.edges.write(edges)
+            with self._lock:
+                if upcoming is not None:
+                    with open(upcoming, "ab") as file:
+                        array(
+                            "Q", (found for found in ids if self.queued.add(found))
+                        ).tofile(file)
+                self.stats["pages"] += 1
+                self.stats["edges"] += len(ids)
+        with self._lock:
+            self.stats["users"] += 1
+
+    def crawl(self, seeds: Iterable[str | int], depth: int = 1) -> dict[str, int]:
+        """Crawls ``depth`` hops out from ``seeds``, resuming a saved crawl if any.
+
+        Args:
+            seeds: User ids to start from.
+            depth: Number of hops; ``1`` only fetches the seeds' own lists.
+
+        Returns:
+            dict[str, int]: Accounts walked, pages read, edges written and accounts
+            that failed in this call.
+
+        Raises:
+            ValueError: Raised if ``state_dir`` holds a crawl of other seeds or depth.
+        """
+        state = self._start(sorted({int(seed) for seed in seeds}), depth)
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            while state.hop < depth:
+                frontier = _read_ids(self._path(f"hop-{state.hop}.bin"))
+                upcoming = (
+                    self._path(f"hop-{state.hop + 1}.bin")
+                    if state.hop + 1 < depth
+                    else None
+                )
+                while state.position < len(frontier):
+                    chunk = frontier[state.position : state.position + self.chunk_size]
+                    list(executor.map(self._walk, chunk, [upcoming] * len(chunk)))
+                    state.position += len(chunk)
+                    self._save(state)
+                state.hop, state.position = state.hop + 1, 0
+                self._save(state)
+        return dict(self.stats)
+
+    def close(self) -> None:
+        self.edges.close()
+        self.cursors.close()
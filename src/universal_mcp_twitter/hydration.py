@@ -0,0 +1,231 @@
+import json
+import time
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from .endpoints import endpoint_template
+from .storage import SQLiteStore
+
+# Fields the API returns for every object regardless of the requested field set.
+DEFAULT_FIELDS = {
+    "tweets": frozenset({"id", "text", "edit_history_tweet_ids"}),
+    "users": frozenset({"id", "name", "username"}),
+}
+
+# Query parameter holding the requested field set of each kind of object.
+FIELDS_PARAMS = {"tweets": "tweet.fields", "users": "user.fields"}
+
+# Kind of object in the ``data`` of each GET endpoint that returns tweets or users.
+DATA_KINDS = {
+    "/2/tweets": "tweets",
+    "/2/tweets/{id}": "tweets",
+    "/2/tweets/search/recent": "tweets",
+    "/2/tweets/search/all": "tweets",
+    "/2/tweets/{id}/quote_tweets": "tweets",
+    "/2/tweets/{id}/retweets": "tweets",
+    "/2/users/{id}/tweets": "tweets",
+    "/2/users/{id}/mentions": "tweets",
+    "/2/users/{id}/timelines/reverse_chronological": "tweets",
+    "/2/users/{id}/liked_tweets": "tweets",
+    "/2/users/{id}/bookmarks": "tweets",
+    "/2/lists/{id}/tweets": "tweets",
+    "/2/spaces/{id}/tweets": "tweets",
+    "/2/users": "users",
+    "/2/users/{id}": "users",
+    "/2/users/by": "users",
+    "/2/users/by/username/{username}": "users",
+    "/2/users/me": "users",
+    "/2/users/search": "users",
+    "/2/users/{id}/followers": "users",
+    "/2/users/{id}/following": "users",
+    "/2/users/{id}/blocking": "users",
+    "/2/users/{id}/muting": "users",
+    "/2/tweets/{id}/liking_users": "users",
+    "/2/tweets/{id}/retweeted_by": "users",
+    "/2/lists/{id}/members": "users",
+    "/2/lists/{id}/followers": "users",
+    "/2/spaces/{id}/buyers": "users",
+}
+
+
+def field_set(fields: Any) -> frozenset[str]:
+    """Normalizes a field list or comma separated string to a set."""
+    if not fields:
+        return frozenset()
+    if isinstance(fields, str):
+        fields = fields.split(",")
+    return frozenset(field.strip() for field in fields if field.strip())
+
+
+class HydrationStore(SQLiteStore):
+    """Write-through SQLite store of hydrated tweets and users.
+
+    Every tweet and user object returned by a lookup, search or timeline endpoint
+    (including those in ``includes``) is stored together with the field set it
+    was requested with and the time it was fetched. ID lookups made without
+    ``expansions`` are then answered from the store for every object whose stored
+    fields cover the requested ones, and only the remaining ids are requested
+    from the API, which saves both round trips and the monthly Tweet cap.
+
+    Hits and misses are counted in ``stats``.
+    """
+
+    schema = tuple(
+        f"CREATE TABLE IF NOT EXISTS {kind} (id TEXT PRIMARY KEY, "
+        "fields TEXT NOT NULL, fetched_at REAL NOT NULL, object TEXT NOT NULL)"
+        for kind in DEFAULT_FIELDS
+    )
+
+    def __init__(
+        self,
+        path: str,
+        max_age: float | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Args:
+            path: SQLite file to store objects in, or ``":memory:"``.
+            max_age: Seconds after which a stored object is fetched again, for
+                example to refresh ``public_metrics``. ``None`` never expires.
+            clock: Returns the current epoch time in seconds.
+        """
+        super().__init__(path)
+        self.max_age = max_age
+        self.clock = clock
+        self.stats = {"hits": 0, "misses": 0}
+
+    def lookup(
+        self, kind: str, ids: Iterable[str], fields: Any = None
+    ) -> dict[str, dict[str, Any]]:
+        """Returns the stored objects among ``ids`` that cover the requested fields.
+
+        Args:
+            kind: ``"tweets"`` or ``"users"``.
+            ids: Object ids to look up.
+            fields: Requested field list or comma separated string.
+
+        Returns:
+            dict[str, dict[str, Any]]: Id to object, projected onto the requested
+            fields as the API would have returned it. Ids that are missing,
+            expired or stored with fewer fields are omitted.
+        """
+        ids = list(ids)
+        requested = field_set(fields)
+        wanted = DEFAULT_FIELDS[kind] | requested
+        oldest = None if self.max_age is None else self.clock() - self.max_age
+        found = {}
+        for start in range(0, len(ids), 500):
+            batch = ids[start : start + 500]
+            rows = self._fetchall(
+                f"SELECT id, fields, fetched_at, object FROM {kind} "
+                f"WHERE id IN ({','.join('?' * len(batch))})",
+                batch,
+            )
+            for object_id, stored_fields, fetched_at, obj in rows:
+                if (oldest is None or fetched_at >= oldest) and requested <= field_set(
+                    stored_fields
+                ):
+                    found[object_id] = {
+                        k: v for k, v in json.loads(obj).items() if k in wanted
+                    }
+        self.stats["hits"] += len(found)
+        self.stats["misses"] += len(ids) - len(found)
+        return found
+
+    def store(
+        self, kind: str, objects: Iterable[dict[str, Any]], fields: Any = None
+    ) -> None:
+        """Writes objects fetched with the given field set, merging into stored ones.
+
+        A stored object keeps the fields it had that the new fetch did not request,
+        so alternating requests for different field sets do not evict each other.
+        """
+        objects = [obj for obj in objects if isinstance(obj, dict) and "id" in obj]
+        if not objects:
+            return
+        requested = field_set(fields)
+        now = self.clock()
+        with self._transaction() as db:
+            stored = {}
+            for start in range(0, len(objects), 500):
+                batch = [obj["id"] for obj in objects[start : start + 500]]
+                rows = db.execute(
+                    f"SELECT id, fields, object FROM {kind} "
+                    f"WHERE id IN ({','.join('?' * len(batch))})",
+                    batch,
+                )
+                stored.update(
+                    (object_id, (field_set(stored_fields), json.loads(obj)))
+                    for object_id, stored_fields, obj in rows
+                )
+            rows = []
+            for obj in objects:
+                merged_fields, merged = requested, obj
+                if obj["id"] in stored:
+                    old_fields, old = stored[obj["id"]]
+                    merged_fields = old_fields | requested
+                    merged = {
+                        **{k: v for k, v in old.items() if k not in requested},
+                        **obj,
+                    }
+                rows.append(
+                    (
+                        obj["id"],
+                        ",".join(sorted(merged_fields)),
+                        now,
+                        json.dumps(merged),
+                    )
+                )
+            db.executemany(
+                f"INSERT OR REPLACE INTO {kind} (id, fields, fetched_at, object) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+
+    def observe(self, url: str, params: dict[str, Any] | None, payload: Any) -> None:
+        """Stores the tweets and users of a GET response to ``url``."""
+        if not isinstance(payload, dict):
+            return
+        params = params or {}
+        kind = DATA_KINDS.get(endpoint_template(url))
+        if kind is not None:
+            data = payload.get("data")
+            self.store(
+                kind,
+                data if isinstance(data, list) else [data],
+                params.get(FIELDS_PARAMS[kind]),
+            )
+        includes = payload.get("includes") or {}
+        for kind, param in FIELDS_PARAMS.items():
+            if includes.get(kind):
+                self.store(kind, includes[kind], params.get(param))
+
+    def observes(self, url: str, params: dict[str, Any] | None) -> bool:
+        """Returns whether a GET response to ``url`` may hold tweets or users."""
+        return endpoint_template(url) in DATA_KINDS or bool(
+            (params or {}).get("expansions")
+        )
+
+
+def with_stored(
+    ids: list[str],
+    stored: dict[str, dict[str, Any]],
+    response: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Combines stored objects with an API response for the remaining ids.
+
+    The ``data`` of the result lists the objects in the order of ``ids``; the
+    response's ``errors`` are kept.
+    """
+    if not stored:
+        return response if response is not None else {}
+    response = dict(response or {})
+    fetched = {obj["id"]: obj for obj in response.get("data") or ()}
+    data = [
+        obj
+        for object_id in ids
+        if (obj := stored.get(object_id) or fetched.get(object_id)) is not None
+    ]
+    if data:
+        response["data"] = data
+    return response
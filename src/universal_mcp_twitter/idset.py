@@ -0,0 +1,204 @@
+import heapq
+import math
+import os
+from array import array
+from bisect import bisect_left
+from collections.abc import Hashable, Iterable, Iterator
+from hashlib import blake2b
+
+# Fewest ids collected in the insertion buffer before it is merged into the
+# sorted array.
+_MIN_PENDING = 4096
+
+_KEY_LIMIT = 2**64
+_KEY_DIGITS = len(str(_KEY_LIMIT - 1))
+
+
+def id_key(value: Hashable) -> int:
+    """Returns the 64-bit key of an id.
+
+    Numeric ids (Tweets, users, lists, DM events) are their own key; any other
+    value, such as a Space id, a media key or an integer that does not fit into
+    an unsigned 64-bit key, is hashed to 64 bits.
+    """
+    if isinstance(value, int) and 0 <= value < _KEY_LIMIT:
+        return value
+    text = str(value)
+    if text.isascii() and text.isdigit() and len(text) <= _KEY_DIGITS:
+        key = int(text)
+        if key < _KEY_LIMIT:
+            return key
+    return int.from_bytes(blake2b(text.encode(), digest_size=8).digest(), "little")
+
+
+class IdSet:
+    """Set of Tweet or user ids stored as 8-byte integers.
+
+    Ids are kept in a sorted ``array('Q')`` and found by binary search, so a set
+    of millions of ids costs about 8 bytes per id instead of the ~100 bytes of a
+    Python ``set`` of strings. New ids are collected in a small buffer and merged
+    in once it holds an eighth of the set, which keeps inserts amortized cheap.
+    Ids may be passed as strings or integers; see :func:`id_key` for others.
+    """
+
+    def __init__(self, ids: Iterable[Hashable] = ()) -> None:
+        self._sorted = array("Q")
+        self._pending: set[int] = set()
+        self.update(ids)
+
+    def __contains__(self, value: Hashable) -> bool:
+        key = id_key(value)
+        if key in self._pending:
+            return True
+        index = bisect_left(self._sorted, key)
+        return index < len(self._sorted) and self._sorted[index] == key
+
+    def __len__(self) -> int:
+        return len(self._sorted) + len(self._pending)
+
+    def __iter__(self) -> Iterator[int]:
+        self._merge()
+        return iter(self._sorted)
+
+    def add(self, value: Hashable) -> bool:
+        """Adds an id; returns ``False`` if it was already in the set."""
+        key = id_key(value)
+        if key in self:
+            return False
+        self._pending.add(key)
+        if len(self._pending) >= max(_MIN_PENDING, len(self._sorted) // 8):
+            self._merge()
+        return True
+
+    def update(self, values: Iterable[Hashable]) -> None:
+        """Adds many ids at once with a single merge."""
+        new = {id_key(value) for value in values}
+        new.difference_update(self._pending)
+        new = [key for key in sorted(new) if key not in self]
+        if new:
+            self._merge()
+            self._sorted = array("Q", heapq.merge(self._sorted, new))
+
+    def _merge(self) -> None:
+        if self._pending:
+            self._sorted = array("Q", heapq.merge(self._sorted, sorted(self._pending)))
+            self._pending.clear()
+
+    def save(self, path: str) -> None:
+        """Writes the ids to ``path`` as sorted native 8-byte integers, atomically."""
+        self._merge()
+        with open(f"{path}.tmp", "wb") as file:
+            self._sorted.tofile(file)
+        os.replace(f"{path}.tmp", path)
+
+    @classmethod
+    def load(cls, path: str) -> "IdSet":
+        """Reads a set written by :meth:`save`."""
+        ids = cls()
+        with open(path, "rb") as file:
+            ids._sorted.frombytes(file.read())
+        return ids
+
+
+class BloomFilter:
+    """Probabilistic set of ids with a fixed size and false-positive rate.
+
+    Sized for ``capacity`` ids, a filter with a false-positive rate of 0.1%
+    takes under 2 bytes per id and one of 1e-6 under 4, however long the ids
+    are. Membership checks never miss an id that was added, but report an id
+    that was not added with probability ``false_positive_rate`` once the filter
+    holds ``capacity`` ids.
+    """
+
+    def __init__(self, capacity: int, false_positive_rate: float = 0.001) -> None:
+        if capacity < 1 or not 0 < false_positive_rate < 1:
+            raise ValueError(
+                "capacity must be positive and false_positive_rate between 0 and 1"
+            )
+        bits = max(
+            64, math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2)
+        )
+        self.capacity = capacity
+        self.false_positive_rate = false_positive_rate
+        self.hashes = max(1, round(bits / capacity * math.log(2)))
+        self._bits = bytearray((bits + 7) // 8)
+        self._size = len(self._bits) * 8
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Number of ids added (ids reported as already present are not counted)."""
+        return self._count
+
+    @property
+    def size(self) -> int:
+        """Number of bits in the filter; it takes ``size / 8`` bytes of memory."""
+        return self._size
+
+    def _positions(self, value: Hashable) -> Iterator[int]:
+        digest = blake2b(id_key(value).to_bytes(8, "little"), digest_size=16).digest()
+        first, second = (
+            int.from_bytes(digest[:8], "little"),
+            int.from_bytes(digest[8:], "little") | 1,
+        )
+        return ((first + i * second) % self._size for i in range(self.hashes))
+
+    def __contains__(self, value: Hashable) -> bool:
+        bits = self._bits
+        return all(
+            bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(value)
+        )
+
+    def add(self, value: Hashable) -> bool:
+        """Adds an id; returns ``False`` if it was (probably) already in the filter."""
+        bits = self._bits
+        new = False
+        for position in self._positions(value):
+            mask = 1 << (position & 7)
+            if not bits[position >> 3] & mask:
+                bits[position >> 3] |= mask
+                new = True
+        self._count += new
+        return new
+
+
+class RecentIds:
+    """Remembers at least the last ``window`` distinct ids, in bounded memory.
+
+    Ids are recorded in two generations of ``window`` ids each; when the current
+    generation is full the older one is dropped. Generations are :class:`IdSet`
+    instances, or :class:`BloomFilter` instances when a ``false_positive_rate``
+    is given, trading a small chance of reporting a new id as seen for two to
+    four times less memory.
+    """
+
+    def __init__(self, window: int, false_positive_rate: float | None = None) -> None:
+        self.window = window
+        self.false_positive_rate = false_positive_rate
+        self._current = self._generation()
+        self._previous = self._generation()
+        self._count = 0
+
+    def _generation(self) -> IdSet | BloomFilter:
+        return (
+            IdSet()
+            if self.false_positive_rate is None
+            else BloomFilter(self.window, self.false_positive_rate)
+        )
+
+    def __contains__(self, value: Hashable) -> bool:
+        return value in self._current or value in self._previous
+
+    def add(self, value: Hashable) -> bool:
+        """Records an id; returns ``False`` if it is among the recent ids already."""
+        if value in self:
+            return False
+        if self._count >= self.window:
+            self._previous, self._current, self._count = (
+                self._current,
+                self._generation(),
+                0,
+            )
+        self._current.add(value)
+        self._count += 1
+        return True
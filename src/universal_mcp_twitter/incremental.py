@@ -0,0 +1,179 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from typing import Any
+
+from .pagination import aiter_pages, iter_pages
+from .storage import SQLiteStore
+
+
+class CheckpointStore(SQLiteStore):
+    """SQLite store of the newest id seen per endpoint and user or query.
+
+    A checkpoint only ever moves forward, so concurrent or repeated syncs of the
+    same timeline cannot rewind each other.
+    """
+
+    schema = (
+        "CREATE TABLE IF NOT EXISTS checkpoints (endpoint TEXT NOT NULL, "
+        "key TEXT NOT NULL, since_id INTEGER NOT NULL, updated_at REAL NOT NULL, "
+        "PRIMARY KEY (endpoint, key))",
+    )
+
+    def __init__(
+        self, path: str = ":memory:", clock: Callable[[], float] = time.time
+    ) -> None:
+        """
+        Args:
+            path: SQLite file to keep checkpoints in, or ``":memory:"``.
+            clock: Returns the current epoch time in seconds.
+        """
+        super().__init__(path)
+        self.clock = clock
+
+    def get(self, endpoint: str, key: str) -> str | None:
+        """Returns the newest id recorded for ``endpoint`` and ``key``, if any."""
+        row = self._fetchone(
+            "SELECT since_id FROM checkpoints WHERE endpoint = ? AND key = ?",
+            (endpoint, key),
+        )
+        return str(row[0]) if row else None
+
+    def advance(self, endpoint: str, key: str, newest_id: str | int) -> None:
+        """Records ``newest_id`` unless a newer id is already recorded."""
+        self._execute(
+            "INSERT INTO checkpoints (endpoint, key, since_id, updated_at) "
+            "VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (endpoint, key) DO UPDATE SET since_id = excluded.since_id, "
+            "updated_at = excluded.updated_at WHERE excluded.since_id > since_id",
+            (endpoint, key, int(newest_id), self.clock()),
+        )
+
+    def reset(self, endpoint: str, key: str) -> None:
+        """Forgets the checkpoint, so the next sync starts from the newest items."""
+        self._execute(
+            "DELETE FROM checkpoints WHERE endpoint = ? AND key = ?", (endpoint, key)
+        )
+
+
+def newest_id(page: dict[str, Any]) -> int | None:
+    """Returns the newest id of a page, from ``meta.newest_id`` or its items."""
+    newest = (page.get("meta") or {}).get("newest_id")
+    if newest is not None:
+        return int(newest)
+    data = page.get("data")
+    ids = [
+        int(item["id"])
+        for item in (data if isinstance(data, list) else [data] if data else ())
+        if "id" in item
+    ]
+    return max(ids) if ids else None
+
+
+def _checkpoint(
+    fn: Callable[..., Any],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    key: str | None,
+) -> tuple[str, str]:
+    # Without an explicit key, the timeline is identified by its only user id or
+    # query; any other combination of arguments could name several timelines.
+    if key is None:
+        candidates = [
+            *args,
+            *(kwargs[name] for name in ("id", "query") if name in kwargs),
+        ]
+        if len(candidates) != 1 or not isinstance(candidates[0], str | int):
+            raise TypeError(
+                "Pass key= to identify the timeline being synced; it is only "
+                "inferred from a single user id or query."
+            )
+        key = candidates[0]
+    return getattr(fn, "__name__", repr(fn)), str(key)
+
+
+def iter_new_pages(
+    fn: Callable[..., dict[str, Any]],
+    *args: Any,
+    checkpoints: CheckpointStore,
+    key: str | None = None,
+    initial_pages: int | None = 1,
+    **kwargs: Any,
+) -> Iterator[dict[str, Any]]:
+    """Yields only the pages of items posted since the previous sync.
+
+    The newest id seen per endpoint and user (or query) is kept in
+    ``checkpoints`` and passed as ``since_id`` on the next sync, which pages
+    until every newer item was returned, so a poll that fell several pages
+    behind still catches up completely. The checkpoint is advanced once the last
+    page was consumed; a sync that is interrupted is repeated in full next time
+    instead of skipping items.
+
+    Example:
+        checkpoints = CheckpointStore("timelines.db")
+        timeline = app.users.users_id_tweets
+        for page in iter_new_pages(timeline, "2244994945", checkpoints=checkpoints):
+            ...
+
+    Args:
+        fn: Segment method that accepts ``since_id``, e.g.
+            ``app.users.users_id_tweets``, ``users_id_mentions``,
+            ``users_id_timeline`` or ``app.tweets.tweets_recent_search``.
+        *args: Positional arguments for ``fn``.
+        checkpoints: Store holding the newest id per timeline.
+        key: Identifies the timeline. Defaults to the user id or query when
+            it is the only positional or ``id``/``query`` argument, and is
+            required otherwise.
+        initial_pages: Pages fetched when no checkpoint exists yet; ``None``
+            fetches everything the endpoint returns.
+        **kwargs: Other keyword arguments for ``fn``.
+
+    Yields:
+        dict[str, Any]: One response page at a time, newest first.
+    """
+    endpoint, key = _checkpoint(fn, args, kwargs, key)
+    since_id = checkpoints.get(endpoint, key)
+    newest = None
+    for page in iter_pages(
+        fn,
+        *args,
+        since_id=since_id,
+        max_pages=initial_pages if since_id is None else None,
+        **kwargs,
+    ):
+        page_newest = newest_id(page)
+        if page_newest is not None and (newest is None or page_newest > newest):
+            newest = page_newest
+        yield page
+    if newest is not None:
+        checkpoints.advance(endpoint, key, newest)
+
+
+async def aiter_new_pages(
+    fn: Callable[..., Awaitable[dict[str, Any]]],
+    *args: Any,
+    checkpoints: CheckpointStore,
+    key: str | None = None,
+    initial_pages: int | None = 1,
+    **kwargs: Any,
+) -> AsyncIterator[dict[str, Any]]:
+    """Async counterpart of :func:`iter_new_pages` for coroutine segment methods.
+
+    The checkpoint is read and written in a worker thread, off the event loop.
+    """
+    endpoint, key = _checkpoint(fn, args, kwargs, key)
+    since_id = await asyncio.to_thread(checkpoints.get, endpoint, key)
+    newest = None
+    async for page in aiter_pages(
+        fn,
+        *args,
+        since_id=since_id,
+        max_pages=initial_pages if since_id is None else None,
+        **kwargs,
+    ):
+        page_newest = newest_id(page)
+        if page_newest is not None and (newest is None or page_newest > newest):
+            newest = page_newest
+        yield page
+    if newest is not None:
+        await asyncio.to_thread(checkpoints.advance, endpoint, key, newest)
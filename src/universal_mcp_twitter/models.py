@@ -0,0 +1,160 @@
+import json
+from typing import Any, ClassVar
+
+
+class Model:
+    """Compact, read-only representation of an API object.
+
+    Frequently used fields live in ``__slots__`` so instances carry no per-object
+    ``__dict__``. Every other field (``entities``, ``context_annotations``,
+    ``edit_controls`` and the like) is kept as one compact JSON string and only
+    decoded the first time one of them is read, which makes large in-memory
+    corpora several times smaller than the equivalent ``response.json()`` dicts.
+    Declared ``FIELDS`` absent from the response read as ``None``; reading any
+    other field the response did not contain raises ``AttributeError``, so
+    ``hasattr`` works and misspelled names fail loudly.
+    """
+
+    __slots__ = ("_extra",)
+
+    FIELDS: ClassVar[tuple[str, ...]] = ()
+
+    @classmethod
+    def from_json(cls, obj: dict[str, Any]) -> "Model":
+        """Builds an instance from one object of a response's data or includes."""
+        instance = cls.__new__(cls)
+        for name in cls.FIELDS:
+            object.__setattr__(instance, name, obj.get(name))
+        extra = {k: v for k, v in obj.items() if k not in cls.FIELDS}
+        object.__setattr__(
+            instance,
+            "_extra",
+            json.dumps(extra, separators=(",", ":")) if extra else None,
+        )
+        return instance
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        extra = self._extra
+        if isinstance(extra, str):
+            extra = json.loads(extra)
+            object.__setattr__(self, "_extra", extra)
+        if extra is None or name not in extra:
+            raise AttributeError(f"{type(self).__name__} object has no field {name!r}")
+        return extra[name]
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns the object as the API returned it."""
+        data = {
+            name: value
+            for name in self.FIELDS
+            if (value := getattr(self, name)) is not None
+        }
+        extra = self._extra
+        if extra is not None:
+            data.update(json.loads(extra) if isinstance(extra, str) else extra)
+        return data
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __hash__(self) -> int:
+        return hash((type(self), self.id))
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return type(self).from_json, (self.to_dict(),)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(id={self.id!r})"
+
+
+class Tweet(Model):
+    __slots__ = (
+        "id",
+        "text",
+        "author_id",
+        "created_at",
+        "conversation_id",
+        "in_reply_to_user_id",
+        "lang",
+        "possibly_sensitive",
+        "public_metrics",
+    )
+    FIELDS = __slots__
+
+
+class User(Model):
+    __slots__ = (
+        "id",
+        "name",
+        "username",
+        "created_at",
+        "description",
+        "location",
+        "profile_image_url",
+        "protected",
+        "verified",
+        "public_metrics",
+    )
+    FIELDS = __slots__
+
+
+class List(Model):
+    __slots__ = (
+        "id",
+        "name",
+        "owner_id",
+        "created_at",
+        "description",
+        "follower_count",
+        "member_count",
+        "private",
+    )
+    FIELDS = __slots__
+
+
+class Space(Model):
+    __slots__ = (
+        "id",
+        "state",
+        "title",
+        "creator_id",
+        "host_ids",
+        "lang",
+        "participant_count",
+        "created_at",
+        "started_at",
+        "ended_at",
+    )
+    FIELDS = __slots__
+
+
+class DMEvent(Model):
+    __slots__ = (
+        "id",
+        "event_type",
+        "text",
+        "sender_id",
+        "dm_conversation_id",
+        "created_at",
+    )
+    FIELDS = __slots__
+
+
+def to_models(response: dict[str, Any], model: type[Model]) -> list[Model]:
+    """Converts a response's ``data`` to ``model`` instances.
+
+    Single lookups return a one-item list.
+    """
+    data = response.get("data")
+    if data is None:
+        return []
+    return [
+        model.from_json(obj) for obj in (data if isinstance(data, list) else [data])
+    ]
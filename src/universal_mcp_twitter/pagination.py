@@ -0,0 +1,319 @@
+import asyncio
+import inspect
+import queue
+import threading
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from .batching import DEFAULT_MAX_CONCURRENCY
+from .cursors import CursorStore, walk_identity
+from .idset import IdSet
+from .models import Model
+
+# Pages a source of :func:`concurrent_pages` may buffer ahead of the consumer.
+DEFAULT_BUFFER_PAGES = 50
+
+_DONE = object()
+
+
+def token_param(fn: Callable[..., Any]) -> str:
+    """Returns the name of the cursor parameter accepted by a paginated method.
+
+    Most endpoints take ``pagination_token``; a few search endpoints only take
+    ``next_token``. Both are fed the ``meta.next_token`` of the previous page.
+    """
+    parameters = inspect.signature(fn).parameters
+    for name in ("pagination_token", "next_token"):
+        if name in parameters:
+            return name
+    raise TypeError(
+        f"{getattr(fn, '__name__', fn)!r} does not accept a pagination token."
+    )
+
+
+def next_token(page: dict[str, Any]) -> str | None:
+    """Returns the cursor of the page following ``page``, if there is one."""
+    return (page.get("meta") or {}).get("next_token")
+
+
+def _page_items(page: dict[str, Any]) -> list:
+    data = page.get("data")
+    if data is None:
+        return []
+    return data if isinstance(data, list) else [data]
+
+
+def iter_pages(
+    fn: Callable[..., dict[str, Any]],
+    *args: Any,
+    max_pages: int | None = None,
+    max_items: int | None = None,
+    prefetch: bool = True,
+    checkpoint: CursorStore | None = None,
+    checkpoint_key: str | None = None,
+    **kwargs: Any,
+) -> Iterator[dict[str, Any]]:
+    """Walks ``meta.next_token`` of a paginated segment method, yielding each page.
+
+    Example:
+        followers = app.users.users_id_followers
+        for page in iter_pages(followers, "2244994945", max_results=1000):
+            ...
+
+    Args:
+        fn: Paginated segment method, e.g. ``app.users.users_id_followers``.
+        *args: Positional arguments for ``fn``.
+        max_pages: Stop after this many pages.
+        max_items: Stop once pages holding this many ``data`` items were yielded.
+        prefetch: Request the next page in the background while the current page
+            is being processed by the caller.
+        checkpoint: Store in which the cursor of the next page is saved once
+            the caller has processed a page, so a walk that is interrupted
+            resumes at the first unprocessed page when it is started again
+            with the same arguments. The cursor is removed when the last page
+            was processed.
+        checkpoint_key: Name of the walk in ``checkpoint``, defaults to the
+            call's arguments.
+        **kwargs: Keyword arguments for ``fn``. A cursor passed here is used as
+            the starting point unless a saved checkpoint exists.
+
+    Yields:
+        dict[str, Any]: One response page at a time.
+    """
+    param = token_param(fn)
+    if checkpoint is not None:
+        walk = walk_identity(fn, args, kwargs, checkpoint_key)
+        if (saved := checkpoint.load(*walk)) is not None:
+            kwargs = {**kwargs, param: saved}
+    pages = items = 0
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    try:
+        page = fn(*args, **kwargs)
+        while True:
+            pages += 1
+            items += len(_page_items(page))
+            token = next_token(page)
+            done = (
+                not token
+                or (max_pages is not None and pages >= max_pages)
+                or (max_items is not None and items >= max_items)
+            )
+            upcoming = None
+            if not done:
+                call_kwargs = {**kwargs, param: token}
+                if executor is not None:
+                    upcoming = executor.submit(fn, *args, **call_kwargs)
+            yield page
+            if checkpoint is not None:
+                checkpoint.save(*walk, token)
+            if done:
+                return
+            page = (
+                upcoming.result() if upcoming is not None else fn(*args, **call_kwargs)
+            )
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_items(
+    fn: Callable[..., dict[str, Any]],
+    *args: Any,
+    max_pages: int | None = None,
+    max_items: int | None = None,
+    prefetch: bool = True,
+    model: type[Model] | None = None,
+    **kwargs: Any,
+) -> Iterator[Any]:
+    """Like :func:`iter_pages` but yields the individual ``data`` items lazily.
+
+    Args:
+        model: Model class from :mod:`universal_mcp_twitter.models` to convert
+            each item to, e.g. ``Tweet``, instead of yielding the raw dicts.
+
+    Yields:
+        Any: Objects from each page's ``data`` array, at most ``max_items`` of them.
+    """
+    remaining = max_items
+    for page in iter_pages(
+        fn, *args, max_pages=max_pages, max_items=max_items, prefetch=prefetch, **kwargs
+    ):
+        for item in _page_items(page):
+            if remaining is not None:
+                if remaining <= 0:
+                    return
+                remaining -= 1
+            yield model.from_json(item) if model is not None else item
+
+
+async def aiter_pages(
+    fn: Callable[..., Awaitable[dict[str, Any]]],
+    *args: Any,
+    max_pages: int | None = None,
+    max_items: int | None = None,
+    prefetch: bool = True,
+    checkpoint: CursorStore | None = None,
+    checkpoint_key: str | None = None,
+    **kwargs: Any,
+) -> AsyncIterator[dict[str, Any]]:
+    """Async counterpart of :func:`iter_pages` for coroutine segment methods.
+
+    The checkpoint is read and written in a worker thread, off the event loop.
+    """
+    param = token_param(fn)
+    if checkpoint is not None:
+        walk = walk_identity(fn, args, kwargs, checkpoint_key)
+        if (saved := await asyncio.to_thread(checkpoint.load, *walk)) is not None:
+            kwargs = {**kwargs, param: saved}
+    pages = items = 0
+    upcoming = None
+    try:
+        page = await fn(*args, **kwargs)
+        while True:
+            pages += 1
+            items += len(_page_items(page))
+            token = next_token(page)
+            done = (
+                not token
+                or (max_pages is not None and pages >= max_pages)
+                or (max_items is not None and items >= max_items)
+            )
+            if not done:
+                call_kwargs = {**kwargs, param: token}
+                if prefetch:
+                    upcoming = asyncio.ensure_future(fn(*args, **call_kwargs))
+            yield page
+            if checkpoint is not None:
+                await asyncio.to_thread(checkpoint.save, *walk, token)
+            if done:
+                return
+            page = (
+                await upcoming
+                if upcoming is not None
+                else await fn(*args, **call_kwargs)
+            )
+            upcoming = None
+    finally:
+        if upcoming is not None:
+            upcoming.cancel()
+
+
+async def aiter_items(
+    fn: Callable[..., Awaitable[dict[str, Any]]],
+    *args: Any,
+    max_pages: int | None = None,
+    max_items: int | None = None,
+    prefetch: bool = True,
+    model: type[Model] | None = None,
+    **kwargs: Any,
+) -> AsyncIterator[Any]:
+    """Async counterpart of :func:`iter_items` for coroutine segment methods."""
+    remaining = max_items
+    async for page in aiter_pages(
+        fn, *args, max_pages=max_pages, max_items=max_items, prefetch=prefetch, **kwargs
+    ):
+        for item in _page_items(page):
+            if remaining is not None:
+                if remaining <= 0:
+                    return
+                remaining -= 1
+            yield model.from_json(item) if model is not None else item
+
+
+def dedupe_page(page: dict[str, Any], seen: IdSet) -> dict[str, Any]:
+    """Returns ``page`` without the objects already in ``seen``, recording the rest."""
+    data = page.get("data")
+    if not isinstance(data, list):
+        return page
+    fresh = [obj for obj in data if seen.add(obj["id"])]
+    if len(fresh) == len(data):
+        return page
+    page = type(page)(page)
+    page["data"] = fresh
+    return page
+
+
+def concurrent_pages(
+    sources: list[Callable[[], Iterator[dict[str, Any]]]],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    buffer_pages: int = DEFAULT_BUFFER_PAGES,
+    dedupe: bool = True,
+) -> Iterator[dict[str, Any]]:
+    """Drains several page iterators concurrently, yielding pages source by source.
+
+    Every source, typically an :func:`iter_pages` call bound with
+    ``functools.partial``, runs on a worker thread with at most
+    ``max_concurrency`` of them in flight. Pages are yielded in the order of
+    ``sources`` and each source buffers at most ``buffer_pages`` pages ahead of
+    the consumer. With ``dedupe``, objects whose id was already yielded are
+    dropped from later pages.
+    """
+    queues = [queue.Queue(maxsize=buffer_pages) for _ in sources]
+    stop = threading.Event()
+
+    def put(index: int, item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                queues[index].put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def run(index: int) -> None:
+        try:
+            for page in sources[index]():
+                if not put(index, page):
+                    return
+            put(index, _DONE)
+        except Exception as e:
+            put(index, e)
+
+    seen = IdSet()
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, min(max_concurrency, len(sources)))
+    )
+    try:
+        for index in range(len(sources)):
+            executor.submit(run, index)
+        for index in range(len(sources)):
+            while (item := queues[index].get()) is not _DONE:
+                if isinstance(item, BaseException):
+                    raise item
+                yield dedupe_page(item, seen) if dedupe else item
+    finally:
+        stop.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def aconcurrent_pages(
+    sources: list[Callable[[], AsyncIterator[dict[str, Any]]]],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    buffer_pages: int = DEFAULT_BUFFER_PAGES,
+    dedupe: bool = True,
+) -> AsyncIterator[dict[str, Any]]:
+    """Async counterpart of :func:`concurrent_pages` for async page iterators."""
+    queues = [asyncio.Queue(maxsize=buffer_pages) for _ in sources]
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(index: int) -> None:
+        async with semaphore:
+            try:
+                async for page in sources[index]():
+                    await queues[index].put(page)
+                await queues[index].put(_DONE)
+            except Exception as e:
+                await queues[index].put(e)
+
+    seen = IdSet()
+    tasks = [asyncio.ensure_future(run(index)) for index in range(len(sources))]
+    try:
+        for index in range(len(sources)):
+            while (item := await queues[index].get()) is not _DONE:
+                if isinstance(item, BaseException):
+                    raise item
+                yield dedupe_page(item, seen) if dedupe else item
+    finally:
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,335 @@
+import asyncio
+import heapq
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+from .batching import DEFAULT_MAX_CONCURRENCY
+from .incremental import CheckpointStore, aiter_new_pages, iter_new_pages
+from .rate_limit import RateLimiter
+
+# Length of the rate limit window of the timeline endpoints, in seconds.
+RATE_LIMIT_WINDOW = 15 * 60
+
+# Rate limiter keys of the endpoints commonly polled, by segment method.
+RATE_LIMIT_KEYS = {
+    "users_id_tweets": "GET /2/users/{id}/tweets",
+    "users_id_mentions": "GET /2/users/{id}/mentions",
+    "users_id_timeline": "GET /2/users/{id}/timelines/reverse_chronological",
+    "tweets_recent_search": "GET /2/tweets/search/recent",
+}
+
+
+@dataclass(order=True)
+class PollTarget:
+    """Polling state of one account on one endpoint.
+
+    ``rate`` is the smoothed number of new items per second observed so far,
+    and ``rate_limit_key`` the rate limiter key of the endpoint polled. Targets
+    order by ``next_poll``.
+    """
+
+    next_poll: float
+    fn: Callable[..., Any] = field(compare=False)
+    user_id: str = field(compare=False)
+    rate_limit_key: str = field(compare=False)
+    interval: float = field(compare=False)
+    rate: float = field(default=0.0, compare=False)
+    last_poll: float | None = field(default=None, compare=False)
+    params: dict[str, Any] = field(default_factory=dict, compare=False)
+
+
+@dataclass
+class PollResult:
+    """New items returned by one poll of a target."""
+
+    target: PollTarget
+    items: list[dict[str, Any]]
+    pages: int
+    error: Exception | None = None
+
+
+class PollScheduler:
+    """Polls many accounts incrementally at intervals adapted to their activity.
+
+    Each account starts at ``min_interval``. After every poll its posting rate is
+    re-estimated as an exponentially weighted average of new items per second,
+    and the next poll is scheduled when about ``target_items`` new items are
+    expected: busy accounts are polled often, dormant ones back off by
+    ``backoff`` per empty poll up to ``max_interval``.
+
+    The budget of each endpoint is read from the app's
+    :class:`~universal_mcp_twitter.rate_limit.RateLimiter`, which knows the
+    limit and the requests left in the current window from the responses
+    received so far. If the polls scheduled for an endpoint would need more
+    requests per window than its limit, all of that endpoint's intervals are
+    stretched by the same factor, so the budget is shared in proportion to
+    activity instead of starving the accounts that happen to be last in line;
+    polls that still find the window used up wait for it to reset, most overdue
+    first. Polls that are due are run concurrently and use
+    :func:`~universal_mcp_twitter.incremental.iter_new_pages`, so each poll only
+    fetches what is new.
+
+    Example:
+        scheduler = PollScheduler(CheckpointStore("polls.db"))
+        for user_id in account_ids:
+            scheduler.add(app.users.users_id_tweets, user_id, max_results=100)
+        scheduler.run(lambda result: store(result.items))
+    """
+
+    def __init__(
+        self,
+        checkpoints: CheckpointStore,
+        min_interval: float = 60.0,
+        max_interval: float = 24 * 60 * 60.0,
+        target_items: float = 20.0,
+        backoff: float = 2.0,
+        smoothing: float = 0.3,
+        rate_limiter: RateLimiter | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        Args:
+            checkpoints: Store holding the newest id seen per account.
+            min_interval: Shortest time between two polls of an account, in seconds.
+            max_interval: Longest time between two polls of an account, in seconds.
+            target_items: New items a poll should find on average.
+            backoff: Most an interval may grow by per poll.
+            smoothing: Weight of the latest poll in the posting rate estimate.
+            rate_limiter: Rate limiter holding the endpoints' budgets. Defaults
+                to the rate limiter of the app the first added method belongs to;
+                without one, polls are not budgeted.
+            max_concurrency: Maximum number of polls in flight.
+            clock: Returns the current epoch time in seconds.
+            sleep: Blocks for the given number of seconds.
+        """
+        self.checkpoints = checkpoints
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.target_items = target_items
+        self.backoff = backoff
+        self.smoothing = smoothing
+        self.rate_limiter = rate_limiter
+        self.max_concurrency = max_concurrency
+        self.clock = clock
+        self.sleep = sleep
+        self.stats = {"polls": 0, "requests": 0, "items": 0, "errors": 0}
+        self._queue: list[PollTarget] = []
+        self._demand: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def add(
+        self,
+        fn: Callable[..., Any],
+        user_id: str,
+        rate_limit_key: str | None = None,
+        **params: Any,
+    ) -> PollTarget:
+        """Schedules an account for polling, starting now.
+
+        Args:
+            fn: Segment method taking the user id and ``since_id``, e.g.
+                ``app.users.users_id_tweets`` or ``users_id_mentions``.
+            user_id: Account to poll.
+            rate_limit_key: Rate limiter key of the endpoint ``fn`` calls;
+                defaults to the one in :data:`RATE_LIMIT_KEYS`, or else the
+                method name.
+            **params: Other keyword arguments for ``fn``, e.g. ``max_results``.
+        """
+        name = getattr(fn, "__name__", repr(fn))
+        key = rate_limit_key or RATE_LIMIT_KEYS.get(name, name)
+        target = PollTarget(
+            self.clock(), fn, str(user_id), key, self.min_interval, params=params
+        )
+        with self._lock:
+            if self.rate_limiter is None:
+                app = getattr(getattr(fn, "__self__", None), "main_app_client", None)
+                self.rate_limiter = getattr(app, "rate_limiter", None)
+            self._demand[key] = (
+                self._demand.get(key, 0.0) + RATE_LIMIT_WINDOW / target.interval
+            )
+            heapq.heappush(self._queue, target)
+        return target
+
+    def stretch(self, key: str) -> float:
+        """Returns the factor stretching the intervals of ``key`` to fit its window.
+
+        Intervals are not stretched until the rate limiter has learned the limit.
+        """
+        window = (
+            self.rate_limiter.window(key) if self.rate_limiter is not None else None
+        )
+        if window is None or window.limit < 1:
+            return 1.0
+        return max(1.0, self._demand.get(key, 0.0) / window.limit)
+
+    def next_due(self) -> float | None:
+        """Returns the time of the next poll, or ``None`` if nothing is scheduled."""
+        with self._lock:
+            return self._queue[0].next_poll if self._queue else None
+
+    def _reset_time(self, key: str, started: int, now: float) -> float | None:
+        # Returns when the window of ``key`` resets if the requests left in it are
+        # taken by the ``started`` polls already, or ``None`` if one more fits.
+        window = (
+            self.rate_limiter.window(key) if self.rate_limiter is not None else None
+        )
+        if window is None or window.reset is None or window.remaining > started:
+            return None
+        reset = window.reset + self.rate_limiter.safety_margin
+        return reset if reset > now else None
+
+    def _take_due(self) -> list[PollTarget]:
+        now = self.clock()
+        due, deferred = [], []
+        started: dict[str, int] = {}
+        with self._lock:
+            while self._queue and self._queue[0].next_poll <= now:
+                target = heapq.heappop(self._queue)
+                reset = self._reset_time(
+                    target.rate_limit_key, started.get(target.rate_limit_key, 0), now
+                )
+                if reset is None:
+                    started[target.rate_limit_key] = (
+                        started.get(target.rate_limit_key, 0) + 1
+                    )
+                    due.append(target)
+                else:
+                    target.next_poll = reset
+                    deferred.append(target)
+            for target in deferred:
+                heapq.heappush(self._queue, target)
+        return due
+
+    def _reschedule(
+        self, target: PollTarget, items: int, pages: int, failed: bool
+    ) -> None:
+        now = self.clock()
+        if not failed and target.last_poll is not None:
+            observed = items / max(now - target.last_poll, 1e-9)
+            target.rate = self.smoothing * observed + (1 - self.smoothing) * target.rate
+        if not failed:
+            target.last_poll = now
+        expected = (
+            self.target_items / target.rate if target.rate > 0 else self.max_interval
+        )
+        interval = min(
+            max(expected, self.min_interval),
+            target.interval * self.backoff,
+            self.max_interval,
+        )
+        with self._lock:
+            demand = self._demand.get(target.rate_limit_key, 0.0)
+            self._demand[target.rate_limit_key] = (
+                demand
+                - RATE_LIMIT_WINDOW / target.interval
+                + RATE_LIMIT_WINDOW / interval
+            )
+            target.interval = interval
+            target.next_poll = now + interval * self.stretch(target.rate_limit_key)
+            heapq.heappush(self._queue, target)
+            self.stats["polls"] += 1
+            self.stats["requests"] += pages
+            self.stats["items"] += items
+            self.stats["errors"] += failed
+
+    def _poll(self, target: PollTarget) -> PollResult:
+        items: list[dict[str, Any]] = []
+        pages = 0
+        try:
+            for page in iter_new_pages(
+                target.fn, target.user_id, checkpoints=self.checkpoints, **target.params
+            ):
+                pages += 1
+                items.extend(page.get("data") or ())
+        except Exception as error:
+            self._reschedule(target, len(items), pages, True)
+            return PollResult(target, items, pages, error)
+        self._reschedule(target, len(items), pages, False)
+        return PollResult(target, items, pages)
+
+    def poll_due(self) -> list[PollResult]:
+        """Polls every account that is due, concurrently, and reschedules them.
+
+        Failed polls are rescheduled as well and returned with their ``error``.
+        """
+        due = self._take_due()
+        if not due:
+            return []
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_concurrency, len(due))
+        ) as executor:
+            return list(executor.map(self._poll, due))
+
+    def run(
+        self,
+        handler: Callable[[PollResult], Any],
+        stop: Callable[[], bool] = lambda: False,
+    ) -> None:
+        """Polls until ``stop()`` returns true, passing every result to ``handler``."""
+        while not stop():
+            for result in self.poll_due():
+                handler(result)
+            due = self.next_due()
+            if due is None:
+                return
+            if (delay := due - self.clock()) > 0:
+                self.sleep(delay)
+
+
+class AsyncPollScheduler(PollScheduler):
+    """Async counterpart of :class:`PollScheduler` for coroutine segment methods."""
+
+    async def _apoll(
+        self, target: PollTarget, semaphore: asyncio.Semaphore
+    ) -> PollResult:
+        items: list[dict[str, Any]] = []
+        pages = 0
+        async with semaphore:
+            try:
+                async for page in aiter_new_pages(
+                    target.fn,
+                    target.user_id,
+                    checkpoints=self.checkpoints,
+                    **target.params,
+                ):
+                    pages += 1
+                    items.extend(page.get("data") or ())
+            except Exception as error:
+                self._reschedule(target, len(items), pages, True)
+                return PollResult(target, items, pages, error)
+        self._reschedule(target, len(items), pages, False)
+        return PollResult(target, items, pages)
+
+    async def poll_due(self) -> list[PollResult]:
+        """Polls every account that is due, concurrently, and reschedules them."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        return list(
+            await asyncio.gather(
+                *(self._apoll(target, semaphore) for target in self._take_due())
+            )
+        )
+
+    async def run(
+        self,
+        handler: Callable[[PollResult], Awaitable[Any] | Any],
+        stop: Callable[[], bool] = lambda: False,
+    ) -> None:
+        """Polls until ``stop()`` returns true, passing every result to ``handler``."""
+        while not stop():
+            for result in await self.poll_due():
+                if asyncio.iscoroutine(outcome := handler(result)):
+                    await outcome
+            due = self.next_due()
+            if due is None:
+                return
+            if (delay := due - self.clock()) > 0:
+                await asyncio.sleep(delay)
@@ -0,0 +1,187 @@
+import re
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from functools import partial
+from typing import Any
+
+from .batching import DEFAULT_MAX_CONCURRENCY
+from .pagination import (
+    DEFAULT_BUFFER_PAGES,
+    aconcurrent_pages,
+    aiter_pages,
+    concurrent_pages,
+    iter_pages,
+)
+
+# Maximum query length of the recent search endpoint (and of filtered stream
+# rules) on the Basic and Pro access levels.
+MAX_QUERY_LENGTH = 512
+
+# Maximum query length of the full-archive search endpoint.
+MAX_ARCHIVE_QUERY_LENGTH = 1024
+
+MAX_RULE_LENGTH = 512
+
+_SEPARATOR = " OR "
+
+_PHRASE = re.compile(r'"(?:\\.|[^"\\])*"')
+_GROUP = re.compile(r"\([^()]*\)")
+
+# A word that is an operator (``from:jack``, ``-is:retweet``, ``#python``,
+# ``@jack``, ``$TWTR``) or the ``OR`` keyword rather than part of a phrase.
+_OPERATOR = re.compile(r"^(?:OR|[-#@$].*|.*:.*)$")
+
+
+def _top_level(text: str) -> str:
+    # Replaces quoted phrases and parenthesized groups by placeholders, leaving
+    # only what is outside of all of them.
+    text = _PHRASE.sub("\0", text)
+    count = 1
+    while count:
+        text, count = _GROUP.subn("\0", text)
+    if "(" in text or ")" in text or '"' in text:
+        raise ValueError(f"Unbalanced parentheses or quotes in {text!r}.")
+    return text
+
+
+def format_term(term: str) -> str:
+    """Returns ``term`` as a single query clause.
+
+    A bare multi-word term is quoted as an exact phrase. Single words,
+    operators such as ``from:jack`` or ``#python``, quoted phrases and
+    parenthesized groups are returned unchanged, and any other combination of
+    clauses, such as ``from:jack cats``, is parenthesized so that it is ORed as
+    a whole.
+
+    Raises:
+        ValueError: Raised if the term is empty or has unbalanced parentheses or
+            quotes.
+    """
+    term = term.strip()
+    if not term:
+        raise ValueError("Search terms must not be empty.")
+    words = _top_level(term).split()
+    if len(words) == 1:
+        return term
+    if not any("\0" in word or _OPERATOR.match(word) for word in words):
+        return '"' + term + '"'
+    return f"({term})"
+
+
+def format_filter(shared_filter: str | None) -> str | None:
+    """Returns the shared filter, parenthesized if it has a top-level ``OR``.
+
+    Clauses are joined by ``AND`` before ``OR``, so an unparenthesized
+    ``lang:en OR lang:de`` appended to a query would only constrain its last term.
+    """
+    if not shared_filter or not shared_filter.strip():
+        return None
+    shared_filter = shared_filter.strip()
+    if "OR" in _top_level(shared_filter).split():
+        return f"({shared_filter})"
+    return shared_filter
+
+
+def build_query(clauses: list[str], shared_filter: str | None = None) -> str:
+    """Joins formatted clauses with ``OR`` and appends the shared filter."""
+    query = clauses[0] if len(clauses) == 1 else f"({_SEPARATOR.join(clauses)})"
+    shared_filter = format_filter(shared_filter)
+    return f"{query} {shared_filter}" if shared_filter else query
+
+
+def pack_queries(
+    terms: Iterable[str],
+    shared_filter: str | None = None,
+    max_length: int = MAX_QUERY_LENGTH,
+) -> list[str]:
+    """Packs an OR-set of terms into the fewest queries of at most ``max_length``.
+
+    Every query has the form ``(term OR term ...) shared_filter``. Terms are
+    de-duplicated and packed first-fit by decreasing length, which uses at most
+    about 22% more queries than an optimal packing and usually the optimum.
+
+    Args:
+        terms: Keywords, phrases or operators, formatted by :func:`format_term`.
+        shared_filter: Clauses every query must carry, e.g. ``"-is:retweet lang:en"``;
+            parenthesized if it has a top-level ``OR``.
+        max_length: Length limit of one query or rule.
+
+    Returns:
+        list[str]: The packed queries.
+
+    Raises:
+        ValueError: Raised if a single term does not fit into a query with the filter.
+    """
+    clauses = sorted(
+        dict.fromkeys(format_term(term) for term in terms), key=len, reverse=True
+    )
+    shared_filter = format_filter(shared_filter)
+    # Room for the terms once the parentheses and the shared filter are taken.
+    capacity = max_length - 2 - (len(shared_filter) + 1 if shared_filter else 0)
+    bins: list[list[str]] = []
+    sizes: list[int] = []
+    for clause in clauses:
+        if len(clause) > capacity:
+            raise ValueError(
+                f"Term {clause!r} does not fit into a query of {max_length} characters."
+            )
+        for index, size in enumerate(sizes):
+            if size + len(_SEPARATOR) + len(clause) <= capacity:
+                bins[index].append(clause)
+                sizes[index] += len(_SEPARATOR) + len(clause)
+                break
+        else:
+            bins.append([clause])
+            sizes.append(len(clause))
+    return [build_query(clauses, shared_filter) for clauses in bins]
+
+
+def pack_rules(
+    terms: Iterable[str],
+    shared_filter: str | None = None,
+    tag: str | None = None,
+    max_length: int = MAX_RULE_LENGTH,
+) -> list[dict[str, str]]:
+    """Packs terms into filtered stream rules for ``add_or_delete_rules(add=...)``.
+
+    Every rule carries ``tag``, so matches of any packed rule can be attributed
+    to the same logical rule set.
+    """
+    return [
+        {"value": value, "tag": tag} if tag else {"value": value}
+        for value in pack_queries(terms, shared_filter, max_length)
+    ]
+
+
+def packed_pages(
+    search: Callable[..., dict[str, Any]],
+    queries: list[str],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    buffer_pages: int = DEFAULT_BUFFER_PAGES,
+    **params: Any,
+) -> Iterator[dict[str, Any]]:
+    """Paginates every query concurrently and yields the pages query by query.
+
+    A Tweet matching several queries is only returned by the first page that
+    contains it.
+    """
+    sources = [
+        partial(iter_pages, search, query, prefetch=False, **params)
+        for query in queries
+    ]
+    yield from concurrent_pages(sources, max_concurrency, buffer_pages)
+
+
+async def apacked_pages(
+    search: Callable[..., Awaitable[dict[str, Any]]],
+    queries: list[str],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    buffer_pages: int = DEFAULT_BUFFER_PAGES,
+    **params: Any,
+) -> AsyncIterator[dict[str, Any]]:
+    """Async counterpart of :func:`packed_pages` for coroutine search methods."""
+    sources = [
+        partial(aiter_pages, search, query, prefetch=False, **params)
+        for query in queries
+    ]
+    async for page in aconcurrent_pages(sources, max_concurrency, buffer_pages):
+        yield page
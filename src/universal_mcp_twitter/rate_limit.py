@@ -0,0 +1,176 @@
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+from http import HTTPStatus
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait before re-checking an exhausted window whose reset time is not
+# known yet because no response from the new window has arrived.
+_PENDING_WINDOW_POLL = 0.5
+
+# Fallback wait after a 429 that carries neither a reset nor a Retry-After header.
+_DEFAULT_429_WAIT = 60.0
+
+# Seconds an exhausted window may wait for its reset time to become known
+# before it is treated as open again.
+_DEFAULT_PENDING_TIMEOUT = 30.0
+
+
+@dataclass
+class RateLimitWindow:
+    """Rate limit state of one endpoint as last reported by the API."""
+
+    limit: int
+    remaining: int
+    reset: float | None
+    pending_since: float | None = None
+
+
+class RateLimiter:
+    """Schedules requests against the per-endpoint limits reported by the API.
+
+    Every response's ``x-rate-limit-limit``, ``x-rate-limit-remaining`` and
+    ``x-rate-limit-reset`` headers are recorded per endpoint key (HTTP method
+    plus endpoint template, e.g. ``GET /2/users/{id}/followers``). Each request
+    takes one token from its endpoint's window before it is sent; once the window
+    is exhausted, callers are held until the window resets instead of receiving a
+    429. Endpoints that have not been seen yet are not throttled. A 429 that slips
+    through (for example because another process shares the same token) is
+    retried after the reset, up to ``max_retries`` times.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        safety_margin: float = 1.0,
+        pending_timeout: float = _DEFAULT_PENDING_TIMEOUT,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        Args:
+            max_retries: Number of times a request answered with 429 is re-sent.
+            safety_margin: Seconds added to every reset time to absorb clock skew.
+            pending_timeout: Seconds after which an exhausted window whose reset
+                time is still unknown, because none of its requests got a
+                response, stops throttling until a response reports it again.
+            clock: Returns the current epoch time in seconds.
+            sleep: Blocks for the given number of seconds.
+        """
+        self.max_retries = max_retries
+        self.safety_margin = safety_margin
+        self.pending_timeout = pending_timeout
+        self.clock = clock
+        self.sleep = sleep
+        self.windows: dict[str, RateLimitWindow] = {}
+        self.stats = {"waits": 0, "wait_seconds": 0.0, "rate_limited": 0}
+        self._lock = threading.Lock()
+
+    def reserve(self, key: str) -> float:
+        """Takes a token for ``key`` if one is available.
+
+        Returns:
+            float: ``0`` if the request may be sent now, otherwise the number of
+            seconds to wait before calling :meth:`reserve` again.
+        """
+        with self._lock:
+            window = self.windows.get(key)
+            if window is None:
+                return 0.0
+            now = self.clock()
+            if window.reset is not None and now >= window.reset + self.safety_margin:
+                # A 429 without rate limit headers leaves no known limit; let at
+                # least one request through to learn it.
+                window.remaining = max(window.limit, 1)
+                window.reset = None
+            if window.remaining > 0:
+                window.remaining -= 1
+                return 0.0
+            if window.reset is None:
+                if window.pending_since is None:
+                    window.pending_since = now
+                elif now - window.pending_since >= self.pending_timeout:
+                    del self.windows[key]
+                    return 0.0
+                return _PENDING_WINDOW_POLL
+            return window.reset + self.safety_margin - now
+
+    def window(self, key: str) -> RateLimitWindow | None:
+        """Returns a copy of the window of ``key``, or ``None`` if none was reported."""
+        with self._lock:
+            window = self.windows.get(key)
+            return replace(window) if window is not None else None
+
+    def refund(self, key: str) -> None:
+        """Returns the token of a request that got no response, e.g. a network error."""
+        with self._lock:
+            window = self.windows.get(key)
+            if window is not None:
+                window.remaining = min(window.remaining + 1, max(window.limit, 1))
+                window.pending_since = None
+
+    def acquire(self, key: str) -> None:
+        """Blocks until a request to ``key`` may be sent."""
+        while (delay := self.reserve(key)) > 0:
+            self._record_wait(key, delay)
+            self.sleep(delay)
+
+    async def acquire_async(self, key: str) -> None:
+        """Waits, without blocking the event loop, until ``key`` may be requested."""
+        while (delay := self.reserve(key)) > 0:
+            self._record_wait(key, delay)
+            await asyncio.sleep(delay)
+
+    def update(self, key: str, response: Any) -> None:
+        """Records the rate limit headers of ``response`` for ``key``."""
+        headers = response.headers
+        limit = _int_header(headers, "x-rate-limit-limit")
+        remaining = _int_header(headers, "x-rate-limit-remaining")
+        reset = _int_header(headers, "x-rate-limit-reset")
+        if response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
+            self.stats["rate_limited"] += 1
+            remaining = 0
+            if reset is None:
+                retry_after = _int_header(headers, "retry-after")
+                reset = self.clock() + (
+                    retry_after if retry_after is not None else _DEFAULT_429_WAIT
+                )
+        if remaining is None or reset is None:
+            return
+        with self._lock:
+            window = self.windows.get(key)
+            if window is None:
+                self.windows[key] = RateLimitWindow(
+                    limit if limit is not None else remaining, remaining, reset
+                )
+                return
+            if limit is not None:
+                window.limit = limit
+            if window.reset == reset:
+                # Concurrent requests may have taken tokens the server has not
+                # counted yet, so never raise the local count within a window.
+                window.remaining = min(window.remaining, remaining)
+            else:
+                window.remaining = remaining
+                window.reset = reset
+            window.pending_since = None
+
+    def _record_wait(self, key: str, delay: float) -> None:
+        self.stats["waits"] += 1
+        self.stats["wait_seconds"] += delay
+        logger.debug("Rate limit for %s exhausted; waiting %.2fs", key, delay)
+
+
+def _int_header(headers: Any, name: str) -> int | None:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
@@ -0,0 +1,153 @@
+import logging
+import random
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterable
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RETRY_STATUSES = frozenset({500, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET"})
+
+
+class RetryPolicy:
+    """Retries transient request failures with jittered exponential backoff.
+
+    Connection errors, timeouts and the statuses in ``retry_statuses`` are
+    retried for the methods in ``retry_methods`` (only ``GET`` by default; add
+    ``POST``/``PUT``/``DELETE`` to opt in for non-idempotent calls). A
+    ``Retry-After`` header on the failed response takes precedence over the
+    computed backoff.
+
+    Retries are limited by a budget shared by every request made through the
+    policy: each request deposits ``budget_ratio`` tokens (up to
+    ``budget_capacity``) and each retry spends one, so during an outage retries
+    add at most roughly ``budget_ratio`` extra load instead of multiplying it.
+
+    Counters in ``stats`` (and ``retries_by_endpoint``) record how many retries
+    were made and how long was spent sleeping between attempts.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        backoff_base: float = 0.5,
+        max_backoff: float = 30.0,
+        retry_statuses: Iterable[int] = DEFAULT_RETRY_STATUSES,
+        retry_methods: Iterable[str] = IDEMPOTENT_METHODS,
+        budget_ratio: float = 0.2,
+        budget_capacity: float = 10.0,
+    ) -> None:
+        """
+        Args:
+            max_attempts: Total attempts per request, including the first one.
+            backoff_base: Upper bound of the first backoff in seconds; doubles with
+                every further attempt.
+            max_backoff: Upper bound of any single backoff or ``Retry-After`` wait.
+            retry_statuses: Response statuses treated as transient.
+            retry_methods: HTTP methods that may be retried.
+            budget_ratio: Retry tokens earned per request.
+            budget_capacity: Maximum retry tokens that can be saved up; the budget
+                starts full.
+        """
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.max_backoff = max_backoff
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_methods = frozenset(method.upper() for method in retry_methods)
+        self.budget_ratio = budget_ratio
+        self.budget_capacity = budget_capacity
+        self.stats = {
+            "requests": 0,
+            "retries": 0,
+            "retry_sleep_seconds": 0.0,
+            "budget_exhausted": 0,
+        }
+        self.retries_by_endpoint: Counter = Counter()
+        self._budget = budget_capacity
+        self._lock = threading.Lock()
+
+    def record_request(self) -> None:
+        """Counts a new request and deposits its share of the retry budget."""
+        with self._lock:
+            self.stats["requests"] += 1
+            self._budget = min(self.budget_capacity, self._budget + self.budget_ratio)
+
+    def should_retry(
+        self,
+        method: str,
+        attempt: int,
+        response: Any = None,
+        error: Exception | None = None,
+    ) -> bool:
+        """Returns whether a failed attempt should be retried, spending budget if so.
+
+        Args:
+            method: HTTP method of the request.
+            attempt: Zero-based number of the attempt that failed.
+            response: The response of the failed attempt, if one was received.
+            error: The exception raised by the failed attempt, if any.
+        """
+        if method.upper() not in self.retry_methods or attempt + 1 >= self.max_attempts:
+            return False
+        if response is not None:
+            transient = response.status_code in self.retry_statuses
+        else:
+            transient = isinstance(error, httpx.TransportError)
+        if not transient:
+            return False
+        with self._lock:
+            if self._budget < 1:
+                self.stats["budget_exhausted"] += 1
+                return False
+            self._budget -= 1
+        return True
+
+    def backoff(self, attempt: int, response: Any = None) -> float:
+        """Returns the seconds to wait before retrying after failed ``attempt``."""
+        retry_after = _retry_after_seconds(response) if response is not None else None
+        if retry_after is not None:
+            return min(retry_after, self.max_backoff)
+        return random.uniform(0, min(self.max_backoff, self.backoff_base * 2**attempt))
+
+    def schedule_retry(
+        self,
+        key: str,
+        attempt: int,
+        response: Any = None,
+        error: Exception | None = None,
+    ) -> float:
+        """Records a retry of failed ``attempt``; returns the seconds to wait first."""
+        delay = self.backoff(attempt, response)
+        with self._lock:
+            self.stats["retries"] += 1
+            self.stats["retry_sleep_seconds"] += delay
+            self.retries_by_endpoint[key] += 1
+        reason = response.status_code if response is not None else type(error).__name__
+        logger.info(
+            "Retrying %s after %s (attempt %d) in %.2fs",
+            key,
+            reason,
+            attempt + 1,
+            delay,
+        )
+        return delay
+
+
+def _retry_after_seconds(response: Any) -> float | None:
+    value = response.headers.get("retry-after")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
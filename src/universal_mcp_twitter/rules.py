@@ -0,0 +1,221 @@
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from .pagination import aiter_items, iter_items
+
+# Most rules a single ``add_or_delete_rules`` request may add or delete.
+MAX_RULES_PER_REQUEST = 1000
+
+_COUNT_FIELDS = (
+    "cap_per_project,project_rules_count,cap_per_client_app,client_app_rules_count"
+)
+
+
+def rule_key(rule: dict[str, Any]) -> tuple[str, str | None]:
+    """Returns the identity of a rule: its value and tag (empty counts as none)."""
+    return rule["value"].strip(), rule.get("tag") or None
+
+
+@dataclass
+class RulePlan:
+    """Changes that turn the active rule set into the desired one.
+
+    ``add`` holds rules whose value is not active yet; they can be added before
+    anything is deleted. ``retag`` holds rules whose value is active under a
+    different tag; the API rejects duplicate values, so they can only be added
+    once the old rule is gone.
+    """
+
+    add: list[dict[str, Any]] = field(default_factory=list)
+    retag: list[dict[str, Any]] = field(default_factory=list)
+    delete: list[str] = field(default_factory=list)
+    unchanged: int = 0
+
+
+@dataclass
+class RuleSyncReport:
+    """Outcome of :func:`reconcile_rules`.
+
+    ``headroom`` is the number of rules that can still be added after the sync
+    (after a dry run: that would remain), or ``None`` if the API did not report
+    the caps.
+    """
+
+    added: list[dict[str, Any]]
+    deleted: list[str]
+    unchanged: int
+    requests: int
+    headroom: int | None
+    dry_run: bool
+
+
+def diff_rules(
+    active: Iterable[dict[str, Any]], desired: Iterable[dict[str, Any]]
+) -> RulePlan:
+    """Computes the minimal set of additions and deletions by rule value and tag.
+
+    Args:
+        active: Rules as returned by ``get_rules``, with ``id``, ``value`` and ``tag``.
+        desired: Rules with ``value`` and an optional ``tag``, e.g. from
+            :func:`~universal_mcp_twitter.queries.pack_rules`. Duplicates are ignored.
+    """
+    wanted = {rule_key(rule): rule for rule in desired}
+    plan = RulePlan()
+    kept: set[tuple[str, str | None]] = set()
+    deleted_values: set[str] = set()
+    for rule in active:
+        key = rule_key(rule)
+        if key in wanted and key not in kept:
+            kept.add(key)
+            plan.unchanged += 1
+        else:
+            plan.delete.append(rule["id"])
+            deleted_values.add(key[0])
+    for key in wanted:
+        if key in kept:
+            continue
+        rule = {"value": key[0], "tag": key[1]} if key[1] else {"value": key[0]}
+        (plan.retag if key[0] in deleted_values else plan.add).append(rule)
+    return plan
+
+
+def rule_headroom(counts: dict[str, Any]) -> int | None:
+    """Returns how many rules can still be added, from a ``get_rule_count`` response."""
+    data = counts.get("data") or {}
+    limits = []
+    if "cap_per_project" in data and "project_rules_count" in data:
+        limits.append(data["cap_per_project"] - data["project_rules_count"])
+    app_count = data.get("client_app_rules_count")
+    if (
+        "cap_per_client_app" in data
+        and isinstance(app_count, dict)
+        and "rule_count" in app_count
+    ):
+        limits.append(data["cap_per_client_app"] - app_count["rule_count"])
+    return min(limits) if limits else None
+
+
+def _batches(items: list[Any], size: int) -> list[list[Any]]:
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def _check(response: dict[str, Any]) -> None:
+    errors = response.get("errors")
+    summary = (response.get("meta") or {}).get("summary") or {}
+    if errors or summary.get("invalid") or summary.get("not_created"):
+        details = "; ".join(
+            f"{error.get('value', '')!r}: {error.get('title') or error.get('detail')}"
+            for error in errors or ()
+        )
+        raise ValueError(f"Stream rules were rejected: {details or summary}")
+
+
+def _steps(
+    plan: RulePlan, headroom: int | None, batch_size: int
+) -> list[tuple[str, list[Any]]]:
+    # New values go in first, as far as the caps allow, so no match is lost
+    # while old rules are removed; whatever does not fit follows the deletes.
+    first = plan.add if headroom is None else plan.add[: max(headroom, 0)]
+    rest = plan.add[len(first) :] + plan.retag
+    return (
+        [("add", batch) for batch in _batches(first, batch_size)]
+        + [("delete", batch) for batch in _batches(plan.delete, batch_size)]
+        + [("add", batch) for batch in _batches(rest, batch_size)]
+    )
+
+
+def _body(kind: str, batch: list[Any]) -> dict[str, Any]:
+    return {"add": batch} if kind == "add" else {"delete": {"ids": batch}}
+
+
+def _report(
+    plan: RulePlan,
+    added: list[dict[str, Any]],
+    requests: int,
+    headroom: int | None,
+    dry_run: bool,
+) -> RuleSyncReport:
+    changes = len(plan.add) + len(plan.retag)
+    remaining = None if headroom is None else headroom - changes + len(plan.delete)
+    return RuleSyncReport(
+        added, list(plan.delete), plan.unchanged, requests, remaining, dry_run
+    )
+
+
+def reconcile_rules(
+    tweets: Any,
+    desired: Iterable[dict[str, Any]],
+    dry_run: bool = False,
+    batch_size: int = MAX_RULES_PER_REQUEST,
+) -> RuleSyncReport:
+    """Brings the filtered stream's rules in line with ``desired`` at least cost.
+
+    The active rules are paged through ``get_rules`` and diffed against
+    ``desired`` by value and tag, so rules that are already active stay
+    untouched. New rules are validated with a ``dry_run`` request, then added
+    before any old rule is deleted, as far as the caps reported by
+    ``get_rule_count`` allow, so the stream keeps matching throughout a rollout.
+    Changes are sent in batches of ``batch_size``.
+
+    Args:
+        tweets: A :class:`~universal_mcp_twitter.api_segments.tweets_api.TweetsApi`.
+        desired: The complete desired rule set.
+        dry_run: Only validate the changes and report what would be done.
+        batch_size: Most rules per ``add_or_delete_rules`` request.
+
+    Raises:
+        ValueError: Raised if the API rejects any of the new rules.
+    """
+    active = list(
+        iter_items(tweets.get_rules, max_results=MAX_RULES_PER_REQUEST, prefetch=False)
+    )
+    plan = diff_rules(active, desired)
+    headroom = rule_headroom(tweets.get_rule_count(rules_count_fields=_COUNT_FIELDS))
+    requests = 0
+    for batch in _batches(plan.add, batch_size):
+        _check(tweets.add_or_delete_rules(dry_run=True, add=batch))
+        requests += 1
+    if dry_run:
+        return _report(plan, [], requests, headroom, True)
+    added: list[dict[str, Any]] = []
+    for kind, batch in _steps(plan, headroom, batch_size):
+        response = tweets.add_or_delete_rules(**_body(kind, batch))
+        _check(response)
+        if kind == "add":
+            added.extend(response.get("data") or ())
+        requests += 1
+    return _report(plan, added, requests, headroom, False)
+
+
+async def areconcile_rules(
+    tweets: Any,
+    desired: Iterable[dict[str, Any]],
+    dry_run: bool = False,
+    batch_size: int = MAX_RULES_PER_REQUEST,
+) -> RuleSyncReport:
+    """Async counterpart of :func:`reconcile_rules` for an ``AsyncTweetsApi``."""
+    active = [
+        rule
+        async for rule in aiter_items(
+            tweets.get_rules, max_results=MAX_RULES_PER_REQUEST, prefetch=False
+        )
+    ]
+    plan = diff_rules(active, desired)
+    headroom = rule_headroom(
+        await tweets.get_rule_count(rules_count_fields=_COUNT_FIELDS)
+    )
+    requests = 0
+    for batch in _batches(plan.add, batch_size):
+        _check(await tweets.add_or_delete_rules(dry_run=True, add=batch))
+        requests += 1
+    if dry_run:
+        return _report(plan, [], requests, headroom, True)
+    added: list[dict[str, Any]] = []
+    for kind, batch in _steps(plan, headroom, batch_size):
+        response = await tweets.add_or_delete_rules(**_body(kind, batch))
+        _check(response)
+        if kind == "add":
+            added.extend(response.get("data") or ())
+        requests += 1
+    return _report(plan, added, requests, headroom, False)
@@ -0,0 +1,330 @@
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from datetime import UTC, datetime, timedelta
+from functools import partial
+from typing import Any
+
+from .batching import DEFAULT_MAX_CONCURRENCY
+from .pagination import (
+    DEFAULT_BUFFER_PAGES,
+    aconcurrent_pages,
+    aiter_pages,
+    concurrent_pages,
+    iter_pages,
+)
+
+# Milliseconds since the epoch at which Snowflake ids start counting.
+TWITTER_EPOCH_MS = 1288834974657
+
+# Earliest time the full-archive search accepts.
+ARCHIVE_START = datetime(2006, 3, 21, tzinfo=UTC)
+
+# Search requests must end at least this long before now.
+_END_TIME_MARGIN = timedelta(seconds=30)
+
+_TIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+Shard = tuple[datetime, datetime]
+
+
+def parse_time(value: str | datetime) -> datetime:
+    """Parses an RFC 3339 timestamp as accepted by ``start_time``/``end_time``."""
+    parsed = value if isinstance(value, datetime) else datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+
+
+def format_time(value: datetime) -> str:
+    return value.astimezone(UTC).strftime(_TIME_FORMAT)
+
+
+def snowflake_time(tweet_id: str | int) -> datetime:
+    """Returns the creation time encoded in a Tweet (or any Snowflake) id."""
+    return datetime.fromtimestamp(
+        ((int(tweet_id) >> 22) + TWITTER_EPOCH_MS) / 1000, tz=UTC
+    )
+
+
+def search_bounds(
+    start_time: Any = None,
+    end_time: Any = None,
+    since_id: Any = None,
+    until_id: Any = None,
+    earliest: datetime = ARCHIVE_START,
+) -> Shard:
+    """Returns the ``[start, end)`` range a search covers.
+
+    Explicit times win; otherwise the range is narrowed to the creation times of
+    ``since_id`` and ``until_id``, and falls back to ``earliest`` and just
+    before now.
+    """
+    if start_time is not None:
+        start = parse_time(start_time)
+    elif since_id is not None:
+        start = snowflake_time(since_id).replace(microsecond=0)
+    else:
+        start = earliest
+    if end_time is not None:
+        end = parse_time(end_time)
+    elif until_id is not None:
+        end = snowflake_time(until_id).replace(microsecond=0) + timedelta(seconds=1)
+    else:
+        end = datetime.now(UTC).replace(microsecond=0) - _END_TIME_MARGIN
+    if end <= start:
+        raise ValueError(
+            f"Search range is empty: {format_time(start)} to {format_time(end)}."
+        )
+    return start, end
+
+
+def split_at(
+    start: datetime, end: datetime, boundaries: Iterable[datetime]
+) -> list[Shard]:
+    """Splits ``[start, end)`` at ``boundaries`` into shards ordered newest first.
+
+    Boundaries are truncated to whole seconds, the resolution of the API;
+    boundaries outside the range and duplicates are ignored.
+    """
+    cuts = sorted(
+        {
+            start,
+            end,
+            *(
+                b.replace(microsecond=0)
+                for b in boundaries
+                if start < b.replace(microsecond=0) < end
+            ),
+        }
+    )
+    return [(cuts[i], cuts[i + 1]) for i in reversed(range(len(cuts) - 1))]
+
+
+def time_shards(start: datetime, end: datetime, count: int) -> list[Shard]:
+    """Splits ``[start, end)`` into ``count`` equally long shards, newest first."""
+    if count < 1:
+        raise ValueError("count must be at least 1")
+    seconds = int((end - start).total_seconds())
+    return split_at(
+        start,
+        end,
+        (start + timedelta(seconds=seconds * i // count) for i in range(1, count)),
+    )
+
+
+def count_buckets(
+    counts: Callable[..., dict[str, Any]],
+    query: str,
+    start: datetime,
+    end: datetime,
+    granularity: str,
+    **params: Any,
+) -> list[tuple[datetime, datetime, int]]:
+    """Returns the ``(start, end, tweet_count)`` buckets of a counts response."""
+    buckets = []
+    for page in iter_pages(
+        counts,
+        query,
+        start_time=format_time(start),
+        end_time=format_time(end),
+        granularity=granularity,
+        prefetch=False,
+        **params,
+    ):
+        buckets.extend(_buckets(page))
+    return sorted(buckets)
+
+
+async def acount_buckets(
+    counts: Callable[..., Awaitable[dict[str, Any]]],
+    query: str,
+    start: datetime,
+    end: datetime,
+    granularity: str,
+    **params: Any,
+) -> list[tuple[datetime, datetime, int]]:
+    """Async counterpart of :func:`count_buckets`."""
+    buckets = []
+    async for page in aiter_pages(
+        counts,
+        query,
+        start_time=format_time(start),
+        end_time=format_time(end),
+        granularity=granularity,
+        prefetch=False,
+        **params,
+    ):
+        buckets.extend(_buckets(page))
+    return sorted(buckets)
+
+
+def _buckets(page: dict[str, Any]) -> list[tuple[datetime, datetime, int]]:
+    return [
+        (parse_time(bucket["start"]), parse_time(bucket["end"]), bucket["tweet_count"])
+        for bucket in page.get("data") or ()
+    ]
+
+
+def balanced_boundaries(
+    buckets: list[tuple[datetime, datetime, int]], count: int
+) -> list[datetime]:
+    """Returns the times that split ``buckets`` into ``count`` parts of equal volume.
+
+    Tweets are assumed to be spread evenly within a bucket, so a single hot
+    bucket is cut into several shards by interpolation.
+    """
+    total = sum(tweets for _, _, tweets in buckets)
+    cuts: list[datetime] = []
+    cumulative = 0
+    for start, end, tweets in buckets:
+        while (
+            tweets
+            and len(cuts) < count - 1
+            and cumulative + tweets >= total * (len(cuts) + 1) / count
+        ):
+            fraction = (total * (len(cuts) + 1) / count - cumulative) / tweets
+            cuts.append(start + (end - start) * fraction)
+        cumulative += tweets
+    return cuts
+
+
+def _granularity(start: datetime, end: datetime) -> str:
+    return "hour" if end - start <= timedelta(days=31) else "day"
+
+
+def plan_shards(
+    counts: Callable[..., dict[str, Any]],
+    query: str,
+    start: datetime,
+    end: datetime,
+    count: int,
+    granularity: str | None = None,
+    **params: Any,
+) -> list[Shard]:
+    """Sizes ``count`` time shards so that each holds roughly as many Tweets.
+
+    The volume per time bucket is read from a counts endpoint first, e.g.
+    ``app.tweets.tweet_counts_full_archive_search``, so shards are short around
+    spikes and long in quiet periods instead of leaving most workers idle while
+    one pages through a hot hour. Falls back to :func:`time_shards` if the query
+    matches nothing.
+
+    Args:
+        counts: Counts method matching the search that will be sharded.
+        query: Search query.
+        start: Start of the range to search.
+        end: End of the range to search, exclusive.
+        count: Number of shards.
+        granularity: Bucket size of the counts, defaults to ``"hour"`` for ranges
+            up to 31 days and ``"day"`` otherwise.
+        **params: Other counts parameters such as ``since_id``.
+    """
+    buckets = count_buckets(
+        counts, query, start, end, granularity or _granularity(start, end), **params
+    )
+    boundaries = balanced_boundaries(buckets, count)
+    return (
+        split_at(start, end, boundaries)
+        if boundaries
+        else time_shards(start, end, count)
+    )
+
+
+async def aplan_shards(
+    counts: Callable[..., Awaitable[dict[str, Any]]],
+    query: str,
+    start: datetime,
+    end: datetime,
+    count: int,
+    granularity: str | None = None,
+    **params: Any,
+) -> list[Shard]:
+    """Async counterpart of :func:`plan_shards` for coroutine counts methods."""
+    buckets = await acount_buckets(
+        counts, query, start, end, granularity or _granularity(start, end), **params
+    )
+    boundaries = balanced_boundaries(buckets, count)
+    return (
+        split_at(start, end, boundaries)
+        if boundaries
+        else time_shards(start, end, count)
+    )
+
+
+def shard_params(
+    shards: list[Shard],
+    since_id: str | None,
+    until_id: str | None,
+    params: dict[str, Any],
+) -> list[dict[str, Any]]:
+    """Returns the search parameters of each shard.
+
+    ``since_id`` bounds only the oldest shard and ``until_id`` only the newest;
+    every other shard is bounded by its times alone.
+    """
+    oldest = min(range(len(shards)), key=lambda i: shards[i][0], default=None)
+    newest = max(range(len(shards)), key=lambda i: shards[i][1], default=None)
+    result = []
+    for i, (start, end) in enumerate(shards):
+        bounds = {"start_time": format_time(start), "end_time": format_time(end)}
+        if i == oldest and since_id is not None:
+            bounds["since_id"] = since_id
+        if i == newest and until_id is not None:
+            bounds["until_id"] = until_id
+        result.append({**params, **bounds})
+    return result
+
+
+def sharded_pages(
+    search: Callable[..., dict[str, Any]],
+    query: str,
+    shards: list[Shard],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    buffer_pages: int = DEFAULT_BUFFER_PAGES,
+    since_id: str | None = None,
+    until_id: str | None = None,
+    **params: Any,
+) -> Iterator[dict[str, Any]]:
+    """Paginates a search over time shards concurrently, yielding pages in shard order.
+
+    Every shard walks its own ``next_token`` chain on a worker thread, with at
+    most ``max_concurrency`` shards in flight. Pages are yielded shard by shard
+    in the order of ``shards``, which for newest-first shards and the default
+    ``recency`` sort order is the order a serial search would have returned.
+    Each shard buffers at most ``buffer_pages`` pages ahead of the consumer.
+    Tweets already yielded are dropped from later pages, so shards that meet at
+    a boundary never produce duplicates.
+
+    Args:
+        search: Search method, e.g. ``app.tweets.tweets_fullarchive_search``.
+        query: Search query.
+        shards: ``(start, end)`` ranges, see :func:`time_shards`.
+        max_concurrency: Maximum number of shards paginated at once.
+        buffer_pages: Pages each shard may fetch ahead of the consumer.
+        since_id: Only passed to the oldest shard; the API ignores
+            ``start_time`` when both are given, so every other shard would read
+            from ``since_id`` up to its own end.
+        until_id: Only passed to the newest shard, for the same reason.
+        **params: Other search parameters, passed to every request.
+    """
+    sources = [
+        partial(iter_pages, search, query, prefetch=False, **kwargs)
+        for kwargs in shard_params(shards, since_id, until_id, params)
+    ]
+    yield from concurrent_pages(sources, max_concurrency, buffer_pages)
+
+
+async def asharded_pages(
+    search: Callable[..., Awaitable[dict[str, Any]]],
+    query: str,
+    shards: list[Shard],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    buffer_pages: int = DEFAULT_BUFFER_PAGES,
+    since_id: str | None = None,
+    until_id: str | None = None,
+    **params: Any,
+) -> AsyncIterator[dict[str, Any]]:
+    """Async counterpart of :func:`sharded_pages` for coroutine search methods."""
+    sources = [
+        partial(aiter_pages, search, query, prefetch=False, **kwargs)
+        for kwargs in shard_params(shards, since_id, until_id, params)
+    ]
+    async for page in aconcurrent_pages(sources, max_concurrency, buffer_pages):
+        yield page
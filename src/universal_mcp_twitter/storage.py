@@ -0,0 +1,48 @@
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+
+class SQLiteStore:
+    """Base of the SQLite-backed stores.
+
+    Holds a single connection that is shared by every thread and serialized by a
+    lock, and creates the tables listed in ``schema`` when the store is opened.
+    """
+
+    schema: tuple[str, ...] = ()
+
+    def __init__(self, path: str = ":memory:") -> None:
+        """
+        Args:
+            path: SQLite file to keep the store in, or ``":memory:"``.
+        """
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._db:
+            for statement in self.schema:
+                self._db.execute(statement)
+
+    def _fetchall(self, sql: str, parameters: Any = ()) -> list[tuple[Any, ...]]:
+        with self._lock:
+            return self._db.execute(sql, parameters).fetchall()
+
+    def _fetchone(self, sql: str, parameters: Any = ()) -> tuple[Any, ...] | None:
+        with self._lock:
+            return self._db.execute(sql, parameters).fetchone()
+
+    def _execute(self, sql: str, parameters: Any = ()) -> None:
+        with self._transaction() as db:
+            db.execute(sql, parameters)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        # Holds the lock for several statements that are committed together.
+        with self._lock, self._db:
+            yield self._db
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,432 @@
+import json
+import logging
+import math
+import multiprocessing
+import os
+import queue
+import random
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from http import HTTPStatus
+from typing import Any
+
+import httpx
+
+from .idset import RecentIds
+
+logger = logging.getLogger(__name__)
+
+# The streaming endpoints only replay up to five minutes of missed data.
+MAX_BACKFILL_MINUTES = 5
+
+# Reconnect backoff (base, cap) in seconds per failure class, following the
+# reconnection guidance for the v2 streaming endpoints.
+NETWORK_BACKOFF = (0.25, 16.0)
+HTTP_BACKOFF = (5.0, 320.0)
+RATE_LIMIT_BACKOFF = (60.0, 960.0)
+
+# Client errors that will not be fixed by reconnecting.
+FATAL_STATUS_CODES = frozenset({400, 401, 403, 404})
+
+
+def message_id(message: dict[str, Any]) -> str | None:
+    """Returns the id of the object carried by a stream message, if it has one."""
+    data = message.get("data")
+    if isinstance(data, dict):
+        return data.get("id")
+    return None
+
+
+def backfill_minutes_for(gap_seconds: float) -> int:
+    """Returns the ``backfill_minutes`` covering a disconnect of ``gap_seconds``."""
+    return max(1, min(MAX_BACKFILL_MINUTES, math.ceil(gap_seconds / 60)))
+
+
+class StreamSupervisor:
+    """Keeps a streaming endpoint connected and gap-free across disconnects.
+
+    Wraps one of the segment ``iter_*`` stream methods (for example
+    ``app.tweets.iter_tweets_firehose_stream``). Stalls are detected with a read
+    timeout that must be longer than the server's keep-alive heartbeat interval.
+    After a disconnect the stream is reopened with exponential backoff and with
+    ``backfill_minutes`` derived from how long no data arrived, and messages
+    replayed by the backfill are dropped by id. Until the first message has
+    arrived there is nothing to backfill, so no ``backfill_minutes`` are sent.
+
+    Example:
+        firehose = app.tweets.iter_tweets_firehose_stream
+        supervisor = StreamSupervisor(firehose, partition=1)
+        for message in supervisor:
+            ...
+    """
+
+    def __init__(
+        self,
+        stream_fn: Callable[..., Iterator[dict[str, Any]]],
+        stall_timeout: float = 30.0,
+        max_reconnects: int | None = None,
+        dedup_window: int = 500_000,
+        dedup_false_positive_rate: float | None = None,
+        key: Callable[[dict[str, Any]], Any] = message_id,
+        **params: Any,
+    ) -> None:
+        """
+        Args:
+            stream_fn: Segment ``iter_*`` method that opens the stream.
+            stall_timeout: Seconds without data or heartbeats before the connection
+                is considered stalled and reopened.
+            max_reconnects: Consecutive failed reconnects tolerated before the last
+                error is raised. ``None`` retries forever.
+            dedup_window: Number of most recent message ids remembered to drop
+                replayed duplicates. ``0`` disables de-duplication.
+            dedup_false_positive_rate: Remember ids in Bloom filters with this
+                false-positive rate instead of exact id sets, at the risk of
+                dropping that share of genuinely new messages.
+            key: Returns the de-duplication key of a message, or ``None`` to always
+                pass it through.
+            **params: Query parameters forwarded to ``stream_fn``.
+        """
+        self.stream_fn = stream_fn
+        self.stall_timeout = stall_timeout
+        self.max_reconnects = max_reconnects
+        self.key = key
+        self.params = params
+        self.dedup_window = dedup_window
+        self._recent = (
+            RecentIds(dedup_window, dedup_false_positive_rate) if dedup_window else None
+        )
+        self._closed = threading.Event()
+        self.stats = {
+            "messages": 0,
+            "duplicates": 0,
+            "reconnects": 0,
+            "unrecoverable_gaps": 0,
+        }
+
+    def close(self) -> None:
+        """Stops the supervisor after the current message or backoff sleep."""
+        self._closed.set()
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        failures = 0
+        last_data_at = None
+        while not self._closed.is_set():
+            params = dict(self.params)
+            if last_data_at is not None:
+                gap = time.monotonic() - last_data_at
+                if gap > MAX_BACKFILL_MINUTES * 60:
+                    self.stats["unrecoverable_gaps"] += 1
+                    logger.warning(
+                        "Stream was disconnected for %.0fs; "
+                        "only the last %d minutes can be backfilled",
+                        gap,
+                        MAX_BACKFILL_MINUTES,
+                    )
+                params["backfill_minutes"] = backfill_minutes_for(gap)
+            try:
+                for message in self.stream_fn(**params, timeout=self.stall_timeout):
+                    last_data_at = time.monotonic()
+                    failures = 0
+                    if _is_operational_disconnect(message):
+                        logger.info(
+                            "Stream sent an operational disconnect; reconnecting"
+                        )
+                        break
+                    if self._is_duplicate(message):
+                        self.stats["duplicates"] += 1
+                        continue
+                    self.stats["messages"] += 1
+                    yield message
+                    if self._closed.is_set():
+                        return
+                backoff = NETWORK_BACKOFF
+                error = None
+            except httpx.HTTPStatusError as e:
+                status = e.response.status_code
+                if status in FATAL_STATUS_CODES:
+                    raise
+                backoff = (
+                    RATE_LIMIT_BACKOFF
+                    if status == HTTPStatus.TOO_MANY_REQUESTS
+                    else HTTP_BACKOFF
+                )
+                error = e
+            except (httpx.TransportError, json.JSONDecodeError) as e:
+                # A line cut off by a dropped connection fails to decode.
+                backoff = NETWORK_BACKOFF
+                error = e
+            failures += 1
+            if self.max_reconnects is not None and failures > self.max_reconnects:
+                if error is not None:
+                    raise error
+                return
+            base, cap = backoff
+            delay = random.uniform(0, min(cap, base * 2 ** (failures - 1)))
+            logger.info(
+                "Stream disconnected (%s); reconnecting in %.2fs",
+                error or "closed by server",
+                delay,
+            )
+            self.stats["reconnects"] += 1
+            self._closed.wait(delay)
+
+    def _is_duplicate(self, message: dict[str, Any]) -> bool:
+        if self._recent is None:
+            return False
+        key = self.key(message)
+        if key is None:
+            return False
+        return not self._recent.add(key)
+
+
+class PartitionedStreamConsumer:
+    """Consumes every partition of a partitioned stream and merges the output.
+
+    Each partition runs under its own :class:`StreamSupervisor`. In ``"process"``
+    mode the partitions are spread over up to one worker process per CPU core so
+    that JSON decoding is not bound to a single core; in ``"thread"`` mode they
+    share the calling process and a single app. Messages are merged into one
+    bounded queue in arrival order, preserving order within each partition, and
+    are yielded as ``(partition, message)`` tuples.
+
+    Every message that reaches the calling process has to be pickled by a worker
+    and unpickled again on the caller's single core. To keep the work spread over
+    the workers, pass a ``handler`` that processes (filters, projects, stores)
+    each message where it was decoded; only what it returns is sent back.
+
+    ``app_factory`` is called once per worker process (or once in thread mode) to
+    build the app, and must be picklable (e.g. a module-level function) in
+    process mode. ``method`` names the stream method on that app, for example
+    ``"tweets.iter_tweets_firehose_stream"`` or ``"likes.iter_likes_firehose_stream"``.
+
+    Example:
+        method = "tweets.iter_tweets_firehose_stream"
+        consumer = PartitionedStreamConsumer(make_app, method, partitions=range(1, 21))
+        for partition, message in consumer:
+            ...
+    """
+
+    def __init__(
+        self,
+        app_factory: Callable[[], Any],
+        method: str,
+        partitions: Iterable[int],
+        mode: str = "process",
+        workers: int | None = None,
+        queue_size: int = 10_000,
+        supervisor_options: dict[str, Any] | None = None,
+        handler: Callable[[int, dict[str, Any]], Any] | None = None,
+        **params: Any,
+    ) -> None:
+        """
+        Args:
+            app_factory: Builds the app the streams are opened on.
+            method: Dotted path of the ``iter_*`` stream method on the app.
+            partitions: Partition numbers to consume.
+            mode: ``"process"`` or ``"thread"``.
+            workers: Worker processes in process mode. Defaults to one per CPU core,
+                capped at the number of partitions.
+            queue_size: Capacity of the merged output queue; full queues apply
+                backpressure to the partition readers.
+            supervisor_options: Keyword arguments for each :class:`StreamSupervisor`.
+            handler: Called with the partition and each message in the reader
+                that received it; its result is yielded in place of the message,
+                and ``None`` results are dropped. Must be picklable in process mode.
+            **params: Query parameters forwarded to every partition's stream.
+        """
+        if mode not in ("process", "thread"):
+            raise ValueError(f"Unknown mode {mode!r}; expected 'process' or 'thread'.")
+        self.app_factory = app_factory
+        self.method = method
+        self.partitions = list(partitions)
+        self.mode = mode
+        self.workers = workers or min(len(self.partitions), os.cpu_count() or 1)
+        self.queue_size = queue_size
+        self.supervisor_options = supervisor_options or {}
+        self.handler = handler
+        self.params = params
+        self.partition_stats = {
+            p: {"messages": 0, "errors": 0} for p in self.partitions
+        }
+        self._started_at = None
+        self._queue = None
+        self._stop = None
+        self._handles: list = []
+        self._supervisors: list[StreamSupervisor] = []
+
+    def throughput(self) -> dict[int, float]:
+        """Returns messages per second received from each partition since start."""
+        if self._started_at is None:
+            return {p: 0.0 for p in self.partitions}
+        elapsed = max(time.monotonic() - self._started_at, 1e-9)
+        return {
+            p: stats["messages"] / elapsed for p, stats in self.partition_stats.items()
+        }
+
+    def start(self) -> None:
+        """Starts the partition readers. Called implicitly by iteration."""
+        if self._started_at is not None:
+            return
+        self._started_at = time.monotonic()
+        if self.mode == "thread":
+            self._queue = queue.Queue(self.queue_size)
+            self._stop = threading.Event()
+            stream_fn = _resolve_method(self.app_factory(), self.method)
+            for partition in self.partitions:
+                supervisor = StreamSupervisor(
+                    stream_fn,
+                    **self.supervisor_options,
+                    partition=partition,
+                    **self.params,
+                )
+                self._supervisors.append(supervisor)
+                handle = threading.Thread(
+                    target=_pump_partition,
+                    args=(supervisor, partition, self.handler, self._queue, self._stop),
+                    daemon=True,
+                )
+                handle.start()
+                self._handles.append(handle)
+            return
+        context = multiprocessing.get_context("spawn")
+        self._queue = context.Queue(self.queue_size)
+        self._stop = context.Event()
+        for i in range(self.workers):
+            group = self.partitions[i :: self.workers]
+            handle = context.Process(
+                target=_run_partition_group,
+                args=(
+                    self.app_factory,
+                    self.method,
+                    group,
+                    self.params,
+                    self.supervisor_options,
+                    self.handler,
+                    self._queue,
+                    self._stop,
+                ),
+                daemon=True,
+            )
+            handle.start()
+            self._handles.append(handle)
+
+    def close(self) -> None:
+        """Stops all readers and waits for them to exit.
+
+        Worker processes are terminated. Reader threads close their streams as
+        soon as they notice; a reader waiting on a quiet stream notices once the
+        read times out, after at most the supervisor's ``stall_timeout``.
+        """
+        if self._stop is not None:
+            self._stop.set()
+        for supervisor in self._supervisors:
+            supervisor.close()
+        for handle in self._handles:
+            if isinstance(handle, multiprocessing.process.BaseProcess):
+                handle.terminate()
+            handle.join()
+        self._handles = []
+        self._supervisors = []
+
+    def __iter__(self) -> Iterator[tuple[int, Any]]:
+        self.start()
+        running = len(self.partitions)
+        try:
+            while running:
+                try:
+                    kind, partition, payload = self._queue.get(timeout=1.0)
+                except queue.Empty:
+                    if not any(handle.is_alive() for handle in self._handles):
+                        raise RuntimeError(
+                            "All stream workers exited before finishing their "
+                            "partitions."
+                        ) from None
+                    continue
+                if kind == _MESSAGE:
+                    self.partition_stats[partition]["messages"] += 1
+                    yield partition, payload
+                elif kind == _ERROR:
+                    self.partition_stats[partition]["errors"] += 1
+                    logger.error("Partition %s stopped: %s", partition, payload)
+                else:
+                    running -= 1
+        finally:
+            self.close()
+
+
+_MESSAGE, _ERROR, _DONE = "message", "error", "done"
+
+
+def _resolve_method(app: Any, method: str) -> Callable[..., Iterator[dict[str, Any]]]:
+    target = app
+    for attr in method.split("."):
+        target = getattr(target, attr)
+    return target
+
+
+def _put(out, item, stop) -> bool:
+    # Waits for room in the queue without missing a stop request.
+    while not stop.is_set():
+        try:
+            out.put(item, timeout=0.5)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _pump_partition(supervisor, partition, handler, out, stop) -> None:
+    messages = iter(supervisor)
+    try:
+        for message in messages:
+            result = message if handler is None else handler(partition, message)
+            if result is not None and not _put(
+                out, (_MESSAGE, partition, result), stop
+            ):
+                break
+            if stop.is_set():
+                break
+    except Exception as e:
+        _put(out, (_ERROR, partition, repr(e)), stop)
+    finally:
+        # Closes the open stream (and its connection) when stopping early.
+        supervisor.close()
+        messages.close()
+        _put(out, (_DONE, partition, None), stop)
+
+
+def _run_partition_group(
+    app_factory, method, partitions, params, supervisor_options, handler, out, stop
+) -> None:
+    stream_fn = _resolve_method(app_factory(), method)
+    threads = [
+        threading.Thread(
+            target=_pump_partition,
+            args=(
+                StreamSupervisor(
+                    stream_fn, **supervisor_options, partition=p, **params
+                ),
+                p,
+                handler,
+                out,
+                stop,
+            ),
+            daemon=True,
+        )
+        for p in partitions
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def _is_operational_disconnect(message: dict[str, Any]) -> bool:
+    if "data" in message:
+        return False
+    return any(
+        error.get("title") == "operational-disconnect"
+        for error in message.get("errors", ())
+        if isinstance(error, dict)
+    )
@@ -0,0 +1,85 @@
+import importlib.util
+import ssl
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+
+@dataclass
+class ConnectionPoolConfig:
+    """Sizing, keep-alive and timeout settings of the app's HTTP connection pool.
+
+    One pool is created per app and shared by all of its segments, so repeated
+    calls to ``api.twitter.com`` reuse established TLS connections instead of
+    paying a handshake per request. The TLS context is built once per config and
+    shared by the sync and async clients, so CA certificates are loaded only
+    once. ``http2`` multiplexes concurrent requests over a single connection and
+    requires the optional ``h2`` package (``pip install universal-mcp-twitter[http2]``).
+    """
+
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 120.0
+    connect_timeout: float = 10.0
+    read_timeout: float = 60.0
+    write_timeout: float = 60.0
+    pool_timeout: float = 30.0
+    http2: bool = False
+    verify: bool | str = True
+    _ssl_context: ssl.SSLContext | None = field(default=None, init=False, repr=False)
+
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def timeout(self) -> httpx.Timeout:
+        return httpx.Timeout(
+            connect=self.connect_timeout,
+            read=self.read_timeout,
+            write=self.write_timeout,
+            pool=self.pool_timeout,
+        )
+
+    def ssl_context(self) -> ssl.SSLContext | bool:
+        """Returns the TLS context shared by every client built from this config."""
+        if self.verify is False:
+            return False
+        if self._ssl_context is None:
+            if isinstance(self.verify, str):
+                self._ssl_context = ssl.create_default_context(cafile=self.verify)
+            else:
+                self._ssl_context = httpx.create_ssl_context()
+        return self._ssl_context
+
+    def client_kwargs(self) -> dict[str, Any]:
+        if self.http2 and importlib.util.find_spec("h2") is None:
+            raise ImportError(
+                "HTTP/2 support requires the 'h2' package. Install it with: "
+                "pip install universal-mcp-twitter[http2]"
+            )
+        return {
+            "limits": self.limits(),
+            "timeout": self.timeout(),
+            "http2": self.http2,
+            "verify": self.ssl_context(),
+        }
+
+
+def build_client(
+    config: ConnectionPoolConfig, base_url: str, headers: dict[str, str]
+) -> httpx.Client:
+    """Creates the pooled sync HTTP client described by ``config``."""
+    return httpx.Client(base_url=base_url, headers=headers, **config.client_kwargs())
+
+
+def build_async_client(
+    config: ConnectionPoolConfig, base_url: str, headers: dict[str, str]
+) -> httpx.AsyncClient:
+    """Creates the pooled async HTTP client described by ``config``."""
+    return httpx.AsyncClient(
+        base_url=base_url, headers=headers, **config.client_kwargs()
+    )
@@ -0,0 +1,172 @@
+import asyncio
+from collections.abc import Iterable
+from typing import Any
+
+from .batching import normalize_username
+from .storage import SQLiteStore
+
+
+def is_user_id(value: Any) -> bool:
+    """Returns whether ``value`` is a numeric user id rather than a username."""
+    return isinstance(value, int) or (isinstance(value, str) and value.isdigit())
+
+
+class UserIndex(SQLiteStore):
+    """Bidirectional username <-> user id index.
+
+    The index is filled opportunistically from every response that contains user
+    objects, including ``includes.users`` from expansions, so that methods taking
+    a user id can be called with a handle without an extra lookup. With a
+    ``path`` the index is also persisted to a SQLite file and reloaded on start;
+    otherwise it lives in memory and keeps at most ``max_entries`` users.
+    """
+
+    schema = (
+        "CREATE TABLE IF NOT EXISTS user_index "
+        "(id TEXT PRIMARY KEY, username TEXT NOT NULL)",
+    )
+
+    def __init__(
+        self, path: str | None = None, max_entries: int | None = 100_000
+    ) -> None:
+        """
+        Args:
+            path: SQLite file to persist the index to.
+            max_entries: Users kept in memory before the oldest are forgotten.
+                Ignored when persisting, since evicted users would reload anyway.
+        """
+        super().__init__(path or ":memory:")
+        self.persistent = bool(path)
+        self.max_entries = None if self.persistent else max_entries
+        self._ids: dict[str, str] = {}
+        self._usernames: dict[str, str] = {}
+        for user_id, username in self._fetchall("SELECT id, username FROM user_index"):
+            self._ids[username] = user_id
+            self._usernames[user_id] = username
+
+    def __len__(self) -> int:
+        return len(self._usernames)
+
+    def id_for(self, username: str) -> str | None:
+        return self._ids.get(normalize_username(username))
+
+    def username_for(self, user_id: str | int) -> str | None:
+        return self._usernames.get(str(user_id))
+
+    def add(self, user_id: str | int, username: str) -> None:
+        self.add_many([(str(user_id), username)])
+
+    def add_many(self, users: Iterable[tuple[str, str]]) -> None:
+        """Records ``(id, username)`` pairs, replacing renamed users' old handles."""
+        changed = []
+        with self._transaction() as db:
+            for user_id, name in users:
+                username = normalize_username(name)
+                previous = self._usernames.get(user_id)
+                if previous == username:
+                    continue
+                if previous is not None:
+                    self._ids.pop(previous, None)
+                self._ids[username] = user_id
+                self._usernames[user_id] = username
+                changed.append((user_id, username))
+            if self.max_entries is not None:
+                while len(self._usernames) > self.max_entries:
+                    oldest = next(iter(self._usernames))
+                    self._ids.pop(self._usernames.pop(oldest), None)
+            if changed and self.persistent:
+                db.executemany(
+                    "INSERT OR REPLACE INTO user_index (id, username) VALUES (?, ?)",
+                    changed,
+                )
+
+    def observe(self, payload: Any) -> None:
+        """Records every user object in a response's ``data`` and ``includes.users``."""
+        if not isinstance(payload, dict):
+            return
+        users = []
+        data = payload.get("data")
+        for obj in data if isinstance(data, list) else (data,):
+            if isinstance(obj, dict) and "username" in obj and "id" in obj:
+                users.append((obj["id"], obj["username"]))
+        for obj in (payload.get("includes") or {}).get("users", ()):
+            if "username" in obj and "id" in obj:
+                users.append((obj["id"], obj["username"]))
+        if users:
+            self.add_many(users)
+
+    def observes(self, response: Any) -> bool:
+        """Returns whether an HTTP response may contain users, without decoding it."""
+        return b'"username"' in response.content
+
+    def resolve(self, users_api: Any, usernames: Iterable[str]) -> dict[str, str]:
+        """Maps usernames to ids, looking up all unknown ones in batched requests.
+
+        Args:
+            users_api: The app's ``UsersApi`` used to look up unknown usernames.
+            usernames: Usernames to resolve, with or without a leading ``@``.
+
+        Returns:
+            dict[str, str]: Lower-cased username to user id for every username that
+            exists; unknown or suspended usernames are omitted.
+        """
+        wanted = {normalize_username(username) for username in usernames}
+        missing = [username for username in wanted if username not in self._ids]
+        if missing:
+            found = users_api.find_users_by_username_bulk(missing)
+            self.observe({"data": list(found["data"].values())})
+        return self._known(wanted)
+
+    async def aresolve(
+        self, users_api: Any, usernames: Iterable[str]
+    ) -> dict[str, str]:
+        """Async counterpart of :meth:`resolve` for an ``AsyncUsersApi``."""
+        wanted = {normalize_username(username) for username in usernames}
+        missing = [username for username in wanted if username not in self._ids]
+        if missing:
+            found = await users_api.find_users_by_username_bulk(missing)
+            await asyncio.to_thread(
+                self.observe, {"data": list(found["data"].values())}
+            )
+        return self._known(wanted)
+
+    def resolve_ids(self, users_api: Any, values: Iterable[str | int]) -> list[str]:
+        """Returns ``values`` with every username replaced by its user id.
+
+        Args:
+            users_api: The app's ``UsersApi`` used to look up unknown usernames.
+            values: User ids and usernames, with or without a leading ``@``.
+
+        Raises:
+            ValueError: Raised if a username does not exist.
+        """
+        values = [str(value) for value in values]
+        usernames = [value for value in values if not is_user_id(value)]
+        return _replace_usernames(values, self.resolve(users_api, usernames))
+
+    async def aresolve_ids(
+        self, users_api: Any, values: Iterable[str | int]
+    ) -> list[str]:
+        """Async counterpart of :meth:`resolve_ids` for an ``AsyncUsersApi``."""
+        values = [str(value) for value in values]
+        usernames = [value for value in values if not is_user_id(value)]
+        return _replace_usernames(values, await self.aresolve(users_api, usernames))
+
+    def _known(self, usernames: Iterable[str]) -> dict[str, str]:
+        return {
+            username: self._ids[username]
+            for username in usernames
+            if username in self._ids
+        }
+
+
+def _replace_usernames(values: list[str], ids: dict[str, str]) -> list[str]:
+    resolved = []
+    for value in values:
+        if is_user_id(value):
+            resolved.append(value)
+        elif (user_id := ids.get(normalize_username(value))) is not None:
+            resolved.append(user_id)
+        else:
+            raise ValueError(f"Unknown username: '{value}'")
+    return resolved
@@ -0,0 +1,260 @@
+import asyncio
+import importlib.util
+from contextlib import contextmanager
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from universal_mcp_twitter.api_segments.api_segment_base import APISegmentBase
+from universal_mcp_twitter.api_segments.dm_conversations_api import DmConversationsApi
+from universal_mcp_twitter.api_segments.spaces_api import SpacesApi
+from universal_mcp_twitter.api_segments.tweets_api import TweetsApi
+from universal_mcp_twitter.api_segments.users_api import UsersApi
+from universal_mcp_twitter.async_api_segments.tweets_api import AsyncTweetsApi
+from universal_mcp_twitter.expansions import ExpandedResponse
+from universal_mcp_twitter.hydration import HydrationStore
+from universal_mcp_twitter.retry import RetryPolicy
+from universal_mcp_twitter.user_index import UserIndex
+
+
+def make_app(**attributes):
+    defaults = {
+        "rate_limiter": None,
+        "retry_policy": None,
+        "response_cache": None,
+        "user_index": None,
+        "hydration_store": None,
+    }
+    return MagicMock(base_url="https://api.twitter.com", **{**defaults, **attributes})
+
+
+def make_streaming_client(lines):
+    response = MagicMock()
+    response.iter_lines.return_value = iter(lines)
+
+    @contextmanager
+    def stream(method, url, params=None, **kwargs):
+        yield response
+
+    client = MagicMock()
+    client.stream.side_effect = stream
+    return client, response
+
+
+def test_iter_stream_yields_messages_and_skips_heartbeats():
+    app = make_app()
+    app.client, response = make_streaming_client(
+        ['{"data": {"id": "1"}}', "", "\r", '{"data": {"id": "2"}}']
+    )
+    tweets = TweetsApi(app)
+
+    messages = tweets.iter_tweets_firehose_stream(partition=1, backfill_minutes=2)
+
+    assert [m["data"]["id"] for m in messages] == ["1", "2"]
+    response.raise_for_status.assert_called_once()
+    _, kwargs = app.client.stream.call_args
+    assert kwargs["params"] == {"backfill_minutes": 2, "partition": 1}
+    assert "timeout" not in kwargs
+
+
+def test_find_tweets_by_id_batches_large_id_lists():
+    app = make_app()
+
+    def get(url, params=None, **kwargs):
+        ids = params["ids"].split(",")
+        response = MagicMock()
+        response.json.return_value = {
+            "data": [{"id": i, "author_id": "9"} for i in ids],
+            "includes": {"users": [{"id": "9"}]},
+        }
+        return response
+
+    app._get.side_effect = get
+    tweets = TweetsApi(app)
+
+    result = tweets.find_tweets_by_id([str(i) for i in range(250)])
+
+    batch_sizes = [
+        len(c.kwargs["params"]["ids"].split(",")) for c in app._get.call_args_list
+    ]
+    assert sorted(batch_sizes) == [50, 100, 100]
+    assert [t["id"] for t in result["data"]] == [str(i) for i in range(250)]
+    assert result["includes"]["users"] == [{"id": "9"}]
+    assert isinstance(result, ExpandedResponse)
+
+
+def test_id_lookups_require_ids():
+    app = make_app()
+
+    for lookup in (TweetsApi(app).find_tweets_by_id, UsersApi(app).find_users_by_id):
+        for ids in (None, [], ""):
+            with pytest.raises(ValueError, match="'ids'"):
+                lookup(ids)
+    for usernames in (None, [], ""):
+        with pytest.raises(ValueError, match="'usernames'"):
+            UsersApi(app).find_users_by_username(usernames)
+    app._get.assert_not_called()
+
+
+def test_find_users_by_username_bulk_dedupes_and_keys_results():
+    app = make_app()
+
+    def get(url, params=None, **kwargs):
+        response = MagicMock()
+        data, errors = [], []
+        for name in params["usernames"].split(","):
+            if name == "gone":
+                errors.append({"value": name, "title": "Not Found Error"})
+            else:
+                data.append({"id": str(len(name)), "username": name.capitalize()})
+        response.json.return_value = {"data": data, "errors": errors}
+        return response
+
+    app._get.side_effect = get
+    users = UsersApi(app)
+
+    result = users.find_users_by_username_bulk(
+        ["@jack", "Jack", "gone", "bob"], batch_size=2
+    )
+
+    assert app._get.call_count == 2
+    assert set(result["data"]) == {"jack", "bob"}
+    assert result["errors"]["gone"]["title"] == "Not Found Error"
+
+
+def test_transient_failures_are_retried_for_gets_only():
+    app = make_app(retry_policy=RetryPolicy(backoff_base=0))
+    failed = MagicMock(status_code=503, headers={})
+    ok = MagicMock(status_code=200, headers={})
+    ok.json.return_value = {"data": {"id": "1"}}
+    app._get.side_effect = [failed, ok]
+    app._delete.return_value = failed
+    tweets = TweetsApi(app)
+
+    assert tweets.find_tweet_by_id("1") == {"data": {"id": "1"}}
+    assert app.retry_policy.stats["retries"] == 1
+    assert app.retry_policy.retries_by_endpoint["GET /2/tweets/{id}"] == 1
+
+    tweets.delete_tweet_by_id("1")
+    assert app._delete.call_count == 1
+
+
+def test_async_segments_share_the_request_pipeline():
+    app = make_app()
+    response = MagicMock(status_code=200, headers={})
+    response.json.return_value = {"data": [{"id": "1"}]}
+    app._get = AsyncMock(return_value=response)
+    tweets = AsyncTweetsApi(app)
+
+    result = asyncio.run(tweets.find_tweets_by_id(["1"]))
+
+    assert result == {"data": [{"id": "1"}]}
+    app._get.assert_awaited_once_with(
+        "https://api.twitter.com/2/tweets", params={"ids": "1"}
+    )
+
+
+def test_user_id_parameters_accept_handles_resolved_from_observed_users():
+    app = make_app(user_index=UserIndex())
+    timeline = MagicMock(
+        status_code=200,
+        headers={},
+        content=b'{"includes": {"users": [{"id": "12", "username": "jack"}]}}',
+    )
+    timeline.json.return_value = {
+        "data": [{"id": "1", "author_id": "12"}],
+        "includes": {"users": [{"id": "12", "username": "jack"}]},
+    }
+    app._get.return_value = timeline
+    users = UsersApi(app)
+    users.users_id_tweets("2244994945", expansions=["author_id"])
+
+    users.users_id_followers("@Jack")
+
+    assert app._get.call_args.args[0] == "https://api.twitter.com/2/users/12/followers"
+    assert app._get.call_count == 2
+
+
+def test_user_id_lists_accept_handles_resolved_in_one_lookup():
+    index = UserIndex()
+    index.add("12", "jack")
+    app = make_app(user_index=index)
+    app.users.find_users_by_username_bulk.return_value = {
+        "data": {"bob": {"id": "7", "username": "Bob"}}
+    }
+
+    SpacesApi(app).find_spaces_by_creator_ids(["@Jack", "2244994945", "bob"])
+
+    app.users.find_users_by_username_bulk.assert_called_once_with(["bob"])
+    assert app._get.call_args.kwargs["params"]["user_ids"] == "12,2244994945,7"
+    assert index.id_for("bob") == "7"
+
+
+def test_user_id_lists_without_an_index_reject_unknown_usernames():
+    app = make_app()
+    app.users.find_users_by_username_bulk.return_value = {"data": {}}
+
+    with pytest.raises(ValueError, match="nobody"):
+        DmConversationsApi(app).dm_conversation_id_create(
+            "Group", participant_ids="12,@nobody"
+        )
+    app._post.assert_not_called()
+
+
+def test_user_index_and_hydration_store_share_one_decode():
+    app = make_app(user_index=UserIndex(), hydration_store=HydrationStore(":memory:"))
+    response = MagicMock(
+        status_code=200,
+        headers={},
+        content=b'{"data": [{"id": "12", "username": "jack"}]}',
+    )
+    response.json.return_value = {"data": [{"id": "12", "username": "jack"}]}
+    app._get.return_value = response
+
+    APISegmentBase(app)._get("https://api.twitter.com/2/users", params={"ids": "12"})
+
+    response.json.assert_called_once_with()
+    assert app.user_index.id_for("jack") == "12"
+    assert app.hydration_store.lookup("users", ["12"], None) == {
+        "12": {"id": "12", "username": "jack"}
+    }
+
+
+def test_hydration_store_serves_stored_tweets_and_fetches_only_missing_ids():
+    app = make_app(hydration_store=HydrationStore(":memory:"))
+    app.hydration_store.store(
+        "tweets",
+        [{"id": "1", "text": "a", "lang": "en", "author_id": "9"}],
+        ["lang", "author_id"],
+    )
+    response = MagicMock(status_code=200, headers={})
+    response.json.return_value = {"data": [{"id": "2", "text": "b", "lang": "ja"}]}
+    app._get.return_value = response
+    tweets = TweetsApi(app)
+
+    result = tweets.find_tweets_by_id(["1", "2"], tweet_fields=["lang"])
+
+    assert app._get.call_args.kwargs["params"]["ids"] == "2"
+    assert result["data"] == [
+        {"id": "1", "text": "a", "lang": "en"},
+        {"id": "2", "text": "b", "lang": "ja"},
+    ]
+    assert app.hydration_store.lookup("tweets", ["2"], ["lang"]) == {
+        "2": {"id": "2", "text": "b", "lang": "ja"}
+    }
+
+
+def test_async_segments_are_generated_from_the_sync_segments():
+    script = Path(__file__).parent.parent / "scripts" / "generate_async_segments.py"
+    spec = importlib.util.spec_from_file_location("generate_async_segments", script)
+    generator = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(generator)
+
+    for path in sorted((generator.PACKAGE / "api_segments").glob("*_api.py")):
+        generated = generator.render(path.name, path.read_text())
+        assert (
+            generator.PACKAGE / "async_api_segments" / path.name
+        ).read_text() == generated, (
+            f"Run scripts/generate_async_segments.py to update {path.name}"
+        )
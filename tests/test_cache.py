@@ -0,0 +1,61 @@
+from unittest.mock import MagicMock
+
+from universal_mcp_twitter.cache import ResponseCache
+
+BASE = "https://api.twitter.com"
+
+
+def make_response(data):
+    response = MagicMock(status_code=200)
+    response.json.return_value = {"data": data}
+    return response
+
+
+def test_caches_lookups_with_normalized_params_and_ttl():
+    now = [0.0]
+    cache = ResponseCache(clock=lambda: now[0])
+    url = f"{BASE}/2/users/12"
+    response = make_response({"id": "12"})
+
+    cache.put(
+        url, {"user.fields": ["id", "name"], "expansions": "pinned_tweet_id"}, response
+    )
+
+    assert (
+        cache.get(url, {"expansions": "pinned_tweet_id", "user.fields": "id,name"})
+        is response
+    )
+    now[0] = 301.0
+    assert (
+        cache.get(url, {"expansions": "pinned_tweet_id", "user.fields": "id,name"})
+        is None
+    )
+    assert cache.stats["hits"] == 1
+    assert cache.stats["misses"] == 1
+
+
+def test_uncached_endpoints_and_lru_eviction():
+    cache = ResponseCache(max_entries=1)
+
+    cache.put(f"{BASE}/2/users/12/followers", None, make_response([]))
+    assert len(cache) == 0
+
+    cache.put(f"{BASE}/2/users/1", None, make_response({"id": "1"}))
+    cache.put(f"{BASE}/2/users/2", None, make_response({"id": "2"}))
+    assert cache.get(f"{BASE}/2/users/1") is None
+    assert cache.stats["evictions"] == 1
+
+
+def test_writes_invalidate_lookups_by_id_and_username():
+    cache = ResponseCache()
+    cache.put(
+        f"{BASE}/2/users/by/username/jack",
+        None,
+        make_response({"id": "12", "username": "jack"}),
+    )
+    cache.put(f"{BASE}/2/lists/7", None, make_response({"id": "7"}))
+
+    cache.invalidate(f"{BASE}/2/users/12/following")
+
+    assert cache.get(f"{BASE}/2/users/by/username/jack") is None
+    assert cache.get(f"{BASE}/2/lists/7") is not None
@@ -0,0 +1,70 @@
+import pytest
+
+from universal_mcp_twitter.columnar import TWEET_COLUMNS, ColumnarAccumulator
+
+PAGES = [
+    {
+        "data": [
+            {
+                "id": "10",
+                "text": "a",
+                "author_id": "1",
+                "created_at": "2024-01-01T00:00:00.000Z",
+                "public_metrics": {"like_count": 3},
+            }
+        ]
+    },
+    {
+        "data": [{"id": "11", "text": "b", "created_at": "2024-01-01T00:00:01.500Z"}],
+        "meta": {},
+    },
+    {"meta": {"result_count": 0}},
+]
+
+
+def test_pages_are_streamed_into_typed_buffers():
+    columns = ColumnarAccumulator(TWEET_COLUMNS).extend(PAGES)
+
+    assert len(columns) == 2
+    assert columns.buffers["id"].typecode == "q"
+    assert list(columns.buffers["id"]) == [10, 11]
+    assert list(columns.buffers["created_at"]) == [1704067200000, 1704067201500]
+    assert list(columns.missing("author_id")) == [0, 1]
+    assert columns.missing("id") is None
+
+
+def test_rows_that_fail_to_parse_leave_the_columns_untouched():
+    columns = ColumnarAccumulator(TWEET_COLUMNS).extend(PAGES[:1])
+
+    with pytest.raises(ValueError):
+        columns.add({"id": "12", "text": "c", "created_at": "yesterday"})
+
+    assert len(columns) == 1
+    assert {len(buffer) for buffer in columns.buffers.values()} == {1}
+    columns.add({"id": "13"})
+    assert list(columns.buffers["id"]) == [10, 13]
+    assert list(columns.missing("text")) == [0, 1]
+
+
+def test_numpy_export():
+    np = pytest.importorskip("numpy")
+
+    result = ColumnarAccumulator(TWEET_COLUMNS).extend(PAGES).to_numpy()
+
+    assert result["like_count"].tolist() == [3, 0]
+    assert result["created_at"][1] == np.datetime64("2024-01-01T00:00:01.500")
+    assert np.isnat(
+        ColumnarAccumulator()
+        .extend([{"data": [{"id": "1"}]}])
+        .to_numpy()["created_at"][0]
+    )
+
+
+def test_arrow_export():
+    pytest.importorskip("pyarrow")
+
+    table = ColumnarAccumulator(TWEET_COLUMNS).extend(PAGES).to_arrow()
+
+    assert table.column("author_id").to_pylist() == [1, None]
+    assert table.column("text").to_pylist() == ["a", "b"]
+    assert str(table.schema.field("created_at").type) == "timestamp[ms, tz=UTC]"
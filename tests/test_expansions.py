@@ -0,0 +1,49 @@
+from universal_mcp_twitter.expansions import ExpandedResponse
+
+
+def make_response():
+    return ExpandedResponse(
+        {
+            "data": [
+                {
+                    "id": "1",
+                    "text": "hi @Bob",
+                    "author_id": "10",
+                    "referenced_tweets": [{"type": "quoted", "id": "2"}],
+                    "attachments": {"media_keys": ["3_1", "3_9"]},
+                    "entities": {"mentions": [{"username": "Bob"}]},
+                },
+            ],
+            "includes": {
+                "users": [
+                    {"id": "10", "username": "alice"},
+                    {"id": "11", "username": "bob"},
+                ],
+                "tweets": [{"id": "2", "text": "quoted", "author_id": "11"}],
+                "media": [{"media_key": "3_1", "type": "photo"}],
+            },
+        }
+    )
+
+
+def test_resolves_relations_through_includes():
+    tweet = make_response().objects()[0]
+
+    assert tweet.text == "hi @Bob"
+    assert tweet.author == {"id": "10", "username": "alice"}
+    assert tweet.quoted.author.username == "bob"
+    assert tweet.referenced_tweets == [{"id": "2", "text": "quoted", "author_id": "11"}]
+    assert tweet["referenced_tweets"] == [{"type": "quoted", "id": "2"}]
+    assert tweet.media == [{"media_key": "3_1", "type": "photo"}]
+    assert [user.id for user in tweet.mentions] == ["11"]
+    assert tweet.retweeted is None and tweet.place is None
+
+
+def test_indexes_are_built_lazily_and_response_stays_a_dict():
+    response = make_response()
+
+    assert response._indexes == {}
+    response.objects()[0].author
+    assert set(response._indexes) == {"users"}
+    assert response["includes"]["users"][0]["id"] == "10"
+    assert ExpandedResponse({}).objects() == []
@@ -0,0 +1,119 @@
+import httpx
+import pytest
+
+from universal_mcp_twitter.graph import GraphCrawler, read_edges
+
+# Who follows whom: user -> followers.
+FOLLOWERS = {1: [2, 3, 4], 2: [1, 5], 3: [5, 6], 4: [], 5: [7], 6: [], 7: [1]}
+
+
+class Users:
+    def __init__(self, fail_on=None, protected=()):
+        self.calls = []
+        self.fail_on = fail_on
+        self.protected = protected
+
+    def users_id_followers(self, id, max_results=None, pagination_token=None):
+        user_id = int(id)
+        if user_id == self.fail_on:
+            self.fail_on = None
+            raise RuntimeError("deploy")
+        if user_id in self.protected:
+            request = httpx.Request("GET", f"https://api.x.com/2/users/{id}/followers")
+            raise httpx.HTTPStatusError(
+                "Unauthorized",
+                request=request,
+                response=httpx.Response(401, request=request),
+            )
+        self.calls.append((user_id, pagination_token))
+        offset = int(pagination_token or 0)
+        followers = FOLLOWERS[user_id][offset : offset + 2]
+        meta = (
+            {"next_token": str(offset + 2)}
+            if offset + 2 < len(FOLLOWERS[user_id])
+            else {}
+        )
+        return {
+            "data": [{"id": str(f), "username": f"u{f}"} for f in followers],
+            "meta": meta,
+        }
+
+
+def test_crawl_writes_each_edge_and_expands_each_account_once(tmp_path):
+    users = Users()
+    crawler = GraphCrawler(users, str(tmp_path), chunk_size=2)
+
+    stats = crawler.crawl(["1"], depth=2)
+    crawler.close()
+
+    assert sorted(read_edges(str(tmp_path / "edges.bin"))) == sorted(
+        (f, u) for u in (1, 2, 3, 4) for f in FOLLOWERS[u]
+    )
+    assert sorted({user_id for user_id, _ in users.calls}) == [1, 2, 3, 4]
+    assert stats["edges"] == 7
+
+
+def test_interrupted_crawl_resumes(tmp_path):
+    crawler = GraphCrawler(
+        Users(fail_on=3), str(tmp_path), chunk_size=1, max_concurrency=1
+    )
+    with pytest.raises(RuntimeError):
+        crawler.crawl([1], depth=3)
+    crawler.close()
+
+    users = Users()
+    resumed = GraphCrawler(users, str(tmp_path), chunk_size=1, max_concurrency=1)
+    resumed.crawl([1], depth=3)
+    resumed.close()
+
+    # Seed 1 and user 2 were done before the failure and are not walked again.
+    assert sorted({user_id for user_id, _ in users.calls}) == [3, 4, 5, 6]
+    edges = list(read_edges(str(tmp_path / "edges.bin")))
+    assert set(edges) == {(f, u) for u in (1, 2, 3, 4, 5, 6) for f in FOLLOWERS[u]}
+    assert len(edges) == len(set(edges))
+
+    with pytest.raises(ValueError):
+        GraphCrawler(Users(), str(tmp_path)).crawl([2], depth=3)
+
+
+def test_resumed_crawl_keeps_the_page_cap(tmp_path):
+    crawler = GraphCrawler(
+        Users(fail_on=2),
+        str(tmp_path),
+        chunk_size=2,
+        max_concurrency=1,
+        max_pages_per_user=1,
+    )
+    with pytest.raises(RuntimeError):
+        crawler.crawl([1, 2], depth=1)
+    crawler.close()
+
+    users = Users()
+    resumed = GraphCrawler(
+        users, str(tmp_path), chunk_size=2, max_concurrency=1, max_pages_per_user=1
+    )
+    resumed.crawl([1, 2], depth=1)
+    resumed.close()
+
+    # The interrupted chunk is walked again from the first page of each list.
+    assert users.calls == [(1, None), (2, None)]
+    assert set(read_edges(str(tmp_path / "edges.bin"))) == {
+        (2, 1),
+        (3, 1),
+        (1, 2),
+        (5, 2),
+    }
+
+
+def test_unreadable_accounts_are_recorded_and_skipped(tmp_path):
+    users = Users(protected={3})
+    crawler = GraphCrawler(users, str(tmp_path), chunk_size=1, max_concurrency=1)
+    stats = crawler.crawl([1], depth=3)
+    crawler.close()
+
+    assert stats["failures"] == 1
+    assert [
+        (failure["user_id"], failure["status"]) for failure in crawler.failures()
+    ] == [(3, 401)]
+    # 6 is only reachable through the protected account.
+    assert {user_id for user_id, _ in users.calls} == {1, 2, 4, 5}
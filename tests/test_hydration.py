@@ -0,0 +1,44 @@
+from universal_mcp_twitter.hydration import HydrationStore
+
+
+def test_serves_only_objects_whose_stored_fields_cover_the_request():
+    store = HydrationStore(":memory:")
+    store.store(
+        "users",
+        [{"id": "1", "name": "A", "username": "a", "location": "x"}],
+        "location",
+    )
+    store.store(
+        "users",
+        [{"id": "1", "name": "A", "username": "a", "verified": False}],
+        ["verified"],
+    )
+
+    assert store.lookup("users", ["1"], ["location", "verified"])["1"] == {
+        "id": "1",
+        "name": "A",
+        "username": "a",
+        "location": "x",
+        "verified": False,
+    }
+    assert store.lookup("users", ["1", "2"], ["description"]) == {}
+    assert store.stats == {"hits": 1, "misses": 2}
+
+
+def test_expired_objects_are_fetched_again(tmp_path):
+    now = [1000.0]
+    path = str(tmp_path / "hydrated.sqlite")
+    HydrationStore(path, clock=lambda: now[0]).observe(
+        "https://api.twitter.com/2/tweets/search/recent",
+        {"tweet.fields": "lang"},
+        {
+            "data": [{"id": "1", "text": "a", "lang": "en"}],
+            "includes": {"users": [{"id": "9", "name": "B", "username": "b"}]},
+        },
+    )
+    store = HydrationStore(path, max_age=60, clock=lambda: now[0])
+
+    assert set(store.lookup("tweets", ["1"], "lang")) == {"1"}
+    assert set(store.lookup("users", ["9"])) == {"9"}
+    now[0] += 61
+    assert store.lookup("tweets", ["1"], "lang") == {}
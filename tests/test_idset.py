@@ -0,0 +1,80 @@
+from universal_mcp_twitter.idset import BloomFilter, IdSet, RecentIds, id_key
+
+
+def test_membership_across_buffer_merges():
+    ids = IdSet(["5", 3])
+    for value in range(10_000, 0, -7):
+        ids.add(value)
+
+    assert "5" in ids and 3 in ids and 9_993 in ids
+    assert 9_996 not in ids and "not-an-id" not in ids
+    assert ids.add(3) is False
+    assert len(ids) == len(set(range(10_000, 0, -7)) | {5, 3})
+    assert list(ids) == sorted(set(range(10_000, 0, -7)) | {5, 3})
+
+
+def test_update_and_round_trip(tmp_path):
+    ids = IdSet([2**63 + 1])
+    ids.update(["7", "7", 1])
+    ids.save(str(tmp_path / "ids.bin"))
+
+    loaded = IdSet.load(str(tmp_path / "ids.bin"))
+
+    assert list(loaded) == [1, 7, 2**63 + 1]
+
+
+def test_non_numeric_ids_are_hashed():
+    ids = IdSet(["1DXxyRYNejbKM", "3_1146654567674912769"])
+
+    assert "1DXxyRYNejbKM" in ids and "1DXxyRYNejbKN" not in ids
+    assert ids.add("3_1146654567674912769") is False
+
+
+def test_integers_outside_64_bits_are_hashed():
+    ids = IdSet([-1, 2**64, 2**64 - 1])
+
+    assert -1 in ids and 2**64 in ids and 2**64 - 1 in ids
+    assert all(0 <= key < 2**64 for key in ids)
+
+
+def test_numeric_strings_share_the_key_of_their_integer():
+    for value in (10**19, 2**64 - 1, 2**64, 10**20):
+        assert id_key(str(value)) == id_key(value)
+    assert id_key(str(2**64 - 1)) == 2**64 - 1
+    assert BloomFilter(10).add(-1) is True
+
+
+def test_bloom_filter_has_no_false_negatives_and_bounded_false_positives():
+    bloom = BloomFilter(10_000, false_positive_rate=0.01)
+    added = sum(
+        bloom.add(str(1_500_000_000_000_000_000 + tweet_id))
+        for tweet_id in range(10_000)
+    )
+
+    assert added > 9_900
+
+    assert all(
+        str(1_500_000_000_000_000_000 + tweet_id) in bloom for tweet_id in range(10_000)
+    )
+    false_positives = sum(str(tweet_id) in bloom for tweet_id in range(10_000))
+    assert false_positives < 300
+    # Under 2 bytes per id.
+    assert bloom.size < 10_000 * 16
+
+
+def test_recent_ids_forget_only_beyond_the_window():
+    for false_positive_rate in (None, 1e-6):
+        recent = RecentIds(3, false_positive_rate)
+
+        assert [recent.add(tweet_id) for tweet_id in "1213"] == [
+            True,
+            True,
+            False,
+            True,
+        ]
+        for tweet_id in "456":
+            recent.add(tweet_id)
+        # Ids 1 to 3 filled the older generation, which was dropped by id 7.
+        assert "3" in recent
+        recent.add("7")
+        assert "1" not in recent and "4" in recent and "7" in recent
@@ -0,0 +1,98 @@
+import asyncio
+
+import pytest
+
+from universal_mcp_twitter.incremental import (
+    CheckpointStore,
+    aiter_new_pages,
+    iter_new_pages,
+)
+
+# Tweets of one account, newest first.
+TIMELINE = [str(i) for i in range(110, 100, -1)]
+
+
+def users_id_tweets(id, since_id=None, max_results=None, pagination_token=None):
+    tweets = [t for t in TIMELINE if since_id is None or int(t) > int(since_id)]
+    offset = int(pagination_token or 0)
+    page = tweets[offset : offset + 3]
+    meta = {"result_count": len(page)}
+    if page:
+        meta["newest_id"] = page[0]
+    if offset + 3 < len(tweets):
+        meta["next_token"] = str(offset + 3)
+    return {"data": [{"id": t} for t in page], "meta": meta} if page else {"meta": meta}
+
+
+def ids(pages):
+    return [tweet["id"] for page in pages for tweet in page.get("data", ())]
+
+
+def test_first_sync_only_fetches_the_newest_page_then_syncs_incrementally():
+    checkpoints = CheckpointStore()
+
+    assert ids(iter_new_pages(users_id_tweets, "42", checkpoints=checkpoints)) == [
+        "110",
+        "109",
+        "108",
+    ]
+    assert checkpoints.get("users_id_tweets", "42") == "110"
+    assert ids(iter_new_pages(users_id_tweets, "42", checkpoints=checkpoints)) == []
+
+    TIMELINE[:0] = ["118", "117", "116", "115", "114", "113", "112", "111"]
+    try:
+        # Eight new Tweets span three pages; all of them are fetched.
+        assert ids(iter_new_pages(users_id_tweets, "42", checkpoints=checkpoints)) == [
+            str(i) for i in range(118, 110, -1)
+        ]
+        assert checkpoints.get("users_id_tweets", "42") == "118"
+    finally:
+        del TIMELINE[:8]
+
+
+def test_interrupted_sync_does_not_advance_the_checkpoint(tmp_path):
+    checkpoints = CheckpointStore(str(tmp_path / "checkpoints.db"))
+    checkpoints.advance("users_id_tweets", "42", "104")
+
+    pages = iter_new_pages(users_id_tweets, "42", checkpoints=checkpoints)
+    next(pages)
+    pages.close()
+
+    assert checkpoints.get("users_id_tweets", "42") == "104"
+    checkpoints.advance("users_id_tweets", "42", "103")
+    assert (
+        CheckpointStore(str(tmp_path / "checkpoints.db")).get("users_id_tweets", "42")
+        == "104"
+    )
+
+
+def test_async_sync_uses_the_same_checkpoints():
+    checkpoints = CheckpointStore()
+    checkpoints.advance("users_id_tweets", "42", "107")
+
+    async def search(id, since_id=None, max_results=None, pagination_token=None):
+        return users_id_tweets(id, since_id, max_results, pagination_token)
+
+    search.__name__ = "users_id_tweets"
+
+    async def collect():
+        return [
+            page
+            async for page in aiter_new_pages(search, "42", checkpoints=checkpoints)
+        ]
+
+    assert ids(asyncio.run(collect())) == ["110", "109", "108"]
+    assert checkpoints.get("users_id_tweets", "42") == "110"
+
+
+def test_key_is_required_unless_a_single_id_or_query_names_the_timeline():
+    checkpoints = CheckpointStore()
+
+    list(iter_new_pages(users_id_tweets, id="42", checkpoints=checkpoints))
+    assert checkpoints.get("users_id_tweets", "42") == "110"
+    with pytest.raises(TypeError):
+        next(iter_new_pages(users_id_tweets, "42", id="43", checkpoints=checkpoints))
+    with pytest.raises(TypeError):
+        next(iter_new_pages(users_id_tweets, checkpoints=checkpoints))
+    list(iter_new_pages(users_id_tweets, "42", checkpoints=checkpoints, key="42-again"))
+    assert checkpoints.get("users_id_tweets", "42-again") == "110"
@@ -0,0 +1,41 @@
+import pickle
+
+import pytest
+
+from universal_mcp_twitter.models import Tweet, User, to_models
+from universal_mcp_twitter.pagination import iter_items
+
+TWEET = {
+    "id": "1",
+    "text": "hello",
+    "author_id": "10",
+    "public_metrics": {"like_count": 3},
+    "entities": {"hashtags": [{"tag": "python"}]},
+    "edit_controls": {"edits_remaining": 5},
+}
+
+
+def test_slotted_fields_and_lazily_decoded_extras():
+    tweet = Tweet.from_json(TWEET)
+
+    assert not hasattr(tweet, "__dict__")
+    assert isinstance(tweet._extra, str)
+    assert (tweet.id, tweet.author_id, tweet.lang) == ("1", "10", None)
+    assert tweet.entities["hashtags"][0]["tag"] == "python"
+    assert not hasattr(tweet, "context_annotations")
+    with pytest.raises(AttributeError, match="athor_id"):
+        tweet.athor_id
+    assert Tweet.from_json({"id": "2"}).lang is None
+    assert tweet.to_dict() == TWEET
+    assert pickle.loads(pickle.dumps(tweet)) == tweet
+
+
+def test_conversion_from_responses_and_paginated_items():
+    def users_id_followers(id, pagination_token=None):
+        return {"data": [{"id": "2", "name": "B", "username": "b"}], "meta": {}}
+
+    [user] = iter_items(users_id_followers, "1", model=User)
+
+    assert (user.username, user.verified) == ("b", None)
+    assert to_models({"data": TWEET}, Tweet)[0].text == "hello"
+    assert to_models({"errors": []}, Tweet) == []
@@ -0,0 +1,104 @@
+import asyncio
+
+import pytest
+
+from universal_mcp_twitter.cursors import CursorStore
+from universal_mcp_twitter.pagination import (
+    aiter_items,
+    aiter_pages,
+    iter_items,
+    iter_pages,
+)
+
+PAGES = {
+    None: {"data": [1, 2], "meta": {"next_token": "b"}},
+    "b": {"data": [3, 4], "meta": {"next_token": "c"}},
+    "c": {"data": [5], "meta": {}},
+}
+
+
+def users_id_followers(id, max_results=None, pagination_token=None):
+    return PAGES[pagination_token]
+
+
+def search_user_by_query(query, next_token=None):
+    return PAGES[next_token]
+
+
+def test_iter_items_walks_every_page():
+    assert list(iter_items(users_id_followers, "1")) == [1, 2, 3, 4, 5]
+    assert list(iter_items(search_user_by_query, "q", prefetch=False)) == [
+        1,
+        2,
+        3,
+        4,
+        5,
+    ]
+
+
+def test_early_stop_limits_pages_and_items():
+    assert len(list(iter_pages(users_id_followers, "1", max_pages=2))) == 2
+    assert list(iter_items(users_id_followers, "1", max_items=3)) == [1, 2, 3]
+
+
+def test_resumes_from_passed_token():
+    assert list(iter_items(users_id_followers, "1", pagination_token="c")) == [5]
+
+
+def test_aiter_items():
+    async def users_id_following(id, pagination_token=None):
+        return PAGES[pagination_token]
+
+    async def collect():
+        return [
+            item async for item in aiter_items(users_id_following, "1", max_items=4)
+        ]
+
+    assert asyncio.run(collect()) == [1, 2, 3, 4]
+
+
+def test_interrupted_walk_resumes_from_checkpoint(tmp_path):
+    path = str(tmp_path / "cursors.db")
+    pages = iter_pages(
+        users_id_followers, "1", max_results=2, checkpoint=CursorStore(path)
+    )
+    assert next(pages)["data"] == [1, 2]
+    assert next(pages)["data"] == [3, 4]
+    pages.close()
+
+    # The second page was not fully processed, so the walk resumes there.
+    store = CursorStore(path)
+    assert list(
+        iter_items(users_id_followers, "1", max_results=2, checkpoint=store)
+    ) == [3, 4, 5]
+    assert store.pending() == []
+
+
+def test_checkpoint_key_rejects_other_arguments():
+    store = CursorStore()
+    pages = iter_pages(users_id_followers, "1", checkpoint=store, checkpoint_key="walk")
+    next(pages)
+    next(pages)
+
+    with pytest.raises(ValueError):
+        next(
+            iter_pages(users_id_followers, "2", checkpoint=store, checkpoint_key="walk")
+        )
+
+
+def test_aiter_pages_checkpoint():
+    store = CursorStore()
+
+    async def users_id_following(id, pagination_token=None):
+        return PAGES[pagination_token]
+
+    async def walk(limit):
+        return [
+            page["data"]
+            async for page in aiter_pages(
+                users_id_following, "1", max_pages=limit, checkpoint=store
+            )
+        ]
+
+    assert asyncio.run(walk(1)) == [[1, 2]]
+    assert asyncio.run(walk(None)) == [[3, 4], [5]]
@@ -0,0 +1,133 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from universal_mcp_twitter.incremental import CheckpointStore
+from universal_mcp_twitter.polling import AsyncPollScheduler, PollScheduler
+from universal_mcp_twitter.rate_limit import RateLimiter
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+class Timelines:
+    """Accounts posting a fixed number of Tweets per minute."""
+
+    def __init__(self, clock, rates):
+        self.clock = clock
+        self.rates = rates
+        self.calls = []
+
+    def users_id_tweets(
+        self, id, since_id=None, max_results=None, pagination_token=None
+    ):
+        self.calls.append(id)
+        # One Tweet id per minute and account, increasing with time.
+        minutes = int(self.clock() // 60)
+        newest = minutes * self.rates[id]
+        oldest = int(since_id) + 1 if since_id else newest
+        return {
+            "data": [{"id": str(i)} for i in range(newest, oldest - 1, -1)][:100],
+            "meta": {},
+        }
+
+
+def run(scheduler, clock, seconds, step=60):
+    results = []
+    for _ in range(seconds // step):
+        results.extend(scheduler.poll_due())
+        clock.now += step
+    return results
+
+
+def test_busy_accounts_are_polled_more_often_than_dormant_ones():
+    clock = Clock()
+    timelines = Timelines(clock, {"busy": 10, "dormant": 0})
+    scheduler = PollScheduler(
+        CheckpointStore(),
+        min_interval=60,
+        max_interval=3600,
+        target_items=20,
+        clock=clock,
+    )
+    scheduler.add(timelines.users_id_tweets, "busy")
+    scheduler.add(timelines.users_id_tweets, "dormant")
+
+    run(scheduler, clock, 4 * 3600)
+
+    assert timelines.calls.count("busy") > 5 * timelines.calls.count("dormant")
+    busy, dormant = sorted(scheduler._queue, key=lambda target: target.user_id)
+    assert busy.interval == pytest.approx(120) and dormant.interval == 3600
+    assert scheduler.stats["errors"] == 0
+
+
+def test_polls_wait_for_the_window_reset_once_the_budget_is_spent():
+    clock = Clock()
+    timelines = Timelines(clock, {str(i): 1 for i in range(10)})
+    limiter = RateLimiter(clock=clock)
+    limiter.update(
+        "GET /2/users/{id}/tweets",
+        MagicMock(
+            status_code=200,
+            headers={
+                "x-rate-limit-limit": "4",
+                "x-rate-limit-remaining": "4",
+                "x-rate-limit-reset": str(int(clock.now) + 900),
+            },
+        ),
+    )
+    scheduler = PollScheduler(CheckpointStore(), rate_limiter=limiter, clock=clock)
+    for user_id in timelines.rates:
+        scheduler.add(timelines.users_id_tweets, user_id)
+
+    assert len(scheduler.poll_due()) == 4
+    assert scheduler.poll_due() == []
+    assert scheduler.next_due() == clock.now + 900 + limiter.safety_margin
+    assert scheduler.stretch("GET /2/users/{id}/tweets") > 1
+
+
+def test_without_a_known_limit_intervals_are_not_stretched():
+    scheduler = PollScheduler(CheckpointStore(), rate_limiter=RateLimiter())
+    scheduler.add(lambda id, since_id=None: {}, "1")
+
+    assert scheduler.stretch("<lambda>") == 1.0
+
+
+def test_failed_polls_are_reported_and_rescheduled():
+    clock = Clock()
+    scheduler = PollScheduler(CheckpointStore(), clock=clock)
+
+    def users_id_tweets(id, since_id=None, pagination_token=None):
+        raise RuntimeError("boom")
+
+    scheduler.add(users_id_tweets, "1")
+    [result] = scheduler.poll_due()
+
+    assert isinstance(result.error, RuntimeError)
+    assert len(scheduler) == 1 and scheduler.stats["errors"] == 1
+
+
+def test_async_scheduler_polls_due_accounts():
+    clock = Clock()
+    timelines = Timelines(clock, {"a": 2, "b": 3})
+    scheduler = AsyncPollScheduler(CheckpointStore(), clock=clock)
+
+    async def users_id_tweets(
+        id, since_id=None, max_results=None, pagination_token=None
+    ):
+        return timelines.users_id_tweets(id, since_id, max_results, pagination_token)
+
+    users_id_tweets.__name__ = "users_id_tweets"
+    for user_id in timelines.rates:
+        scheduler.add(users_id_tweets, user_id)
+
+    results = asyncio.run(scheduler.poll_due())
+
+    assert sorted(result.target.user_id for result in results) == ["a", "b"]
+    assert all(len(result.items) == 1 for result in results)
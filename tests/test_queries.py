@@ -0,0 +1,102 @@
+import asyncio
+
+import pytest
+
+from universal_mcp_twitter.queries import (
+    apacked_pages,
+    format_term,
+    pack_queries,
+    pack_rules,
+    packed_pages,
+)
+
+
+def test_phrases_are_quoted_and_operators_kept():
+    assert format_term("machine learning") == '"machine learning"'
+    assert format_term('"already quoted"') == '"already quoted"'
+    assert format_term("from:jack") == "from:jack"
+    assert format_term("#python") == "#python"
+    assert format_term("(cats OR dogs)") == "(cats OR dogs)"
+    assert format_term("from:jack cats") == "(from:jack cats)"
+    with pytest.raises(ValueError):
+        format_term("(cats OR dogs")
+
+
+def test_shared_filter_with_top_level_or_is_parenthesized():
+    assert pack_queries(["cats", "dogs"], "lang:en OR lang:de") == [
+        "(cats OR dogs) (lang:en OR lang:de)"
+    ]
+    assert pack_queries(["cats"], '(lang:en OR lang:de) -"or else"') == [
+        'cats (lang:en OR lang:de) -"or else"'
+    ]
+    assert all(
+        len(query) <= 30
+        for query in pack_queries(["cats", "dogs"], "lang:en OR lang:de", max_length=30)
+    )
+
+
+def test_pack_queries_respects_the_length_limit():
+    terms = [f"term{i:03d}" for i in range(200)] + ["a much longer phrase"]
+
+    queries = pack_queries(terms, "-is:retweet lang:en", max_length=100)
+
+    assert all(len(query) <= 100 for query in queries)
+    assert all(query.endswith(") -is:retweet lang:en") for query in queries)
+    packed = [
+        clause
+        for query in queries
+        for clause in query.split(")")[0].lstrip("(").split(" OR ")
+    ]
+    assert sorted(packed) == sorted(format_term(term) for term in terms)
+    # 201 terms of 7 or more characters fit 7 to a query of 100.
+    assert len(queries) == 29
+
+
+def test_pack_queries_drops_duplicate_terms():
+    assert pack_queries(["cats", "dogs", "cats"]) == ["(cats OR dogs)"]
+    assert pack_queries(["cats"], "lang:en") == ["cats lang:en"]
+
+
+def test_term_too_long_for_one_query_raises():
+    with pytest.raises(ValueError):
+        pack_queries(["x" * 40], "lang:en", max_length=40)
+
+
+def test_pack_rules_tags_every_rule():
+    rules = pack_rules(["cats", "dogs"], tag="pets")
+
+    assert rules == [{"value": "(cats OR dogs)", "tag": "pets"}]
+
+
+def search(query, pagination_token=None, max_results=None):
+    # "cats" and "dogs" both match Tweet 2.
+    ids = {"cats": ["3", "2"], "dogs": ["2", "1"]}[query]
+    return {
+        "data": [{"id": tweet_id} for tweet_id in ids],
+        "meta": {"result_count": len(ids)},
+    }
+
+
+async def asearch(query, pagination_token=None, max_results=None):
+    return search(query, pagination_token, max_results)
+
+
+def test_packed_pages_return_each_tweet_once():
+    pages = list(packed_pages(search, ["cats", "dogs"], max_results=10))
+
+    assert [[tweet["id"] for tweet in page["data"]] for page in pages] == [
+        ["3", "2"],
+        ["1"],
+    ]
+
+
+def test_apacked_pages_return_each_tweet_once():
+    async def collect():
+        return [page async for page in apacked_pages(asearch, ["cats", "dogs"])]
+
+    pages = asyncio.run(collect())
+
+    assert [[tweet["id"] for tweet in page["data"]] for page in pages] == [
+        ["3", "2"],
+        ["1"],
+    ]
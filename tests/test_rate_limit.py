@@ -0,0 +1,98 @@
+from unittest.mock import MagicMock
+
+from universal_mcp_twitter.endpoints import endpoint_template
+from universal_mcp_twitter.rate_limit import RateLimiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def make_response(remaining, reset, status_code=200, limit=15):
+    return MagicMock(
+        status_code=status_code,
+        headers={
+            "x-rate-limit-limit": str(limit),
+            "x-rate-limit-remaining": str(remaining),
+            "x-rate-limit-reset": str(reset),
+        },
+    )
+
+
+def test_endpoint_template_replaces_ids_and_usernames():
+    assert (
+        endpoint_template("https://api.twitter.com/2/users/2244994945/followers")
+        == "/2/users/{id}/followers"
+    )
+    assert (
+        endpoint_template("https://api.twitter.com/2/users/by/username/jack")
+        == "/2/users/by/username/{username}"
+    )
+    assert (
+        endpoint_template("https://api.twitter.com/2/spaces/1DXxyRYNejbKM")
+        == "/2/spaces/{id}"
+    )
+    assert (
+        endpoint_template("https://api.twitter.com/2/spaces/search")
+        == "/2/spaces/search"
+    )
+
+
+def test_waits_for_reset_once_window_is_exhausted():
+    clock = FakeClock()
+    limiter = RateLimiter(safety_margin=1.0, clock=clock, sleep=clock.sleep)
+    key = "GET /2/users/{id}/followers"
+
+    limiter.acquire(key)
+    limiter.update(key, make_response(remaining=1, reset=1900))
+    limiter.acquire(key)
+    assert clock.now == 1000.0
+
+    limiter.acquire(key)
+    assert clock.now == 1901.0
+    assert limiter.stats["waits"] == 1
+
+
+def test_429_exhausts_window():
+    clock = FakeClock()
+    limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+    key = "GET /2/tweets/search/all"
+
+    limiter.update(key, make_response(remaining=5, reset=1060, status_code=429))
+
+    assert limiter.reserve(key) == 61.0
+    assert limiter.stats["rate_limited"] == 1
+
+
+def test_token_of_a_request_without_response_is_refunded():
+    clock = FakeClock()
+    limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+    key = "GET /2/tweets"
+    limiter.update(key, make_response(remaining=1, reset=1900, limit=1))
+
+    limiter.acquire(key)
+    limiter.refund(key)
+
+    assert limiter.reserve(key) == 0.0
+
+
+def test_headerless_429_window_reopens():
+    clock = FakeClock()
+    limiter = RateLimiter(pending_timeout=30.0, clock=clock, sleep=clock.sleep)
+    key = "GET /2/tweets/search/recent"
+    limiter.update(key, MagicMock(status_code=429, headers={}))
+
+    # The window waits out the default backoff, then lets a probe through.
+    limiter.acquire(key)
+    assert clock.now == 1061.0
+    # The probe got no response and was not refunded: the window is pending,
+    # but only until the pending timeout passes.
+    limiter.acquire(key)
+    assert clock.now < 1061.0 + 31.0
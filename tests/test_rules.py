@@ -0,0 +1,172 @@
+import asyncio
+
+import pytest
+
+from universal_mcp_twitter.rules import areconcile_rules, diff_rules, reconcile_rules
+
+
+class FakeRules:
+    """In-memory filtered stream rules that reject duplicate values like the API."""
+
+    def __init__(self, rules, cap=1000):
+        self.rules = {rule["id"]: rule for rule in rules}
+        self.cap = cap
+        self.calls = []
+        self.next_id = 100
+
+    def get_rules(self, ids=None, max_results=None, pagination_token=None):
+        rules = sorted(self.rules.values(), key=lambda rule: rule["id"])
+        offset = int(pagination_token or 0)
+        page = {
+            "data": rules[offset : offset + 2],
+            "meta": {"result_count": len(rules[offset : offset + 2])},
+        }
+        if offset + 2 < len(rules):
+            page["meta"]["next_token"] = str(offset + 2)
+        return page
+
+    def get_rule_count(self, rules_count_fields=None):
+        return {
+            "data": {
+                "cap_per_project": self.cap,
+                "project_rules_count": len(self.rules),
+            }
+        }
+
+    def add_or_delete_rules(self, dry_run=None, delete_all=None, add=None, delete=None):
+        self.calls.append(
+            (
+                "dry_run" if dry_run else "add" if add else "delete",
+                len(add or delete["ids"]),
+            )
+        )
+        if delete:
+            for rule_id in delete["ids"]:
+                del self.rules[rule_id]
+            return {"meta": {"summary": {"deleted": len(delete["ids"])}}}
+        values = {rule["value"] for rule in self.rules.values()}
+        errors = [
+            {"value": rule["value"], "title": "DuplicateRule"}
+            for rule in add
+            if rule["value"] in values
+        ]
+        if errors:
+            return {"errors": errors, "meta": {"summary": {"not_created": len(errors)}}}
+        if len(self.rules) + len(add) > self.cap and not dry_run:
+            return {
+                "errors": [{"title": "RulesCapExceeded"}],
+                "meta": {"summary": {"not_created": len(add)}},
+            }
+        created = []
+        for rule in add:
+            self.next_id += 1
+            created.append({"id": str(self.next_id), **rule})
+            if not dry_run:
+                self.rules[str(self.next_id)] = created[-1]
+        return {"data": created, "meta": {"summary": {"created": len(created)}}}
+
+
+ACTIVE = [
+    {"id": "1", "value": "cats", "tag": "pets"},
+    {"id": "2", "value": "dogs", "tag": "pets"},
+    {"id": "3", "value": "birds", "tag": "pets"},
+]
+
+
+def test_diff_keeps_active_rules_and_retags_by_value():
+    plan = diff_rules(
+        ACTIVE,
+        [
+            {"value": "cats", "tag": "pets"},
+            {"value": "dogs", "tag": "animals"},
+            {"value": "fish", "tag": "pets"},
+        ],
+    )
+
+    assert plan.unchanged == 1
+    assert plan.delete == ["2", "3"]
+    assert plan.add == [{"value": "fish", "tag": "pets"}]
+    assert plan.retag == [{"value": "dogs", "tag": "animals"}]
+
+
+def test_sync_adds_before_deleting_and_reports_headroom():
+    rules = FakeRules(ACTIVE, cap=5)
+
+    report = reconcile_rules(
+        rules,
+        [
+            {"value": "cats", "tag": "pets"},
+            {"value": "fish", "tag": "pets"},
+            {"value": "dogs", "tag": "animals"},
+        ],
+    )
+
+    assert sorted(
+        (rule["value"], rule.get("tag")) for rule in rules.rules.values()
+    ) == [("cats", "pets"), ("dogs", "animals"), ("fish", "pets")]
+    assert rules.calls == [("dry_run", 1), ("add", 1), ("delete", 2), ("add", 1)]
+    assert report.unchanged == 1 and report.deleted == ["2", "3"]
+    assert report.headroom == 2
+
+
+def test_adds_beyond_the_cap_wait_for_the_deletes():
+    rules = FakeRules(ACTIVE, cap=4)
+
+    reconcile_rules(rules, [{"value": "fish"}, {"value": "frogs"}], batch_size=1)
+
+    assert rules.calls == [
+        ("dry_run", 1),
+        ("dry_run", 1),
+        ("add", 1),
+        ("delete", 1),
+        ("delete", 1),
+        ("delete", 1),
+        ("add", 1),
+    ]
+    assert sorted(rule["value"] for rule in rules.rules.values()) == ["fish", "frogs"]
+
+
+def test_dry_run_changes_nothing():
+    rules = FakeRules(ACTIVE)
+
+    report = reconcile_rules(rules, [{"value": "fish"}], dry_run=True)
+
+    assert report.dry_run and report.added == [] and report.headroom == 999
+    assert rules.rules == {rule["id"]: rule for rule in ACTIVE}
+
+
+def test_rejected_rules_raise_before_anything_is_deleted():
+    rules = FakeRules(ACTIVE + [{"id": "4", "value": "fish", "tag": "pets"}])
+    rules.add_or_delete_rules(add=[{"value": "ducks"}])
+
+    with pytest.raises(ValueError, match="DuplicateRule"):
+        reconcile_rules(
+            rules,
+            [
+                {"value": "cats", "tag": "pets"},
+                {"value": "ducks", "tag": "pets"},
+                {"value": "ducks"},
+            ],
+        )
+
+    assert len(rules.rules) == 5
+
+
+def test_async_sync_matches_sync():
+    rules = FakeRules(ACTIVE)
+
+    class Async:
+        async def get_rules(self, max_results=None, pagination_token=None):
+            return rules.get_rules(
+                max_results=max_results, pagination_token=pagination_token
+            )
+
+        async def get_rule_count(self, **kwargs):
+            return rules.get_rule_count(**kwargs)
+
+        async def add_or_delete_rules(self, **kwargs):
+            return rules.add_or_delete_rules(**kwargs)
+
+    report = asyncio.run(areconcile_rules(Async(), [{"value": "cats", "tag": "pets"}]))
+
+    assert report.deleted == ["2", "3"] and list(rules.rules) == ["1"]
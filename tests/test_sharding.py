@@ -0,0 +1,165 @@
+import asyncio
+from datetime import UTC, datetime
+
+from universal_mcp_twitter.sharding import (
+    asharded_pages,
+    balanced_boundaries,
+    parse_time,
+    plan_shards,
+    search_bounds,
+    sharded_pages,
+    snowflake_time,
+    time_shards,
+)
+
+# One tweet per hour of 2024-01-01, ids increasing with time.
+TWEETS = [{"id": str(1000 + hour), "hour": hour} for hour in range(24)]
+
+
+def tweets_fullarchive_search(
+    query, start_time=None, end_time=None, pagination_token=None, max_results=None
+):
+    start, end = parse_time(start_time), parse_time(end_time)
+    hits = [
+        t
+        for t in reversed(TWEETS)
+        if start <= datetime(2024, 1, 1, t["hour"], tzinfo=UTC) < end
+    ]
+    if end.hour == 12:
+        # Simulate a Tweet reported by both shards that meet at noon.
+        hits.append(TWEETS[12])
+    offset = int(pagination_token or 0)
+    page = {"data": hits[offset : offset + 2], "meta": {}}
+    if offset + 2 < len(hits):
+        page["meta"]["next_token"] = str(offset + 2)
+    return page
+
+
+def test_time_shards_are_newest_first_and_cover_the_range():
+    start, end = datetime(2024, 1, 1, tzinfo=UTC), datetime(2024, 1, 2, tzinfo=UTC)
+
+    shards = time_shards(start, end, 4)
+
+    assert shards[0] == (datetime(2024, 1, 1, 18, tzinfo=UTC), end)
+    assert shards[-1][0] == start
+    assert all(newer[0] == older[1] for newer, older in zip(shards, shards[1:]))
+
+
+def test_bounds_fall_back_to_snowflake_ids():
+    assert snowflake_time(1460323737035677698) == datetime(
+        2021, 11, 15, 19, 8, 5, 69000, tzinfo=UTC
+    )
+    start, end = search_bounds(
+        since_id="1460323737035677698", end_time="2022-01-01T00:00:00Z"
+    )
+    assert (start, end) == (
+        datetime(2021, 11, 15, 19, 8, 5, tzinfo=UTC),
+        datetime(2022, 1, 1, tzinfo=UTC),
+    )
+
+
+def test_sharded_pages_merge_in_recency_order_without_duplicates():
+    shards = time_shards(
+        datetime(2024, 1, 1, tzinfo=UTC), datetime(2024, 1, 2, tzinfo=UTC), 4
+    )
+
+    pages = list(
+        sharded_pages(
+            tweets_fullarchive_search, "q", shards, max_concurrency=3, buffer_pages=1
+        )
+    )
+
+    assert [t["hour"] for page in pages for t in page["data"]] == list(
+        reversed(range(24))
+    )
+
+
+def test_asharded_pages():
+    shards = time_shards(
+        datetime(2024, 1, 1, tzinfo=UTC), datetime(2024, 1, 2, tzinfo=UTC), 3
+    )
+
+    async def search(query, start_time=None, end_time=None, pagination_token=None):
+        return tweets_fullarchive_search(query, start_time, end_time, pagination_token)
+
+    async def collect():
+        return [
+            t["hour"]
+            async for page in asharded_pages(search, "q", shards)
+            for t in page["data"]
+        ]
+
+    assert asyncio.run(collect()) == list(reversed(range(24)))
+
+
+def test_balanced_boundaries_split_hot_buckets():
+    hour = [datetime(2024, 1, 1, h, tzinfo=UTC) for h in range(5)]
+    buckets = [
+        (hour[0], hour[1], 60),
+        (hour[1], hour[2], 0),
+        (hour[2], hour[3], 240),
+        (hour[3], hour[4], 0),
+    ]
+
+    cuts = balanced_boundaries(buckets, 3)
+
+    assert cuts == [
+        datetime(2024, 1, 1, 2, 10, tzinfo=UTC),
+        datetime(2024, 1, 1, 2, 35, tzinfo=UTC),
+    ]
+    assert balanced_boundaries([(hour[0], hour[1], 0)], 3) == []
+
+
+def test_plan_shards_reads_counts_across_pages():
+    def tweet_counts_full_archive_search(
+        query, start_time=None, end_time=None, pagination_token=None, granularity=None
+    ):
+        assert granularity == "hour"
+        buckets = [
+            {
+                "start": f"2024-01-01T{h:02}:00:00.000Z",
+                "end": f"2024-01-01T{h + 1:02}:00:00.000Z",
+                "tweet_count": 100 if h == 5 else 0,
+            }
+            for h in range(12)
+        ]
+        if pagination_token is None:
+            return {"data": buckets[6:], "meta": {"next_token": "older"}}
+        return {"data": buckets[:6], "meta": {}}
+
+    start, end = datetime(2024, 1, 1, tzinfo=UTC), datetime(2024, 1, 1, 12, tzinfo=UTC)
+    shards = plan_shards(tweet_counts_full_archive_search, "q", start, end, 2)
+
+    assert shards == [
+        (datetime(2024, 1, 1, 5, 30, tzinfo=UTC), end),
+        (start, datetime(2024, 1, 1, 5, 30, tzinfo=UTC)),
+    ]
+
+
+def test_ids_only_bound_the_outermost_shards():
+    calls = []
+
+    def search(
+        query,
+        start_time=None,
+        end_time=None,
+        since_id=None,
+        until_id=None,
+        max_results=None,
+        pagination_token=None,
+    ):
+        calls.append((start_time, since_id, until_id))
+        return {"data": [], "meta": {}}
+
+    shards = time_shards(
+        datetime(2024, 1, 1, tzinfo=UTC), datetime(2024, 1, 2, tzinfo=UTC), 3
+    )
+    list(
+        sharded_pages(search, "q", shards, since_id="10", until_id="20", max_results=10)
+    )
+
+    assert sorted(calls) == [
+        ("2024-01-01T00:00:00Z", "10", None),
+        ("2024-01-01T08:00:00Z", None, None),
+        ("2024-01-01T16:00:00Z", None, "20"),
+    ]
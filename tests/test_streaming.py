@@ -0,0 +1,193 @@
+import itertools
+import json
+import time
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from universal_mcp_twitter import streaming
+from universal_mcp_twitter.streaming import PartitionedStreamConsumer, StreamSupervisor
+
+
+def finite_stream(partition, timeout=None, backfill_minutes=None):
+    for i in range(3):
+        yield {"data": {"id": f"{partition}-{i}", "text": "x" * 100}}
+
+
+# Partitions whose stream generator was closed.
+CLOSED = []
+
+
+def endless_stream(partition, timeout=None, backfill_minutes=None):
+    try:
+        for i in itertools.count():
+            time.sleep(0.001)
+            yield {"data": {"id": f"{partition}-{i}"}}
+    finally:
+        CLOSED.append(partition)
+
+
+def quiet_stream(partition, timeout=None, backfill_minutes=None):
+    # Sends nothing until the read times out.
+    time.sleep(timeout)
+    raise httpx.ReadTimeout("stalled")
+    yield
+
+
+def make_app():
+    return SimpleNamespace(
+        tweets=SimpleNamespace(
+            iter_stream=finite_stream,
+            iter_endless=endless_stream,
+            iter_quiet=quiet_stream,
+        )
+    )
+
+
+def tweet_id(partition, message):
+    # Drops the last Tweet of each partition and sends back only the id.
+    tweet = message["data"]["id"]
+    return None if tweet.endswith("-2") else tweet
+
+
+OPTIONS = {"max_reconnects": 0}
+
+
+def test_thread_mode_merges_partitions_in_order():
+    consumer = PartitionedStreamConsumer(
+        make_app,
+        "tweets.iter_stream",
+        partitions=[1, 2],
+        mode="thread",
+        supervisor_options=OPTIONS,
+    )
+    received = list(consumer)
+    assert sorted((p, message["data"]["id"]) for p, message in received) == [
+        (p, f"{p}-{i}") for p in (1, 2) for i in range(3)
+    ]
+    assert [message["data"]["id"] for p, message in received if p == 1] == [
+        "1-0",
+        "1-1",
+        "1-2",
+    ]
+    assert consumer.partition_stats == {
+        1: {"messages": 3, "errors": 0},
+        2: {"messages": 3, "errors": 0},
+    }
+
+
+def test_process_mode_runs_the_handler_in_the_workers():
+    consumer = PartitionedStreamConsumer(
+        make_app,
+        "tweets.iter_stream",
+        partitions=[1, 2, 3],
+        workers=2,
+        supervisor_options=OPTIONS,
+        handler=tweet_id,
+    )
+    assert sorted(consumer) == [(p, f"{p}-{i}") for p in (1, 2, 3) for i in range(2)]
+
+
+def test_close_stops_readers_blocked_on_a_full_queue():
+    CLOSED.clear()
+    consumer = PartitionedStreamConsumer(
+        make_app, "tweets.iter_endless", partitions=[1, 2], mode="thread", queue_size=1
+    )
+    messages = iter(consumer)
+    assert next(messages)[1]["data"]["id"].endswith("-0")
+    handles = list(consumer._handles)
+    time.sleep(0.1)
+    consumer.close()
+    assert not any(handle.is_alive() for handle in handles)
+    assert sorted(CLOSED) == [1, 2]
+
+
+def test_close_stops_readers_of_quiet_streams():
+    consumer = PartitionedStreamConsumer(
+        make_app,
+        "tweets.iter_quiet",
+        partitions=[1, 2],
+        mode="thread",
+        supervisor_options={"stall_timeout": 0.2},
+    )
+    consumer.start()
+    handles = list(consumer._handles)
+    started = time.monotonic()
+    consumer.close()
+    assert time.monotonic() - started < 2
+    assert not any(handle.is_alive() for handle in handles)
+
+
+class FlakyStream:
+    """Stream that plays one script of messages and errors per connection, then ends."""
+
+    def __init__(self, *connections):
+        self.connections = list(connections)
+        self.calls = []
+
+    def __call__(self, timeout=None, **params):
+        self.calls.append(params)
+        for item in self.connections.pop(0) if self.connections else ():
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(streaming.random, "uniform", lambda low, high: 0.0)
+
+
+def tweet(id):
+    return {"data": {"id": id}}
+
+
+def test_reconnects_with_backfill_and_drops_replayed_messages():
+    stream = FlakyStream(
+        [tweet("1"), tweet("2"), httpx.ReadTimeout("stalled")], [tweet("2"), tweet("3")]
+    )
+    supervisor = StreamSupervisor(stream, max_reconnects=1, partition=1)
+    assert [message["data"]["id"] for message in supervisor] == ["1", "2", "3"]
+    assert stream.calls[:2] == [
+        {"partition": 1},
+        {"partition": 1, "backfill_minutes": 1},
+    ]
+    assert supervisor.stats == {
+        "messages": 3,
+        "duplicates": 1,
+        "reconnects": 2,
+        "unrecoverable_gaps": 0,
+    }
+
+
+def test_no_backfill_before_the_first_message():
+    stream = FlakyStream(
+        [httpx.ConnectError("refused")],
+        [httpx.HTTPStatusError("busy", request=None, response=httpx.Response(503))],
+        [tweet("1")],
+    )
+    supervisor = StreamSupervisor(stream, max_reconnects=2)
+    assert [
+        message["data"]["id"] for message in supervisor if not supervisor.close()
+    ] == ["1"]
+    assert stream.calls == [{}, {}, {}]
+
+
+def test_truncated_line_is_a_disconnect():
+    truncated = json.JSONDecodeError("Unterminated string", '{"data": {"id": "2', 17)
+    stream = FlakyStream([tweet("1"), truncated], [tweet("2")])
+    supervisor = StreamSupervisor(stream, max_reconnects=1)
+    assert [message["data"]["id"] for message in supervisor] == ["1", "2"]
+    assert stream.calls[1] == {"backfill_minutes": 1}
+
+
+def test_operational_disconnect_reconnects_and_client_errors_raise():
+    disconnect = {"errors": [{"title": "operational-disconnect"}]}
+    forbidden = httpx.HTTPStatusError(
+        "forbidden", request=None, response=httpx.Response(403)
+    )
+    stream = FlakyStream([tweet("1"), disconnect, tweet("9")], [forbidden])
+    with pytest.raises(httpx.HTTPStatusError):
+        list(StreamSupervisor(stream))
+    assert len(stream.calls) == 2
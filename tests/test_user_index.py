@@ -0,0 +1,59 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from universal_mcp_twitter.user_index import UserIndex
+
+
+def test_observes_users_from_data_and_includes():
+    index = UserIndex()
+
+    index.observe(
+        {
+            "data": {"id": "1", "username": "Jack"},
+            "includes": {"users": [{"id": "2", "username": "bob"}]},
+        }
+    )
+    index.observe({"data": [{"id": "3", "text": "no username"}]})
+
+    assert index.id_for("@jack") == "1"
+    assert index.username_for(2) == "bob"
+    assert len(index) == 2
+
+
+def test_renames_replace_old_handles_and_persist(tmp_path):
+    path = str(tmp_path / "users.sqlite")
+    index = UserIndex(path)
+    index.add("1", "jack")
+    index.add("1", "jack2")
+    index.close()
+
+    reloaded = UserIndex(path)
+
+    assert reloaded.id_for("jack") is None
+    assert reloaded.id_for("jack2") == "1"
+
+
+def test_in_memory_index_forgets_oldest_users():
+    index = UserIndex(max_entries=2)
+    index.add_many([("1", "a"), ("2", "b"), ("3", "c")])
+
+    assert index.id_for("a") is None
+    assert index.id_for("c") == "3"
+
+
+def test_resolve_ids_looks_up_unknown_usernames_once():
+    users = AsyncMock()
+    users.find_users_by_username_bulk.return_value = {
+        "data": {"bob": {"id": "7", "username": "bob"}}
+    }
+    index = UserIndex()
+    index.add("1", "jack")
+
+    ids = asyncio.run(index.aresolve_ids(users, ["@Jack", 2244994945, "bob"]))
+
+    assert ids == ["1", "2244994945", "7"]
+    users.find_users_by_username_bulk.assert_awaited_once_with(["bob"])
+    with pytest.raises(ValueError, match="nobody"):
+        asyncio.run(index.aresolve_ids(AsyncMock(), ["nobody"]))